@@ -0,0 +1,43 @@
+"""Microbenchmark of the `Mapping` sinks resolution.
+
+Run with: python benchmarks/bench_mapping.py
+"""
+import timeit
+from wolf.app.nodes import Mapping
+
+
+def app(environ, start_response):
+    return []
+
+
+def mapping(size: int) -> Mapping:
+    return Mapping({f"/sink{i}/static/assets": app for i in range(size)})
+
+
+def bench(size: int, number: int = 100_000):
+    node = mapping(size)
+    paths = {
+        "hit": f"/sink{size - 1}/static/assets/js/main.js",
+        "miss": "/some/view/that/is/not/a/sink",
+    }
+    results = {}
+    for name, path in paths.items():
+
+        def resolve():
+            try:
+                node.resolve({"SCRIPT_NAME": "", "PATH_INFO": path})
+            except Exception:
+                pass
+
+        elapsed = min(timeit.repeat(resolve, number=number, repeat=5))
+        results[name] = elapsed / number * 1e9
+    return results
+
+
+if __name__ == "__main__":
+    for size in (10, 100, 1000):
+        results = bench(size)
+        print(
+            f"{size:>5} sinks: "
+            + ", ".join(f"{k} {v:8.1f} ns/op" for k, v in results.items())
+        )
@@ -0,0 +1,71 @@
+"""Startup cost of route pipelines: `chain_wrap` per endpoint versus
+a compiled pipeline shared by all the endpoints.
+
+Run with: python benchmarks/bench_pipeline.py
+"""
+import time
+import tracemalloc
+from functools import wraps
+from wolf.pipeline import chain_wrap, compile_pipeline, shareable
+
+
+@shareable
+def layer(wrapped):
+    @wraps(wrapped)
+    def middleware(request, *args, **kwargs):
+        return wrapped(request, *args, **kwargs)
+    return middleware
+
+
+def endpoints(count: int):
+    for i in range(count):
+        def endpoint(request):
+            return i
+        endpoint.__name__ = f"endpoint_{i}"
+        yield endpoint
+
+
+def wrap_all(strategy, count: int, layers: int):
+    pipeline = tuple(layer for _ in range(layers))
+    views = list(endpoints(count))
+    tracemalloc.start()
+    start = time.perf_counter()
+    wrapped = [strategy(pipeline, view) for view in views]
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return wrapped, elapsed, memory
+
+
+def call_cost(endpoint, number: int = 100_000):
+    start = time.perf_counter()
+    for _ in range(number):
+        endpoint(None)
+    return (time.perf_counter() - start) / number * 1e9
+
+
+# Compiled pipelines of a run, shared by its endpoints as in a router.
+pipelines = {}
+
+
+def compiled(pipeline, view):
+    return compile_pipeline(pipeline, pipelines).bind(view)
+
+
+STRATEGIES = {
+    "chain_wrap": chain_wrap,
+    "compiled": compiled,
+}
+
+
+if __name__ == "__main__":
+    for count in (100, 1000):
+        for layers in (5, 10):
+            for name, strategy in STRATEGIES.items():
+                pipelines.clear()
+                wrapped, elapsed, memory = wrap_all(strategy, count, layers)
+                print(
+                    f"{name:>10} {count:>5} routes x {layers:>2} layers: "
+                    f"{elapsed * 1e3:8.2f} ms, {memory / 1024:8.1f} KiB, "
+                    f"{call_cost(wrapped[0]):6.0f} ns/call"
+                )
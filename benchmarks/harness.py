@@ -0,0 +1,131 @@
+"""Request path benchmark harness.
+
+Applications are driven in-process with synthetic WSGI environs.
+Latencies are measured per request, from the WSGI call to the
+exhaustion and closing of the response iterable.
+"""
+import gc
+import sys
+import time
+import platform
+import subprocess
+import typing as t
+from io import BytesIO
+from urllib.parse import urlsplit
+from wolf.wsgi.types import WSGICallable, WSGIEnviron
+
+
+def make_environ(
+        url: str = "/",
+        method: str = "GET",
+        headers: t.Mapping[str, str] | None = None,
+        body: bytes = b"",
+) -> WSGIEnviron:
+    parts = urlsplit(url)
+    environ = {
+        "REQUEST_METHOD": method,
+        "SCRIPT_NAME": "",
+        "PATH_INFO": parts.path or "/",
+        "QUERY_STRING": parts.query,
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "HTTP_HOST": "localhost",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    if body:
+        environ["CONTENT_LENGTH"] = str(len(body))
+    for name, value in (headers or {}).items():
+        key = name.upper().replace("-", "_")
+        if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            key = f"HTTP_{key}"
+        environ[key] = value
+    return environ
+
+
+def environs(template: WSGIEnviron, count: int) -> list[WSGIEnviron]:
+    """Fresh copies of an environ: the application may modify them.
+    """
+    body = template["wsgi.input"].getvalue()
+    return [
+        template | {"wsgi.input": BytesIO(body)}
+        for _ in range(count)
+    ]
+
+
+class Statuses(dict[str, int]):
+
+    def __call__(self, status: str, headers, exc_info=None):
+        self[status] = self.get(status, 0) + 1
+
+
+def percentile(ordered: list[int], ratio: float) -> int:
+    index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(
+        app: WSGICallable,
+        template: WSGIEnviron,
+        number: int = 10_000,
+        warmup: int = 500,
+) -> dict[str, t.Any]:
+    statuses = Statuses()
+    for environ in environs(template, warmup):
+        iterable = app(environ, statuses)
+        b"".join(iterable)
+        if hasattr(iterable, "close"):
+            iterable.close()
+
+    statuses.clear()
+    latencies = [0] * number
+    prepared = environs(template, number)
+    clock = time.perf_counter_ns
+    gc.collect()
+    gc.disable()
+    try:
+        total = clock()
+        for index, environ in enumerate(prepared):
+            start = clock()
+            iterable = app(environ, statuses)
+            b"".join(iterable)
+            if hasattr(iterable, "close"):
+                iterable.close()
+            latencies[index] = clock() - start
+        total = clock() - total
+    finally:
+        gc.enable()
+
+    latencies.sort()
+    return {
+        "requests": number,
+        "statuses": dict(statuses),
+        "rps": round(number / (total / 1e9), 1),
+        "mean_us": round(sum(latencies) / number / 1e3, 2),
+        "p50_us": round(percentile(latencies, 0.50) / 1e3, 2),
+        "p99_us": round(percentile(latencies, 0.99) / 1e3, 2),
+    }
+
+
+def metadata() -> dict[str, t.Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
@@ -0,0 +1,108 @@
+"""Run the request path benchmarks and emit the results as JSON.
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --filter routing --compare results.json
+
+Everything runs offline, in-process, with in-memory stores.
+"""
+import sys
+import json
+import fnmatch
+import logging
+import argparse
+import traceback
+import structlog
+from pathlib import Path
+
+# The in-memory stores are shared with the test suite.
+sys.path.append(str(Path(__file__).parent.parent / "tests"))
+
+from harness import measure, metadata  # noqa: E402
+from scenarios import scenarios  # noqa: E402
+
+
+# Logging is not what we measure.
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+)
+
+
+def run(patterns: list[str], number: int, warmup: int) -> dict:
+    results = {}
+    for name, scenario in scenarios.items():
+        if patterns and not any(
+                fnmatch.fnmatch(name, pattern) or pattern in name
+                for pattern in patterns):
+            continue
+        try:
+            app, environ = scenario()
+        except ImportError as exc:
+            results[name] = {"skipped": f"{type(exc).__name__}: {exc}"}
+        else:
+            try:
+                results[name] = measure(app, environ, number, warmup)
+            except Exception as exc:
+                traceback.print_exc()
+                results[name] = {"error": f"{type(exc).__name__}: {exc}"}
+        report(name, results[name])
+    return {"metadata": metadata(), "results": results}
+
+
+def report(name: str, result: dict, previous: dict | None = None):
+    if "rps" not in result:
+        reason = result.get("skipped") or result.get("error")
+        print(f"{name:<32} {reason}", file=sys.stderr)
+        return
+
+    line = (
+        f"{name:<32} {result['rps']:>10.0f} rps  "
+        f"p50 {result['p50_us']:>8.1f} us  p99 {result['p99_us']:>8.1f} us"
+    )
+    if previous and "rps" in previous:
+        delta = (result["rps"] - previous["rps"]) / previous["rps"] * 100
+        line += f"  {delta:+6.1f}% rps"
+    print(line, file=sys.stderr)
+
+
+def compare(current: dict, baseline: dict):
+    print(
+        f"\nCompared to {baseline['metadata'].get('commit')}:",
+        file=sys.stderr
+    )
+    for name, result in current["results"].items():
+        report(name, result, baseline["results"].get(name))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=10_000,
+                        help="Measured requests per scenario.")
+    parser.add_argument("-w", "--warmup", type=int, default=500,
+                        help="Unmeasured requests sent beforehand.")
+    parser.add_argument("-f", "--filter", action="append", default=[],
+                        help="Only run the matching scenarios.")
+    parser.add_argument("-o", "--output", type=Path,
+                        help="Write the JSON results to this file.")
+    parser.add_argument("-c", "--compare", type=Path,
+                        help="Results of a previous run to compare to.")
+    parser.add_argument("-l", "--list", action="store_true",
+                        help="List the scenarios and exit.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(scenarios))
+        return
+
+    current = run(args.filter, args.number, args.warmup)
+    if args.compare:
+        compare(current, json.loads(args.compare.read_text()))
+
+    output = json.dumps(current, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
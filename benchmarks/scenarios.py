@@ -0,0 +1,295 @@
+"""Benchmark scenarios.
+
+Each scenario is a function returning the WSGI application to drive
+and the environ template of the requests to send. Scenarios whose
+dependencies cannot be imported are reported as skipped.
+"""
+import typing as t
+from authsources.identity import User
+from kettu.cors import CORSPolicy
+from wolf.app import Application
+from wolf.app.response import Response
+from wolf.app.resolvers import RouteResolver, TrajectResolver
+from wolf.app.resolvers import TraversingResolver
+from wolf.abc.resolvers.traversing import PublicationRoot
+from wolf.wsgi.types import WSGICallable, WSGIEnviron
+from harness import make_environ
+
+
+Scenario = t.Callable[[], tuple[WSGICallable, WSGIEnviron]]
+scenarios: dict[str, Scenario] = {}
+
+DEPTH = 8
+ROUTES = 100
+
+
+def scenario(name: str):
+    def register(func: Scenario) -> Scenario:
+        scenarios[name] = func
+        return func
+    return register
+
+
+def hello(request, *args, **kwargs):
+    return Response(200, body=b"Hello, world!")
+
+
+def routed(*middlewares) -> Application:
+    app = Application(resolver=RouteResolver(), middlewares=middlewares)
+    for i in range(ROUTES):
+        app.resolver.router.register(f"/section{i}/{{id:digit}}")(hello)
+    app.resolver.router.register("/")(hello)
+    return app
+
+
+@scenario("routing.static")
+def routing_static():
+    return routed(), make_environ("/")
+
+
+@scenario("routing.params")
+def routing_params():
+    return routed(), make_environ(f"/section{ROUTES - 1}/42")
+
+
+@scenario("routing.not_found")
+def routing_not_found():
+    return routed(), make_environ("/unknown/path")
+
+
+@scenario("traject.deep")
+def traject_deep():
+    """A chain of `DEPTH` model factories, from the application down.
+    """
+    resolver = TrajectResolver()
+    parent = Application
+    for level in range(DEPTH):
+        model = type(f"Level{level}", (), {})
+
+        def factory(request, parent, *, id: str, model=model):
+            return model()
+
+        factory.__annotations__ = {"return": model}
+        resolver.contexts.add(parent, f"/level{level}/{{id}}", "GET", factory)
+        parent = model
+
+    resolver.views.register(parent, "/")(hello)
+    path = "".join(f"/level{level}/{level}" for level in range(DEPTH))
+    return Application(resolver=resolver), make_environ(f"{path}/")
+
+
+class Folder(dict):
+    pass
+
+
+class Root(Folder, PublicationRoot):
+    pass
+
+
+class Document:
+    pass
+
+
+def published(depth: int):
+    """A tree of `depth` nested folders, published from the root.
+    """
+    root = node = Root()
+    for level in range(depth):
+        node[f"folder{level}"] = node = Folder()
+    node["document"] = Document()
+
+    resolver = TraversingResolver()
+    resolver.views.register(Document, "/")(hello)
+    resolver.views.register(Document, "/view")(hello)
+    app = Application(resolver=resolver)
+    app.services.register_value(PublicationRoot, root)
+    path = "".join(f"/folder{level}" for level in range(depth))
+    return app, make_environ(f"{path}/document/view")
+
+
+@scenario("traversing.deep")
+def traversing_deep():
+    return published(DEPTH)
+
+
+@scenario("traversing.10_levels")
+def traversing_10_levels():
+    return published(10)
+
+
+def memory_session(user_session: bool, **options):
+    from http_session import Session
+    from wolf.app.middlewares import HTTPSession
+    from conftest import SessionMemoryStore
+
+    def view(request, *args, **kwargs):
+        session = request.get(Session)
+        session["visits"] = session.get("visits", 0) + 1
+        return Response(200, body=b"Visited")
+
+    middleware = HTTPSession(
+        store=SessionMemoryStore(), secret="benchmark", secure=False,
+        **options)
+    app = Application(resolver=RouteResolver(), middlewares=(middleware,))
+    app.resolver.router.register("/")(view)
+    headers = {}
+    if user_session:
+        sid = middleware.manager.generate_id()
+        middleware.manager.store.set(sid, {"visits": 0})
+        headers["Cookie"] = f"sid={middleware.manager.sign_id(sid)}"
+    return app, make_environ("/", headers=headers)
+
+
+@scenario("middleware.session.new")
+def session_new():
+    return memory_session(False)
+
+
+@scenario("middleware.session.existing")
+def session_existing():
+    return memory_session(True)
+
+
+@scenario("middleware.session.cached")
+def session_cached():
+    return memory_session(True, cache_size=1024, refresh_after=300)
+
+
+class Identity(User):
+
+    def __init__(self, id: str):
+        self.id = id
+        self.data = {}
+
+
+def authenticated(middleware) -> Application:
+    app = routed(middleware)
+    app.services.register_value(User, Identity("admin"))
+    return app
+
+
+@scenario("middleware.no_anonymous")
+def no_anonymous():
+    from wolf.app.middlewares import NoAnonymous
+
+    middleware = NoAnonymous(allowed_urls={"/login", "/static"})
+    return authenticated(middleware), make_environ("/section1/1")
+
+
+@scenario("middleware.protected")
+def protected():
+    from wolf.app.middlewares import Protected
+
+    middleware = Protected(protected_urls={"/section1", "/admin"})
+    return authenticated(middleware), make_environ("/section1/1")
+
+
+@scenario("middleware.cors.preflight")
+def cors_preflight():
+    from wolf.app.middlewares import CORS
+
+    middleware = CORS(policy=CORSPolicy(
+        origin="*", methods=["GET", "POST"], allow_headers=["X-Token"]))
+    environ = make_environ("/", method="OPTIONS")
+    environ |= {
+        "ORIGIN": "http://example.com",
+        "ACCESS_CONTROL_REQUEST_METHOD": "POST",
+        "ACCESS_CONTROL_REQUEST_HEADERS": "X-Token",
+    }
+    return routed(middleware), environ
+
+
+@scenario("middleware.cors.simple")
+def cors_simple():
+    from wolf.app.middlewares import CORS
+
+    middleware = CORS(policy=CORSPolicy(origin="*"))
+    return routed(middleware), make_environ("/section1/1")
+
+
+@scenario("middleware.compression")
+def compression():
+    from wolf.app.middlewares import Compression
+
+    def page(request, *args, **kwargs):
+        return Response.html(body="<p>Hello, world!</p>" * 500)
+
+    app = Application(
+        resolver=RouteResolver(), middlewares=(Compression(),))
+    app.resolver.router.register("/")(page)
+    return app, make_environ("/", headers={"Accept-Encoding": "gzip"})
+
+
+@scenario("middleware.cache")
+def cache():
+    from wolf.app.middlewares import ResponseCache
+
+    def page(request, *args, **kwargs):
+        return Response.html(body="<p>Hello, world!</p>" * 500)
+
+    app = Application(
+        resolver=RouteResolver(), middlewares=(ResponseCache(),))
+    app.resolver.router.register("/")(page)
+    return app, make_environ("/")
+
+
+@scenario("render.json")
+def render_json():
+    from wolf.app.render import json
+
+    @json
+    def view(request):
+        return {"items": [{"id": i, "name": f"item {i}"} for i in range(50)]}
+
+    app = Application(resolver=RouteResolver())
+    app.resolver.router.register("/")(view)
+    return app, make_environ("/", headers={"Accept": "application/json"})
+
+
+@scenario("render.html")
+def render_html():
+    from wolf.app.render import html
+
+    @html
+    def view(request):
+        return "<html><head></head><body>Hello, world!</body></html>"
+
+    app = Application(resolver=RouteResolver())
+    app.resolver.router.register("/")(view)
+    return app, make_environ("/")
+
+
+@scenario("render.renderer")
+def render_renderer():
+    from chameleon.zpt.template import PageTemplate
+    from wolf.app.render import html, renderer
+
+    template = PageTemplate(
+        "<ul><li tal:repeat='item items' tal:content='item'></li></ul>")
+
+    @html
+    @renderer(template=template, layout_name=None)
+    def view(request):
+        return {"items": [f"item {i}" for i in range(50)]}
+
+    app = Application(resolver=RouteResolver())
+    app.resolver.router.register("/")(view)
+    return app, make_environ("/")
+
+
+@scenario("render.stream")
+def render_stream():
+    from chameleon.zpt.template import PageTemplate
+    from wolf.app.render import html, renderer
+
+    template = PageTemplate(
+        "<ul><li tal:repeat='item items' tal:content='item'></li></ul>")
+
+    @html
+    @renderer(template=template, layout_name=None, stream=True)
+    def view(request):
+        return {"items": [f"item {i}" for i in range(50)]}
+
+    app = Application(resolver=RouteResolver())
+    app.resolver.router.register("/")(view)
+    return app, make_environ("/")
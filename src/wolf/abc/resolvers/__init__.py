@@ -1,3 +1,4 @@
+import warnings
 from typing import Protocol, Any
 from abc import abstractmethod
 from wrapt import ObjectProxy
@@ -11,13 +12,54 @@ class APIView:
     pass
 
 
+class Location:
+    """Location of a resolved object: the object, its parent location
+    and the path segment leading to it. The path is only computed
+    when needed, for instance to build URLs.
+    """
+    __slots__ = ("object", "parent", "segment", "id")
+
+    object: Any
+    parent: "Location | None"
+    segment: str
+    id: str | None
+
+    def __init__(self, object: Any, *, parent: "Location | None" = None,
+                 segment: str = "", id: str | None = None):
+        self.object = object
+        self.parent = parent
+        self.segment = segment
+        self.id = id
+
+    @property
+    def path(self) -> str:
+        segments = []
+        location = self
+        while location is not None:
+            if segment := location.segment.strip("/"):
+                segments.append(segment)
+            location = location.parent
+        return "/" + "/".join(reversed(segments))
+
+    def __repr__(self):
+        return f"<Location {self.path!r} of {self.object!r}>"
+
+
 class Located(ObjectProxy):
+    """Deprecated proxy of a resolved object, carrying its parent and
+    path. Resolvers now register a `Location` instead.
+    """
     __parent__: Any
     __path__: str
     __id__: str | None
 
     def __init__(self, wrapped, *,
                  parent: Any, path: str, id: str | None = None):
+        warnings.warn(
+            "Located is deprecated, use Location: resolved objects are "
+            "no longer proxied.",
+            DeprecationWarning, stacklevel=2
+        )
         super().__init__(wrapped)
         self.__parent__ = parent
         self.__id__ = id
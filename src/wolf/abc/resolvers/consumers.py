@@ -1,6 +1,8 @@
+import inspect
+import warnings
 from abc import ABC, abstractmethod
 from signature_registries import Registry, Proxy
-from wolf.abc.resolvers import Located
+from wolf.abc.resolvers import Location
 from plum import Signature
 
 
@@ -11,35 +13,126 @@ def consumer_sorter(result: tuple[Signature, Proxy]):
     return result[1].__metadata__.order
 
 
+def takes_context(consumer: type) -> bool:
+    """Consumers written for the former API are built with the
+    traversed object.
+    """
+    try:
+        parameters = inspect.signature(consumer).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        parameter.default is parameter.empty
+        and parameter.kind in (
+            parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+        for parameter in parameters
+    )
+
+
 class ConsumerRegistry(Registry):
+    """Registry of the path consumers, by type of traversed object.
+    The sorted consumers of each type are computed once and reused.
+    """
 
-    def consumers_for(self, obj: object):
-        for consumer in self.lookup(obj, None, sorter=consumer_sorter):
-            yield consumer(obj)
+    def __init__(self, data=None):
+        self._consumers = {}
+        super().__init__(data)
+
+    def clear_cache(self):
+        self._consumers.clear()
+
+    def __setitem__(self, signature, proxy):
+        self.clear_cache()
+        super().__setitem__(signature, proxy)
+
+    def __delitem__(self, signature):
+        self.clear_cache()
+        super().__delitem__(signature)
+
+    def pop(self, *args):
+        self.clear_cache()
+        return super().pop(*args)
+
+    def clear(self):
+        self.clear_cache()
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self.clear_cache()
+        super().update(*args, **kwargs)
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self.clear_cache()
+        return result
+
+    def __or__(self, other: "ConsumerRegistry"):
+        result = super().__or__(other)
+        result._consumers = {}
+        return result
+
+    def consumers_for(self, obj: object) -> tuple["BaseConsumer", ...]:
+        # Proxies can be matched on both their own type and
+        # the type of their wrapped object.
+        key = (type(obj), obj.__class__)
+        try:
+            consumers, legacy = self._consumers[key]
+        except KeyError:
+            found = tuple(self.lookup(obj, None, sorter=consumer_sorter))
+            legacy = tuple(takes_context(consumer) for consumer in found)
+            if not any(legacy):
+                legacy = None
+            else:
+                warnings.warn(
+                    "Consumers taking the traversed object on "
+                    "instantiation are deprecated: consumers are now "
+                    "stateless and shared.",
+                    DeprecationWarning, stacklevel=2
+                )
+            consumers = tuple(
+                consumer if legacy and legacy[index] else consumer()
+                for index, consumer in enumerate(found)
+            )
+            self._consumers[key] = consumers, legacy
+
+        if legacy is None:
+            return consumers
+        return tuple(
+            consumer(obj) if is_legacy else consumer
+            for consumer, is_legacy in zip(consumers, legacy)
+        )
 
 
 base_consumers = ConsumerRegistry()
 
 
 class BaseConsumer(ABC):
+    """Stateless path consumer: instances are shared by all the
+    traversals.
+    """
 
-    def __init__(self, context):
+    def __init__(self, context=None):
+        if context is not None:
+            warnings.warn(
+                "BaseConsumer no longer takes a context: the traversed "
+                "object is given to `resolve`.",
+                DeprecationWarning, stacklevel=2
+            )
         self.context = context
 
     @abstractmethod
     def resolve(self, obj, name: str, request):
         ...
 
-    def __call__(self, request, obj, stack):
+    def __call__(self, request, location: Location, stack):
         name = stack.popleft()
-        found = self.resolve(obj, name, request)
+        found = self.resolve(location.object, name, request)
         if found is NOT_FOUND:
             # Nothing was found, we restore the stack.
             stack.appendleft(name)
-            return False, obj, stack
+            return False, location, stack
 
-        resolved = Located(
-            found, parent=self.context, path=f"/{name}", id=name)
+        resolved = Location(found, parent=location, segment=name, id=name)
         return True, resolved, stack
 
 
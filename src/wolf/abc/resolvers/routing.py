@@ -4,7 +4,7 @@ from typing import Sequence, Any, Type, get_args
 from plum import dispatch, overload
 from autorouting import Router as BaseRouter, MatchedRoute
 from kettu.types import HTTPMethod
-from wolf.pipeline import Wrapper, chain_wrap
+from wolf.pipeline import Wrapper, compile_pipeline
 from . import APIView
 
 
@@ -66,6 +66,12 @@ def get_endpoints(view, methods: HTTPMethods | None = None):
 
 
 class Router(BaseRouter):
+
+    def __init__(self, *args, **kwargs):
+        # Compiled pipelines of the registered routes, by chain.
+        self.pipelines = {}
+        super().__init__(*args, **kwargs)
+
     def register(
         self,
         path: str,
@@ -78,7 +84,8 @@ class Router(BaseRouter):
         def routing(value: Any):
             for endpoint, verbs in get_endpoints(value, methods):
                 if pipeline:
-                    endpoint = chain_wrap(pipeline, endpoint)
+                    endpoint = compile_pipeline(
+                        pipeline, self.pipelines).bind(endpoint)
                 for verb in verbs:
                     self.add(
                         path,
@@ -1,15 +1,25 @@
+import re
+import threading
 import typing as t
+from collections import deque, OrderedDict
 from collections.abc import Mapping
 from pathlib import PurePosixPath
 from inspect import signature, _empty as empty, isclass
 from wolf.abc.request import RequestProtocol
 from signature_registries.typed import TypedSet
-from . import Located
+from . import Location
 from .typed_router import TypedRouter
+from .routing import MatchedRoute
 
 
 C = t.TypeVar("C")
 Factory = t.Callable[[RequestProtocol, t.Any, Mapping[str, t.Any]], C]
+Plan = tuple[str, str, MatchedRoute]
+Shape = tuple[str | None, ...]
+
+# Whole segment placeholders, matching any segment.
+PLACEHOLDER = re.compile(r"^\{[^{}:]+\}$")
+MISSING = object()
 
 
 def paths(path: str) -> tuple[str, str]:
@@ -20,6 +30,22 @@ def paths(path: str) -> tuple[str, str]:
         yield str(parent), "/" + str(root.relative_to(parent))
 
 
+def literal_segments(routers: t.Iterable[Mapping]) -> frozenset | None:
+    """Literal segments of the patterns of the routers. None if
+    a pattern has typed or partial placeholders: paths can't be
+    reduced to shapes.
+    """
+    literals = {"/"}
+    for router in routers:
+        for pattern in router:
+            for segment in pattern.strip("/").split("/"):
+                if "{" not in segment:
+                    literals.add(segment)
+                elif not PLACEHOLDER.match(segment):
+                    return None
+    return frozenset(literals)
+
+
 class Node:
 
     def __init__(self, cls, path):
@@ -46,12 +72,26 @@ class ViewRegistry(TypedRouter):
 
 
 class ContextRegistry(TypedRouter):
-    __slots__ = ("_reverse",)
+    __slots__ = (
+        "_reverse", "_paths", "_plans", "_literals", "_lock", "cache_size")
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 1024):
         self._reverse: TypedSet[t.Any, Node] = TypedSet()
+        self._paths: dict[tuple[t.Any, t.Any], str | None] = {}
+        self._plans: OrderedDict[
+            tuple[type, str, Shape], tuple[int, t.Any] | None
+        ] = OrderedDict()
+        self._literals: dict[type, frozenset | None] = {}
+        self._lock = threading.Lock()
+        self.cache_size = cache_size
         super().__init__()
 
+    def clear_cache(self):
+        with self._lock:
+            self._paths.clear()
+            self._plans.clear()
+            self._literals.clear()
+
     def add(
             self,
             root: type[t.Any],
@@ -65,6 +105,65 @@ class ContextRegistry(TypedRouter):
             raise TypeError("Factories need to specify a return type.")
         self[root].add(path, method, factory, **kwargs)
         self._reverse.add(sig.return_annotation, Node(root, path))
+        self.clear_cache()
+
+    def shape(self, cls: type[t.Any], parts: tuple[str, ...]) -> Shape:
+        """The segments matched by placeholders only are blanked:
+        paths of the same shape are matched by the same patterns.
+        """
+        try:
+            literals = self._literals[cls]
+        except KeyError:
+            literals = self._literals[cls] = literal_segments(
+                self.lookup(cls))
+        if literals is None:
+            return parts
+        return tuple(part if part in literals else None for part in parts)
+
+    def plan(
+        self,
+        cls: type[t.Any],
+        path: str,
+        method: str
+    ) -> Plan | None:
+        """Find the longest stub of the path matched by a factory
+        registered for the class. Plans are memoized by path shape,
+        as the depth of the stub and its router only depend on the
+        registrations. The least recently used plans are evicted.
+        """
+        parts = PurePosixPath(path).parts
+        key = (cls, method, self.shape(cls, parts))
+        with self._lock:
+            planned = self._plans.get(key, MISSING)
+            if planned is not MISSING:
+                self._plans.move_to_end(key)
+
+        if planned is None:
+            return None
+        if planned is not MISSING:
+            depth, router = planned
+            stub = str(PurePosixPath(*parts[:depth]))
+            if found := router.get(stub, method):
+                branch = parts[depth:]
+                return stub, branch and "/" + "/".join(branch) or "", found
+
+        plan = planned = None
+        for stub, branch in paths(path):
+            for router in self.lookup(cls):
+                found = router.get(stub, method)
+                if found:
+                    plan = stub, branch, found
+                    planned = len(PurePosixPath(stub).parts), router
+                    break
+            if plan is not None:
+                break
+
+        with self._lock:
+            self._plans[key] = planned
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.cache_size:
+                self._plans.popitem(last=False)
+        return plan
 
     def resolve(
         self,
@@ -73,59 +172,64 @@ class ContextRegistry(TypedRouter):
         method: str,
         request: RequestProtocol,
         partial: bool = None,
-    ) -> t.Tuple[t.Any, str]:
-        for stub, branch in paths(path):
-            for matcher in self.lookup(root.__class__):
-                found = matcher.get(stub, method)
-                if found:
-                    obj = found.component(request, root, **found.params)
-                    if obj is None:
-                        raise LookupError(stub)
-                    located = Located(obj, parent=root, path=stub)
-                    if not branch:
-                        return located, ""
-                    return self.resolve(
-                        located, branch, method, request, partial=partial
-                    )
+    ) -> t.Tuple[Location, str]:
+        location = Location(root)
+        while (plan := self.plan(root.__class__, path, method)) is not None:
+            stub, branch, found = plan
+            root = found.component(request, root, **found.params)
+            if root is None:
+                raise LookupError(stub)
+            location = Location(root, parent=location, segment=stub)
+            if not branch:
+                return location, ""
+            path = branch
         if partial:
-            return root, path
+            return location, path
         raise LookupError()
 
-    def reverse(self, node1, node2):
-        path_list = [[node1]]
-        path_index = 0
+    def traversed(self, cls: type[t.Any]) -> bool:
+        """Whether objects of `cls` are built by a factory, hence
+        located below the root.
+        """
+        return any(parent in self._reverse for parent in cls.__mro__)
 
-        # To keep track of previously visited nodes
-        previous_nodes = {node1}
+    def reverse(self, node1, node2):
+        """Path from the `node2` class down to the `node1` class.
+        Paths are memoized until the registry is modified.
+        """
+        key = (node1, node2)
+        try:
+            path = self._paths[key]
+        except KeyError:
+            path = self._paths[key] = self.shortest_path(node1, node2)
+        if path is None:
+            raise LookupError("No path found.")
+        return path
+
+    def shortest_path(self, node1, node2) -> str | list | None:
         if node1 == node2:
-            return path_list[0]
-
-        while path_index < len(path_list):
-            current_path = path_list[path_index]
-            last_node = current_path[-1]
-            next_nodes = self._reverse[last_node]
-
-            # Search goal node
+            return [node1]
+
+        # Breadth-first search, keeping track of the previous nodes.
+        previous = {node1: None}
+        queue = deque((node1,))
+        while queue:
+            last_node = queue.popleft()
+            next_nodes = self._reverse.get(last_node, ())
             for candidate in next_nodes:
                 if candidate == node2:
-                    current_path.append(candidate)
-                    resolved = "/"
-                    for node in reversed(current_path[1:]):
-                        resolved += node.path
-                    return resolved
+                    resolved = candidate.path
+                    while last_node is not node1:
+                        resolved += last_node.path
+                        last_node = previous[last_node]
+                    return "/" + resolved
 
-            # Add new paths
             for next_node in next_nodes:
-                if next_node not in previous_nodes:
-                    new_path = current_path[:]
-                    new_path.append(next_node)
-                    path_list.append(new_path)
+                if next_node not in previous:
                     # To avoid backtracking
-                    previous_nodes.add(next_node)
-            # Continue to next path in list
-            path_index += 1
-        # No path is found
-        raise LookupError("No path found.")
+                    previous[next_node] = last_node
+                    queue.append(next_node)
+        return None
 
     def __or__(self, other: "ContextRegistry"):
         new: ContextRegistry = super().__or__(other)
@@ -135,6 +239,7 @@ class ContextRegistry(TypedRouter):
     def __ior__(self, other: "ContextRegistry"):
         new: ContextRegistry = super().__ior__(other)
         new._reverse |= other._reverse
+        new.clear_cache()
         return new
 
 
@@ -1,10 +1,13 @@
 import re
-import typing as t
 from collections import deque
 from urllib.parse import unquote
 from wolf.abc.request import RequestProtocol
 from .consumers import ConsumerRegistry, base_consumers
 from .consumers import BaseConsumer
+from . import Location
+
+
+SEPARATORS = re.compile(r'/+')
 
 
 class PublicationRoot:
@@ -19,20 +22,20 @@ class Publisher:
 
     def publish(
             self, request: RequestProtocol, obj: PublicationRoot
-    ) -> tuple[t.Any, str]:
+    ) -> tuple[Location, str]:
         path = unquote(request.path)
-        stack = deque(re.split(r'/+', path.strip('/')))
-        unconsumed = stack.copy()
+        unconsumed = deque(SEPARATORS.split(path.strip('/')))
+        location = Location(obj)
         while unconsumed:
-            for consumer in self.consumers.consumers_for(obj):
-                any_consumed, obj, unconsumed = consumer(
-                    request, obj, unconsumed)
+            for consumer in self.consumers.consumers_for(location.object):
+                any_consumed, location, unconsumed = consumer(
+                    request, location, unconsumed)
                 if any_consumed:
                     break
             else:
                 # nothing could be consumed
-                return obj, '/'.join(unconsumed)
-        return obj, '/'.join(unconsumed)
+                return location, '/'.join(unconsumed)
+        return location, '/'.join(unconsumed)
 
 
 __all__ = [
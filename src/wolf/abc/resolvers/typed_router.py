@@ -1,6 +1,6 @@
 import typing as t
 from collections import defaultdict
-from wolf.pipeline import chain_wrap
+from wolf.pipeline import compile_pipeline
 from signature_registries import TypedValue
 from .routing import Router, HTTPMethods, get_endpoints
 
@@ -8,6 +8,8 @@ from .routing import Router, HTTPMethods, get_endpoints
 class TypedRouter(TypedValue[t.Any, Router], defaultdict):
 
     def __init__(self):
+        # Compiled pipelines of the registered routes, by chain.
+        self.pipelines = {}
         defaultdict.__init__(self, Router)
 
     def add(
@@ -31,7 +33,8 @@ class TypedRouter(TypedValue[t.Any, Router], defaultdict):
         def routing(value: t.Any):
             for endpoint, verbs in get_endpoints(value, methods):
                 if pipeline:
-                    endpoint = chain_wrap(pipeline, endpoint)
+                    endpoint = compile_pipeline(
+                        pipeline, self.pipelines).bind(endpoint)
                 for verb in verbs:
                     self.add(root, path, verb, endpoint, **kwargs)
             return value
@@ -58,7 +61,7 @@ class TypedRouter(TypedValue[t.Any, Router], defaultdict):
                 return path
 
     def __or__(self, other: "TypedRouter"):
-        new = TypedRouter()
+        new = self.__class__()
         for cls, router in self.items():
             new[cls] = router
         for cls, router in other.items():
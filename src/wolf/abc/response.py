@@ -1,8 +1,10 @@
 import orjson
+from itertools import chain, islice
 from io import BytesIO
 from pathlib import Path
 from typing import Generic, TypeVar, AnyStr
-from collections.abc import Mapping, Iterable, Iterator, Callable
+from collections.abc import (
+    Mapping, Iterable, Iterator, AsyncIterator, Callable)
 from http import HTTPStatus
 from collections import deque
 from kettu.headers import Cookies
@@ -11,13 +13,94 @@ from kettu.constants import EMPTY_STATUSES, REDIRECT_STATUSES
 from kettu.types import HTTPCode
 
 
-BodyT = str | bytes | Iterator[bytes]
+BodyT = str | bytes | Iterator[bytes] | AsyncIterator[bytes]
 HeadersT = Mapping[str, str] | Iterable[tuple[str, str]]
 F = TypeVar("F", bound=Callable)
 
 
 UNSET = object()
 
+STATUSES: dict[int, HTTPStatus] = {
+    status.value: status for status in HTTPStatus
+}
+STATUS_LINES: dict[int, str] = {
+    status.value: f"{status.value} {status.phrase}" for status in HTTPStatus
+}
+
+
+def as_status(code: HTTPCode) -> HTTPStatus:
+    try:
+        return STATUSES[code]
+    except (KeyError, TypeError):
+        return HTTPStatus(code)
+
+
+class Flush(bytes):
+    """Empty chunk asking the buffered bodies to send what they hold.
+    """
+
+
+FLUSH = Flush()
+BUFFER_SIZE = 16 * 1024
+
+
+def coalesce(chunks: Iterable[bytes], size: int = BUFFER_SIZE
+             ) -> Iterator[bytes]:
+    """Gather small chunks into chunks of `size` bytes, in a buffer
+    allocated once. Larger chunks are passed through as they are.
+    """
+    buffer = memoryview(bytearray(size))
+    used = 0
+    for chunk in chunks:
+        if chunk is FLUSH:
+            if used:
+                yield bytes(buffer[:used])
+                used = 0
+            continue
+
+        end = used + len(chunk)
+        if end < size:
+            buffer[used:end] = chunk
+            used = end
+            continue
+
+        if used:
+            if end == size:
+                buffer[used:] = chunk
+                chunk = bytes(buffer)
+            else:
+                yield bytes(buffer[:used])
+            used = 0
+        if len(chunk) >= size:
+            yield chunk
+        else:
+            buffer[:len(chunk)] = chunk
+            used = len(chunk)
+    if used:
+        yield bytes(buffer[:used])
+
+
+def json_chunks(
+        items: Iterable, batch_size: int = 100, ndjson: bool = False
+) -> Iterator[bytes]:
+    """Serialize items as a JSON array, or as newline delimited JSON,
+    `batch_size` items at a time.
+    """
+    iterator = iter(items)
+    separator = b"["
+    while batch := list(islice(iterator, batch_size)):
+        if ndjson:
+            yield b"".join(
+                orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+                for item in batch
+            )
+        else:
+            # The brackets of the serialized batch are dropped.
+            yield separator + orjson.dumps(batch)[1:-1]
+            separator = b","
+    if not ndjson:
+        yield b"[]" if separator == b"[" else b"]"
+
 
 class FileResponseProtocol:
 
@@ -30,7 +113,7 @@ class FileResponseProtocol:
             block_size: int = 4096,
             headers: HeadersT | None = None,
     ):
-        self.status = HTTPStatus(status)
+        self.status = as_status(status)
         self.file_ = file_
         self.headers = ResponseHeaders(headers)  # idempotent.
         self.block_size = block_size
@@ -40,13 +123,47 @@ class FileResponseProtocol:
         return self.headers.cookies
 
 
+R = TypeVar("R", bound="ResponseProtocol")
+
+
+class ResponseTemplate(Generic[R]):
+    """Immutable prototype of a response. Calling the template
+    creates a new response with a copy of its headers.
+    """
+    __slots__ = ("factory", "status", "body", "headers")
+
+    def __init__(
+            self,
+            factory: type[R],
+            code: HTTPCode = 200,
+            body: str | bytes | None = None,
+            headers: HeadersT | None = None,
+    ):
+        if body is not None and not isinstance(body, (str, bytes)):
+            raise TypeError("Template bodies can only be bytes or str.")
+        headers = ResponseHeaders(headers)
+        if "Set-Cookie" in headers or "Link" in headers:
+            raise ValueError("Templates cannot hold cookies or links.")
+        self.factory = factory
+        self.status = as_status(code)
+        self.body = body
+        self.headers = dict(headers.items())
+
+    def __call__(self) -> R:
+        response = self.factory(self.status, self.body)
+        if self.headers:
+            response.headers = self.headers
+        return response
+
+
 class ResponseProtocol(Generic[F]):
-    __slots__ = ("status", "body", "headers", "_finishers")
+    __slots__ = ("status", "body", "_headers", "_finishers", "buffer_size")
 
     status: HTTPStatus
-    headers: ResponseHeaders
     body: BodyT | None
+    _headers: ResponseHeaders | None
     _finishers: deque[F] | None
+    buffer_size: int | None
 
     def __init__(
         self,
@@ -54,10 +171,70 @@ class ResponseProtocol(Generic[F]):
         body: BodyT | None = None,
         headers: HeadersT | None = None,
     ):
-        self.status = HTTPStatus(status)
+        self.status = as_status(status)
         self.body = body
-        self.headers = ResponseHeaders(headers)  # idempotent.
+        # The headers container is created when first needed.
+        self._headers = None if headers is None else ResponseHeaders(headers)
         self._finishers = None
+        self.buffer_size = None
+
+    @property
+    def headers(self) -> ResponseHeaders:
+        if self._headers is None:
+            self._headers = ResponseHeaders()
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: HeadersT):
+        self._headers = ResponseHeaders(headers)
+
+    @property
+    def status_line(self) -> str:
+        return STATUS_LINES[self.status]
+
+    def header_list(self) -> list[tuple[str, str]]:
+        if not self._headers:
+            return []
+        return list(self._headers.items())
+
+    @classmethod
+    def template(
+            cls,
+            code: HTTPCode = 200,
+            body: str | bytes | None = None,
+            headers: HeadersT | None = None,
+    ) -> "ResponseTemplate":
+        return ResponseTemplate(cls, code, body, headers)
+
+    def buffered(self, size: int = BUFFER_SIZE) -> "ResponseProtocol":
+        """Coalesce the chunks of an iterator body into writes of
+        `size` bytes. Yielding `FLUSH` sends the pending bytes.
+        """
+        self.buffer_size = size
+        return self
+
+    def compute_length(self, max_size: int = BUFFER_SIZE) -> int | None:
+        """Set the Content-Length of the response if the body is
+        not larger than `max_size`. Iterator bodies are read up to
+        that size: a small body is joined, a larger one is chained.
+        """
+        body = self.body
+        if isinstance(body, str):
+            body = self.body = body.encode()
+        elif isinstance(body, Iterator):
+            read = []
+            length = 0
+            for chunk in body:
+                read.append(chunk)
+                length += len(chunk)
+                if length > max_size:
+                    self.body = chain(read, body)
+                    return None
+            body = self.body = b"".join(read)
+        if not isinstance(body, bytes) or len(body) > max_size:
+            return None
+        self.headers["Content-Length"] = str(len(body))
+        return len(body)
 
     def add_finisher(self, task: F):
         if self._finishers is None:
@@ -78,7 +255,10 @@ class ResponseProtocol(Generic[F]):
             elif isinstance(self.body, str):
                 yield self.body.encode()
             elif isinstance(self.body, Iterator):
-                yield from self.body
+                if self.buffer_size:
+                    yield from coalesce(self.body, self.buffer_size)
+                else:
+                    yield from self.body
             else:
                 raise TypeError(
                     f"Body of type {type(self.body)!r} is not supported.")
@@ -98,6 +278,23 @@ class ResponseProtocol(Generic[F]):
             headers["Content-Type"] = "application/json"
         return cls(code, data, headers)
 
+    @classmethod
+    def stream_json(
+            cls,
+            items: Iterable,
+            code: HTTPCode = 200,
+            headers: HeadersT | None = None,
+            ndjson: bool = False,
+            batch_size: int = 100,
+    ) -> "ResponseProtocol":
+        """JSON array, or NDJSON, response serialized while the items
+        are iterated, for collections too large to be held in memory.
+        """
+        headers = ResponseHeaders(headers)
+        headers["Content-Type"] = (
+            "application/x-ndjson" if ndjson else "application/json")
+        return cls(code, json_chunks(items, batch_size, ndjson), headers)
+
     @classmethod
     def html(
             cls,
@@ -1,14 +1,21 @@
+import sys
+import asyncio
+import inspect
+from typing import NamedTuple
 from collections import defaultdict
 from dataclasses import dataclass, field
 
 import svcs
 import structlog
+from blinker import NamedSignal
 from kettu.exceptions import HTTPError
 from wolf.pipeline import Wrapper, chain_wrap
 from wolf.abc.resolvers import URIResolver, Params, Extra
 from wolf.app.nodes import Mapping, Node
-from wolf.app.response import Response
-from wolf.app.request import Request
+from wolf.app.response import Response, FileWrapperResponse
+from wolf.app.request import Request, ASGIRequest
+from wolf.asgi.bridge import call_wsgi, lifespan, awaited, running_loop
+from wolf.asgi.types import Scope, Receive, Send
 from wolf.wsgi.types import WSGIEnviron, WSGICallable, ExceptionInfo
 from wolf.utils import immutable_cached_property
 from wolf.app.pluggability import Installable
@@ -18,6 +25,36 @@ from wolf.app.events import Events
 logger = structlog.get_logger("wolf.app")
 
 
+def listened(signal: NamedSignal) -> NamedSignal | None:
+    return signal if signal.receivers else None
+
+
+class Dispatch(NamedTuple):
+    """Precomputed dispatch path of an application.
+    Empty sinks and signals without receivers are set to None.
+    """
+    mapping: Mapping
+    revision: int
+    sinks: Mapping | None
+    on_request: NamedSignal | None
+    on_response: NamedSignal | None
+
+    @classmethod
+    def compute(cls, app: "Application") -> "Dispatch":
+        lifecycle = app.events.lifecycle
+        return cls(
+            mapping=app.sinks,
+            revision=app.sinks.revision,
+            sinks=app.sinks or None,
+            on_request=listened(lifecycle.on_request),
+            on_response=listened(lifecycle.on_response),
+        )
+
+    def is_current(self, app: "Application") -> bool:
+        return (self.mapping is app.sinks
+                and self.revision == app.sinks.revision)
+
+
 @dataclass(kw_only=True, repr=False)
 class Application(Node):
     resolver: URIResolver
@@ -25,6 +62,7 @@ class Application(Node):
     services: svcs.Registry = field(default_factory=svcs.Registry)
     middlewares: tuple[Wrapper, ...] = field(default_factory=tuple)
     sinks: Mapping = field(default_factory=Mapping)
+    _dispatch: Dispatch | None = field(default=None, init=False)
 
     def __post_init__(self):
         self.services.register_value(Application, self)
@@ -53,21 +91,59 @@ class Application(Node):
             self.resolver.resolve
         )
 
+    @immutable_cached_property
+    def asgi_endpoint(self):
+        """Middlewares chain run in a worker thread by the ASGI entry
+        point: the middlewares get the responses of coroutine views,
+        awaited on the event loop.
+        """
+        return chain_wrap(
+            self.middlewares,
+            awaited(self.resolver.resolve)
+        )
+
+    @property
+    def frozen(self) -> bool:
+        return self._dispatch is not None
+
+    def freeze(self):
+        """Precompute the dispatch path, once all the components are
+        installed. The path is recomputed when the sinks are modified
+        or when receivers are connected to or disconnected from the
+        request lifecycle signals.
+        """
+        lifecycle = self.events.lifecycle
+        for signal in (lifecycle.on_request, lifecycle.on_response):
+            signal.receiver_connected.connect(self._refreeze)
+            signal.receiver_disconnected.connect(self._refreeze)
+        self.endpoint  # Compile the middlewares chain.
+        self._dispatch = Dispatch.compute(self)
+
+    def _refreeze(self, signal: NamedSignal, **kwargs):
+        self._dispatch = Dispatch.compute(self)
+
+    @property
+    def dispatch(self) -> Dispatch:
+        if self._dispatch is None:
+            return Dispatch.compute(self)
+        if not self._dispatch.is_current(self):
+            self._dispatch = Dispatch.compute(self)
+        return self._dispatch
+
     def resolve(self, environ: WSGIEnviron) -> WSGICallable:
-        if self.sinks:
-            try:
-                return self.sinks.resolve(environ)
-            except HTTPError as err:
-                if err.status != 404:
-                    raise err
+        dispatch = self.dispatch
+        if dispatch.sinks is not None:
+            if (script := dispatch.sinks.match(environ)) is not None:
+                return script
 
         request: Request = Request(environ)
-        self.events.lifecycle.on_request.send(self, request=request)
+        if dispatch.on_request is not None:
+            dispatch.on_request.send(self, request=request)
         with request(self.services):
             try:
                 response = self.endpoint(request)
-                self.events.lifecycle.on_response.send(
-                    self, response=response)
+                if dispatch.on_response is not None:
+                    dispatch.on_response.send(self, response=response)
                 return response
             except HTTPError as err:
                 logger.debug(err, exc_info=True)
@@ -75,3 +151,96 @@ class Application(Node):
             except Exception as err:
                 logger.critical(err, exc_info=True)
                 raise
+
+    async def asgi(self, scope: Scope, receive: Receive, send: Send):
+        """ASGI entry point. Synchronous endpoints and middlewares run
+        in a worker thread, not to block the event loop. Awaitables,
+        such as the results of coroutine views, are awaited on the loop
+        within the request context, before the middlewares get them.
+        """
+        if scope["type"] == "lifespan":
+            return await lifespan(receive, send)
+        if scope["type"] != "http":
+            raise NotImplementedError(
+                f"Unsupported ASGI scope type: {scope['type']!r}.")
+
+        try:
+            request = await ASGIRequest.from_scope(scope, receive)
+        except HTTPError as exc:
+            response = Response(exc.status, body=exc.body)
+            return await response.asgi(scope, receive, send)
+        await self.asgi_handle(request, receive, send)
+
+    async def asgi_handle(
+            self, request: ASGIRequest, receive: Receive, send: Send):
+        environ = request.environ
+        dispatch = self.dispatch
+        if dispatch.sinks is not None:
+            if (script := dispatch.sinks.match(environ)) is not None:
+                return await self.asgi_sink(script, request, receive, send)
+
+        try:
+            response = await self.asgi_resolve(request, dispatch)
+        except HTTPError as exc:
+            response = Response(exc.status, body=exc.body)
+        except Exception:
+            response = self.handle_exception(sys.exc_info(), environ)
+            if response is None:
+                raise
+        await response.asgi(request.scope, receive, send)
+
+    async def asgi_resolve(self, request: ASGIRequest, dispatch: Dispatch):
+        if dispatch.on_request is not None:
+            dispatch.on_request.send(self, request=request)
+        with request(self.services):
+            try:
+                if self.middlewares:
+                    running_loop.set(asyncio.get_running_loop())
+                    response = await asyncio.to_thread(
+                        self.asgi_endpoint, request)
+                elif inspect.iscoroutinefunction(self.resolver.resolve):
+                    response = await self.resolver.resolve(request)
+                else:
+                    response = await asyncio.to_thread(
+                        self.resolver.resolve, request)
+                if inspect.isawaitable(response):
+                    response = await response
+                if dispatch.on_response is not None:
+                    dispatch.on_response.send(self, response=response)
+                return response
+            except HTTPError as err:
+                logger.debug(err, exc_info=True)
+                raise
+            except Exception as err:
+                logger.critical(err, exc_info=True)
+                raise
+
+    async def asgi_sink(
+            self,
+            script: WSGICallable,
+            request: ASGIRequest,
+            receive: Receive,
+            send: Send
+    ):
+        """Mounted applications are handled natively and nodes are
+        resolved down to their response. Plain WSGI callables are run
+        in a worker thread.
+        """
+        environ = request.environ
+        while isinstance(script, Node):
+            if isinstance(script, Application):
+                return await script.asgi_handle(
+                    ASGIRequest(request.scope, environ), receive, send)
+            node = script
+            try:
+                script = node.resolve(environ)
+            except HTTPError as exc:
+                script = Response(exc.status, body=exc.body)
+            except Exception:
+                script = node.handle_exception(sys.exc_info(), environ)
+                if script is None:
+                    raise
+
+        if isinstance(script, (Response, FileWrapperResponse)):
+            return await script.asgi(request.scope, receive, send)
+        return await call_wsgi(script, environ, send)
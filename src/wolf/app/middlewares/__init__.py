@@ -1,6 +1,15 @@
 from .session import HTTPSession
 from .authorization import NoAnonymous, Protected
 from .cors import CORS
+from .compression import Compression
+from .cache import ResponseCache
 
 
-__all__ = ["HTTPSession", "NoAnonymous", "Protected", "CORS"]
+__all__ = [
+    "HTTPSession",
+    "NoAnonymous",
+    "Protected",
+    "CORS",
+    "Compression",
+    "ResponseCache",
+]
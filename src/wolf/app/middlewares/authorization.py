@@ -6,8 +6,10 @@ from kettu.exceptions import HTTPError
 from wolf.abc.identity import anonymous
 from wolf.abc.request import RequestProtocol
 from wolf.abc.response import ResponseProtocol
+from wolf.pipeline import shareable
 
 
+@shareable
 @dataclass(kw_only=True)
 class NoAnonymous:
     allowed_urls: set[str] = field(default_factory=set)
@@ -42,6 +44,7 @@ class NoAnonymous:
         return checker
 
 
+@shareable
 @dataclass(kw_only=True)
 class Protected:
     protected_urls: set[str] = field(default_factory=set)
@@ -0,0 +1,235 @@
+import time
+import hashlib
+import threading
+import structlog
+import typing as t
+from functools import wraps
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from kettu.headers import ETag
+from wolf.abc.request import RequestProtocol
+from wolf.abc.response import ResponseProtocol
+from wolf.app.response import etag_matches
+from wolf.pipeline import shareable
+
+
+logger = structlog.get_logger("wolf.app.middlewares.cache")
+
+# Headers kept in the 304 responses, as stored by the response headers.
+VALIDATORS = frozenset(("Etag", "Vary", "Cache-Control", "Last-Modified"))
+
+
+class CachedResponse(t.NamedTuple):
+    status: int
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+    etag: ETag
+
+
+class CacheStore(t.Protocol):
+
+    def get(self, key: str) -> CachedResponse | None:
+        ...
+
+    def set(self, key: str, value: CachedResponse, ttl: int | None):
+        ...
+
+    def delete(self, key: str):
+        ...
+
+    def clear(self):
+        ...
+
+
+class MemoryCacheStore(CacheStore):
+    """Bounded in-memory store, evicting the least recently used
+    entries. Entries expire after their time to live.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[
+            str, tuple[t.Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> t.Any | None:
+        with self._lock:
+            try:
+                value, expires = self._entries[key]
+            except KeyError:
+                return None
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: t.Any, ttl: int | None):
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class Flight:
+    """Computation of a missing entry, awaited by the concurrent
+    requests of the same key.
+    """
+    __slots__ = ("done", "entry")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.entry: CachedResponse | None = None
+
+
+@shareable
+@dataclass(kw_only=True)
+class ResponseCache:
+    store: CacheStore = field(default_factory=MemoryCacheStore)
+    ttl: int | None = 60
+    vary: tuple[str, ...] = ()
+    max_body_size: int = 1024 * 1024
+    wait_timeout: float = 30.0
+
+    def __post_init__(self):
+        self.vary_keys = tuple(
+            "HTTP_" + name.upper().replace("-", "_") for name in self.vary
+        )
+        self.vary_names = frozenset(name.lower() for name in self.vary)
+        self._flights: dict[str, Flight] = {}
+        self._lock = threading.Lock()
+
+    def cacheable(self, request: RequestProtocol) -> bool:
+        """Credentialed requests are not answered from a shared cache
+        (RFC 9111, section 3.5). Requests with cookies are only cached
+        if the cookies are part of the key, with `vary=("Cookie",)`.
+        """
+        environ = request.environ
+        if request.method not in ("GET", "HEAD"):
+            return False
+        if "HTTP_AUTHORIZATION" in environ:
+            return False
+        if "HTTP_COOKIE" in environ and "cookie" not in self.vary_names:
+            return False
+        return True
+
+    def key(self, request: RequestProtocol) -> str:
+        environ = request.environ
+        parts = [
+            environ.get("HTTP_HOST", ""),
+            environ.get("SCRIPT_NAME", ""),
+            request.path,
+            environ.get("QUERY_STRING", ""),
+        ]
+        parts.extend(environ.get(name, "") for name in self.vary_keys)
+        return "\0".join(parts)
+
+    def entry(self, response) -> CachedResponse | None:
+        """Cache entry of the response, if it can be cached.
+        """
+        if not isinstance(response, ResponseProtocol):
+            return None
+        if response.status != 200 or "Set-Cookie" in response.headers:
+            return None
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return None
+        if vary := response.headers.get("Vary"):
+            # The key only holds the values of the configured headers.
+            names = {name.strip().lower() for name in vary.split(",")}
+            if not names <= self.vary_names:
+                logger.debug("Response varies on unkeyed headers.",
+                             vary=vary)
+                return None
+        if response.compute_length(self.max_body_size) is None:
+            return None
+
+        if etag := response.headers.get("ETag"):
+            etag = ETag.from_string(etag)
+        else:
+            etag = ETag(hashlib.blake2b(
+                response.body, digest_size=16).hexdigest())
+            response.headers.etag = etag
+        for name in self.vary:
+            vary = response.headers.get("Vary", "")
+            if name.lower() not in vary.lower():
+                response.headers.add("Vary", name)
+        return CachedResponse(
+            status=response.status.value,
+            headers=tuple(response.headers.items()),
+            body=response.body,
+            etag=etag,
+        )
+
+    def not_modified(self, request: RequestProtocol, entry: CachedResponse):
+        if request.environ.get("HTTP_IF_NONE_MATCH") and etag_matches(
+                request.if_none_match, entry.etag, weak=True):
+            return request.response_cls(304, headers=[
+                (name, value) for name, value in entry.headers
+                if name in VALIDATORS
+            ])
+        return None
+
+    def respond(self, request: RequestProtocol, entry: CachedResponse):
+        if (response := self.not_modified(request, entry)) is not None:
+            return response
+        body = b"" if request.method == "HEAD" else entry.body
+        return request.response_cls(
+            entry.status, body, headers=list(entry.headers))
+
+    def __call__(self, handler):
+        @wraps(handler)
+        def caching_middleware(request, *args, **kwargs):
+            if not self.cacheable(request):
+                return handler(request, *args, **kwargs)
+
+            key = self.key(request)
+            entry = self.store.get(key)
+            if entry is not None:
+                return self.respond(request, entry)
+
+            if request.method == "HEAD":
+                # Bodyless responses are not stored.
+                return handler(request, *args, **kwargs)
+
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = Flight()
+
+            if not leader:
+                logger.debug("Awaiting a concurrent computation.", key=key)
+                if flight.done.wait(self.wait_timeout) and flight.entry:
+                    return self.respond(request, flight.entry)
+                return handler(request, *args, **kwargs)
+
+            try:
+                response = handler(request, *args, **kwargs)
+                entry = flight.entry = self.entry(response)
+                if entry is not None:
+                    self.store.set(key, entry, self.ttl)
+            finally:
+                flight.done.set()
+                with self._lock:
+                    del self._flights[key]
+
+            if entry is not None and (
+                    not_modified := self.not_modified(request, entry)):
+                return not_modified
+            return response
+
+        return caching_middleware
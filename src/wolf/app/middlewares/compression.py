@@ -0,0 +1,134 @@
+import re
+import zlib
+import structlog
+from functools import wraps
+from dataclasses import dataclass
+from collections.abc import Iterator, AsyncIterator
+from kettu.constants import EMPTY_STATUSES
+from kettu.headers import ETag
+from wolf.abc.response import ResponseProtocol, Flush
+from wolf.app.request import negotiate_encoding
+from wolf.pipeline import shareable
+
+
+logger = structlog.get_logger("wolf.app.middlewares.compression")
+
+
+# Window bits of the zlib containers, by content coding.
+WBITS = {"gzip": 31, "deflate": 15}
+
+# Compressed formats gain nothing from another compression.
+INCOMPRESSIBLE = re.compile(
+    r"^(image/(?!svg\+xml)|audio/|video/|font/woff2?"
+    r"|application/(zip|gzip|x-gzip|x-bzip2|x-7z-compressed|x-rar.*"
+    r"|octet-stream|pdf|wasm))"
+)
+
+
+def compressed(compressor, chunk: bytes) -> Iterator[bytes]:
+    """Compressed data of a chunk. Empty chunks and `Flush` markers
+    flush the compressor, so that what was sent so far can be
+    decompressed. The markers are passed on to the buffered bodies.
+    """
+    if chunk:
+        if data := compressor.compress(chunk):
+            yield data
+        return
+    yield compressor.flush(zlib.Z_SYNC_FLUSH)
+    if isinstance(chunk, Flush):
+        yield chunk
+
+
+def compress_stream(
+        chunks: Iterator[bytes], coding: str, level: int
+) -> Iterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, WBITS[coding])
+    for chunk in chunks:
+        yield from compressed(compressor, chunk)
+    yield compressor.flush()
+
+
+async def compress_async_stream(
+        chunks: AsyncIterator[bytes], coding: str, level: int
+) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, WBITS[coding])
+    async for chunk in chunks:
+        for data in compressed(compressor, chunk):
+            yield data
+    yield compressor.flush()
+
+
+@shareable
+@dataclass(kw_only=True)
+class Compression:
+    minimum_size: int = 1024
+    level: int = 6
+    encodings: tuple[str, ...] = ("gzip", "deflate")
+
+    def __post_init__(self):
+        unknown = set(self.encodings) - WBITS.keys()
+        if unknown:
+            raise ValueError(
+                f"Unsupported content coding(s): {', '.join(unknown)}.")
+
+    def compressible(self, response) -> bool:
+        if not isinstance(response, ResponseProtocol):
+            # File responses, coroutines of asynchronous views.
+            return False
+        if response.status in EMPTY_STATUSES or response.body is None:
+            return False
+        headers = response.headers
+        if "Content-Encoding" in headers or "Content-Range" in headers:
+            return False
+        content_type = headers.get("Content-Type")
+        if content_type and INCOMPRESSIBLE.match(content_type.lower()):
+            return False
+        return True
+
+    def compress(self, response, coding: str):
+        body = response.body
+        if isinstance(body, (bytes, str)):
+            if isinstance(body, str):
+                body = body.encode()
+            if len(body) < self.minimum_size:
+                return response
+            response.body = zlib.compress(body, self.level, WBITS[coding])
+            response.headers["Content-Length"] = str(len(response.body))
+        elif isinstance(body, Iterator):
+            response.body = compress_stream(body, coding, self.level)
+            if "Content-Length" in response.headers:
+                del response.headers["Content-Length"]
+        elif isinstance(body, AsyncIterator):
+            response.body = compress_async_stream(body, coding, self.level)
+            if "Content-Length" in response.headers:
+                del response.headers["Content-Length"]
+        else:
+            return response
+
+        response.headers["Content-Encoding"] = coding
+        if header := response.headers.get("ETag"):
+            # The compressed representation is a different one.
+            etag = ETag.from_string(header)
+            response.headers["ETag"] = ETag(
+                f"{etag.value}-{coding}", weak=etag.weak).as_header()
+        return response
+
+    def __call__(self, handler):
+        @wraps(handler)
+        def compression_middleware(request, *args, **kwargs):
+            response = handler(request, *args, **kwargs)
+            if not self.compressible(response):
+                return response
+
+            vary = response.headers.get("Vary", "")
+            if "accept-encoding" not in vary.lower():
+                response.headers.add("Vary", "Accept-Encoding")
+            coding = negotiate_encoding(
+                request.accept_encoding, self.encodings)
+            if coding is None:
+                return response
+
+            logger.debug("Compressing response.", coding=coding)
+            return self.compress(response, coding)
+
+        return compression_middleware
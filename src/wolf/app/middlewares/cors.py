@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from kettu.cors import CORSPolicy
 from wolf.abc.request import RequestProtocol
 from wolf.abc.response import ResponseProtocol
+from wolf.pipeline import shareable
 
 
 logger = structlog.get_logger("wolf.app.middlewares.cors")
 
 
+@shareable
 @dataclass(kw_only=True)
 class CORS:
     policy: CORSPolicy
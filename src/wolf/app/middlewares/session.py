@@ -1,16 +1,91 @@
+import time
 import structlog
 import itsdangerous
+from copy import deepcopy
 from functools import wraps
+from collections.abc import Iterator
 from dataclasses import dataclass
 from http_session.cookie import SameSite, HashAlgorithm, SignedCookieManager
+from http_session.meta import SessionData
 from http_session import Store, Session
+from wolf.abc.response import ResponseProtocol
+from wolf.app.middlewares.cache import MemoryCacheStore
+from wolf.pipeline import shareable
 
 
 logger = structlog.get_logger("wolf.app.middlewares.session")
 
 
+class CachedStore(Store):
+    """Read-through cache of the payloads of a session store.
+    Hot sessions are served locally: the writes of other processes
+    are only seen once the local entries expire. Writing an unchanged
+    payload only touches the session.
+    """
+
+    def __init__(self, store: Store, cache: MemoryCacheStore,
+                 ttl: int | None):
+        self.store = store
+        self.cache = cache
+        self.ttl = ttl
+        self.TTL = store.TTL
+
+    def get(self, sid: str) -> SessionData | None:
+        if (data := self.cache.get(sid)) is not None:
+            # Sessions are modified in place: the entry is kept apart.
+            return deepcopy(data)
+        data = self.store.get(sid)
+        if data is not None:
+            self.cache.set(sid, deepcopy(data), self.ttl)
+        return data
+
+    def set(self, sid: str, session: SessionData):
+        if self.cache.get(sid) == session:
+            self.store.touch(sid)
+            return
+        self.store.set(sid, session)
+        self.cache.set(sid, deepcopy(session), self.ttl)
+
+    def touch(self, sid: str):
+        self.store.touch(sid)
+
+    def flush_expired_sessions(self):
+        self.store.flush_expired_sessions()
+
+    def clear(self, sid: str):
+        self.cache.delete(sid)
+        self.store.clear(sid)
+
+    def delete(self, sid: str):
+        self.cache.delete(sid)
+        self.store.delete(sid)
+
+
+class CookieManager(SignedCookieManager):
+
+    def verify(self, signed: str) -> tuple[str, float]:
+        """Session id and age, in seconds, of a signed cookie value.
+        """
+        sid, timestamp = self._signer.unsign(
+            signed, max_age=self.TTL or None, return_timestamp=True)
+        return str(sid, "utf-8"), time.time() - timestamp.timestamp()
+
+
+@shareable
 @dataclass(kw_only=True)
 class HTTPSession:
+    """Session middleware, keeping the session id in a signed cookie.
+
+    `cache_size` enables a local cache of up to `cache_size` session
+    payloads, read for `cache_ttl` seconds without querying the store.
+    It is only safe when no other process writes to the store, as with
+    a memory store or a single worker: otherwise, a cached session
+    ignores the writes of the other processes until its entry expires,
+    and overwrites them on its next write. It is disabled by default.
+
+    `refresh_after` skips sending again the cookies signed less than
+    `refresh_after` seconds ago.
+    """
     store: Store
     secret: str
     samesite: SameSite = SameSite.lax
@@ -22,10 +97,17 @@ class HTTPSession:
     save_new_empty: bool = False
     salt: str | None = None
     domain: str | None = None
+    cache_size: int = 0
+    cache_ttl: int | None = 30
+    refresh_after: int | None = None
 
     def __post_init__(self):
-        self.manager = SignedCookieManager(
-            self.store,
+        store = self.store
+        if self.cache_size:
+            store = CachedStore(
+                store, MemoryCacheStore(self.cache_size), self.cache_ttl)
+        self.manager = CookieManager(
+            store,
             self.secret,
             salt=self.salt,
             digest=self.digest,
@@ -33,14 +115,29 @@ class HTTPSession:
             cookie_name=self.cookie_name,
         )
 
+    def fresh(self, age: float | None) -> bool:
+        """Cookies signed less than `refresh_after` seconds ago are
+        not signed and sent again.
+        """
+        return (
+            age is not None
+            and self.refresh_after is not None
+            and age < self.refresh_after
+        )
+
+    def persist(self, session: Session, response):
+        if session.modified and response.status < 400:
+            session.persist()
+
     def __call__(self, handler):
         @wraps(handler)
         def http_session_middleware(request, *args, **kwargs):
             new = True
+            age: float | None = None
             if request.cookies:
                 if sig := request.cookies.get(self.manager.cookie_name):
                     try:
-                        sid = str(self.manager.verify_id(sig), "utf-8")
+                        sid, age = self.manager.verify(sig)
                     except itsdangerous.exc.SignatureExpired:
                         # Session expired. We generate a new one.
                         pass
@@ -68,13 +165,24 @@ class HTTPSession:
                         session.new and self.save_new_empty):
                     session.save()
 
-                if session.modified:
-                    if response.status < 400:
-                        session.persist()
+                if isinstance(response, ResponseProtocol) and isinstance(
+                        response.body, Iterator):
+                    # Streamed bodies are rendered while being sent and
+                    # can still modify the session: it is persisted once
+                    # the body is sent. The cookie is sent beforehand.
+                    response.add_finisher(
+                        lambda response: self.persist(session, response))
+
+                # The saves of the request are written at once.
+                elif session.modified:
+                    self.persist(session, response)
 
                 elif session.new:
                     return response
 
+                if self.fresh(age):
+                    return response
+
                 domain = self.domain or request.domain
                 cookie = self.manager.cookie(
                     session.sid,
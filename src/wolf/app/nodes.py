@@ -39,19 +39,98 @@ class Node(ABC, WSGICallable):
         return wsgicallable(environ, start_response)
 
 
+def path_segments(path: str) -> list[str]:
+    """Split a path into its meaningful segments, the way
+    `PurePosixPath` normalizes it: empty and '.' segments are dropped.
+    """
+    return [segment for segment in path.split("/")
+            if segment and segment != "."]
+
+
+class Branch:
+    """Node of the prefix tree compiled by `Mapping`.
+    """
+    __slots__ = ("script", "children")
+
+    script: WSGICallable | None
+    children: dict[str, "Branch"]
+
+    def __init__(self):
+        self.script = None
+        self.children = {}
+
+    def insert(self, segments: t.Sequence[str], script: WSGICallable):
+        branch = self
+        for segment in segments:
+            child = branch.children.get(segment)
+            if child is None:
+                child = branch.children[segment] = Branch()
+            branch = child
+        branch.script = script
+
+    def longest_prefix(
+            self, segments: t.Sequence[str]
+    ) -> tuple[WSGICallable | None, int]:
+        """Returns the script mounted on the longest prefix of the
+        segments, along with the number of segments consumed.
+        """
+        branch = self
+        found, depth = self.script, 0
+        for index, segment in enumerate(segments, 1):
+            branch = branch.children.get(segment)
+            if branch is None:
+                break
+            if branch.script is not None:
+                found, depth = branch.script, index
+        return found, depth
+
+
 class Mapping(Node, UserDict[str, WSGICallable]):
+    """Mounting point of WSGI callables, by path prefix.
+    The registered prefixes are compiled into a prefix tree on
+    mutation, so that a resolution only walks the path segments.
+    The revision is bumped on every mutation.
+    """
+    _index: Branch
+    revision: int
+
+    def __init__(self, *args, **kwargs):
+        self._index = Branch()
+        self.revision = 0
+        super().__init__(*args, **kwargs)
+
     def __setitem__(self, path: str, script: WSGICallable):
-        super().__setitem__(str("/" / PurePosixPath(path)), script)
+        key = str("/" / PurePosixPath(path))
+        super().__setitem__(key, script)
+        self._index.insert(path_segments(key), script)
+        self.revision += 1
+
+    def __delitem__(self, path: str):
+        super().__delitem__(path)
+        self.compile()
+
+    def compile(self):
+        index = Branch()
+        for path, script in self.data.items():
+            index.insert(path_segments(path), script)
+        self._index = index
+        self.revision += 1
+
+    def match(self, environ: WSGIEnviron) -> WSGICallable | None:
+        """Returns the script mounted on the longest matching prefix
+        and rewrites the environ accordingly. Returns None, leaving
+        the environ untouched, if nothing matches.
+        """
+        segments = path_segments(environ["PATH_INFO"])
+        script, depth = self._index.longest_prefix(segments)
+        if script is None:
+            return None
+        if depth:
+            environ["SCRIPT_NAME"] += "/" + "/".join(segments[:depth])
+        environ["PATH_INFO"] = "/" + "/".join(segments[depth:])
+        return script
 
     def resolve(self, environ: WSGIEnviron) -> WSGICallable:
-        uri = PurePosixPath(environ["PATH_INFO"])
-        for current in (uri, *uri.parents):
-            if (script := self.get(str(current))) is not None:
-                if current.parents:
-                    environ["SCRIPT_NAME"] += str(current)
-                if current != uri:
-                    environ["PATH_INFO"] = f"/{uri.relative_to(current)}"
-                else:
-                    environ["PATH_INFO"] = "/"
-                return script
-        raise HTTPError(404)
+        if (script := self.match(environ)) is None:
+            raise HTTPError(404)
+        return script
@@ -2,8 +2,10 @@ import orjson
 import re
 import typing as t
 from http import HTTPStatus
+from tempfile import SpooledTemporaryFile
 from urllib.parse import parse_qsl
-from kettu.parsers.multipart import Multipart
+from multifruits import Parser as MultipartParser
+from multifruits import extract_filename, parse_content_disposition
 from kettu.exceptions import HTTPError
 from kettu.datastructures import Data
 from kettu.headers import ContentType
@@ -11,23 +13,106 @@ from kettu.types import Boundary, Charset, MIMEType
 
 
 MIME_TYPE_REGEX = re.compile(r"^multipart|[-\w.]+/[-\w.\+]+$")
+JSON_STRUCTURE = re.compile(rb'[\[\]{},"\\]')
 
 Parser = t.Callable[[t.IO, MIMEType, Charset | Boundary | None], Data]
 
+UNLIMITED = None
+SPOOL_SIZE = 1024 * 1024
+
+
+class LimitedBody:
+    """Read-only body wrapper. Reads stop at the announced length
+    and a 413 error is raised if more than `limit` bytes are read.
+    """
+    __slots__ = ("body", "limit", "remaining")
+
+    def __init__(self, body: t.IO, limit: int | None,
+                 length: int | None = None):
+        self.body = body
+        self.limit = limit
+        self.remaining = length
+
+    def bounded(self, size: int) -> int:
+        if self.remaining is not None:
+            if size < 0 or size > self.remaining:
+                size = self.remaining
+        if self.limit is not None:
+            if size < 0 or size > self.limit:
+                size = self.limit + 1
+        return size
+
+    def consumed(self, data: bytes) -> bytes:
+        if self.limit is not None:
+            self.limit -= len(data)
+            if self.limit < 0:
+                raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        if self.remaining is not None:
+            self.remaining -= len(data)
+        return data
+
+    def read(self, size: int = -1) -> bytes:
+        return self.consumed(self.body.read(self.bounded(size)))
+
+    def readline(self, size: int = -1) -> bytes:
+        return self.consumed(self.body.readline(self.bounded(size)))
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        while line := self.readline():
+            yield line
+
 
 class BodyParser(dict[MIMEType, Parser]):
+    max_body_size: int | None
+    limits: dict[MIMEType, int | None]
 
-    def register(self, mimetype: str):
+    def __init__(self, *args, max_body_size: int | None = UNLIMITED,
+                 **kwargs):
+        self.max_body_size = max_body_size
+        self.limits = {}
+        super().__init__(*args, **kwargs)
+
+    def register(self, mimetype: str, *, max_body_size: int | None = ...):
         if not MIME_TYPE_REGEX.fullmatch(mimetype):
             raise ValueError(f"{mimetype!r} is not a valid MIME Type.")
 
         def registration(parser: Parser) -> Parser:
             self[mimetype.lower()] = parser
+            if max_body_size is not ...:
+                self.limits[mimetype.lower()] = max_body_size
             return parser
 
         return registration
 
-    def parse(self, body: t.IO, header: str | ContentType) -> Data:
+    def limit_for(self, mimetype: MIMEType) -> int | None:
+        return self.limits.get(mimetype, self.max_body_size)
+
+    def checked_limit(self, mimetype: MIMEType | None,
+                      content_length: int | None = None) -> int | None:
+        """Limit of the bodies of `mimetype`, or of the bodies without
+        a type. Bodies announced as too large are rejected early.
+        """
+        if mimetype is None:
+            limit = self.max_body_size
+        else:
+            limit = self.limit_for(mimetype)
+        if limit is not None and content_length is not None:
+            if content_length > limit:
+                raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        return limit
+
+    def bounded(self, body: t.IO, mimetype: MIMEType,
+                content_length: int | None = None) -> t.IO:
+        """Early-reject bodies announced as too large and wrap the
+        body to enforce the limit while reading.
+        """
+        limit = self.checked_limit(mimetype, content_length)
+        if limit is None and content_length is None:
+            return body
+        return LimitedBody(body, limit, content_length)
+
+    def parse(self, body: t.IO, header: str | ContentType,
+              content_length: int | None = None) -> Data:
         if isinstance(header, str):
             header = ContentType.from_string(header)
         parser = self.get(header.mimetype)
@@ -36,11 +121,101 @@ class BodyParser(dict[MIMEType, Parser]):
                 HTTPStatus.BAD_REQUEST,
                 f"Unknown content type: {header.mimetype!r}.",
             )
+        body = self.bounded(body, header.mimetype, content_length)
         try:
             return parser(body, header.mimetype, **header.options)
         except ValueError as exc:
             raise HTTPError(HTTPStatus.BAD_REQUEST, str(exc)) from exc
 
+    def iter_json(self, body: t.IO, header: str | ContentType,
+                  content_length: int | None = None,
+                  chunk_size: int = 8192) -> t.Iterator[t.Any]:
+        """Yield the items of a JSON array body as they are read.
+        """
+        if isinstance(header, str):
+            header = ContentType.from_string(header)
+        if header.mimetype != "application/json":
+            raise HTTPError(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                f"Expected a JSON body, got {header.mimetype!r}.",
+            )
+        body = self.bounded(body, header.mimetype, content_length)
+        return self._iter_json(body, chunk_size)
+
+    @staticmethod
+    def _iter_json(body: t.IO, chunk_size: int):
+        try:
+            yield from iter_json_array(body, chunk_size)
+        except ValueError as exc:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(exc)) from exc
+
+
+def iter_json_array(body: t.IO, chunk_size: int = 8192) -> t.Iterator:
+    """Incrementally parse a UTF-8 JSON array, yielding its items.
+    Only the bytes of the item being read are kept in memory.
+    """
+    buffer = bytearray()
+    pos = 0  # scanning position
+    start = None  # start of the current item
+    depth = 0
+    in_string = False
+    items = 0
+    done = False
+    while chunk := body.read(chunk_size):
+        buffer += chunk
+        while (match := JSON_STRUCTURE.search(buffer, pos)) is not None:
+            index = match.start()
+            char = buffer[index]
+            if in_string:
+                if char == 0x5c:  # backslash
+                    if index + 1 >= len(buffer):
+                        break  # The escaped character is not read yet.
+                    pos = index + 2
+                    continue
+                pos = index + 1
+                if char == 0x22:  # quote
+                    in_string = False
+                continue
+
+            pos = index + 1
+            if done:
+                raise ValueError("Unexpected data after the JSON array.")
+            if depth == 0:
+                if char != 0x5b or buffer[:index].strip():
+                    raise ValueError("The JSON body is not an array.")
+                depth = 1
+                start = pos
+            elif char == 0x22:
+                in_string = True
+            elif char in b"[{":
+                depth += 1
+            elif char in b"]}":
+                depth -= 1
+                if depth == 0:
+                    item = bytes(buffer[start:index]).strip()
+                    if item:
+                        yield orjson.loads(item)
+                    elif items:
+                        raise ValueError("Trailing comma in JSON array.")
+                    done = True
+            elif char == 0x2c and depth == 1:  # comma
+                yield orjson.loads(bytes(buffer[start:index]))
+                items += 1
+                start = pos
+
+        if done:
+            if buffer[pos:].strip():
+                raise ValueError("Unexpected data after the JSON array.")
+            del buffer[:]
+            pos = 0
+        elif start:
+            del buffer[:start]
+            pos -= start
+            start = 0
+
+    if not done:
+        raise ValueError("Incomplete JSON array.")
+
 
 parser = BodyParser()
 
@@ -61,19 +236,98 @@ def json_parser(
         raise ValueError("Unparsable JSON body.") from exc
 
 
-@parser.register("multipart/form-data")
-def multipart_parser(
-    body: t.IO, mimetype: MIMEType, boundary: t.Optional[Boundary] = None
-) -> Data:
-    if boundary is None:
-        raise ValueError("Missing boundary in Content-Type.")
-    content_parser = Multipart(f";boundary={boundary}")
-    while chunk := body.read(8192):
-        try:
-            content_parser.feed_data(chunk)
-        except ValueError:
-            raise ValueError("Unparsable multipart body.")
-    return Data(form=content_parser.form)
+class SpooledMultipart:
+    """Multipart parser spooling the file parts to disk once they
+    exceed `spool_size` bytes. It handles the events of the
+    `multifruits` parser.
+    """
+    __slots__ = ("form", "spool_size", "parser", "headers", "params", "part")
+
+    form: list[tuple[str, t.Any]]
+    headers: dict[bytes, bytes]
+    params: dict[bytes, bytes]
+
+    def __init__(self, content_type: str, spool_size: int = SPOOL_SIZE):
+        self.form = []
+        self.spool_size = spool_size
+        self.parser = MultipartParser(self, content_type.encode())
+
+    def feed_data(self, data: bytes):
+        self.parser.feed_data(data)
+
+    def on_part_begin(self):
+        self.headers = {}
+
+    def on_header(self, field: bytes, value: bytes):
+        self.headers[field] = value
+
+    def on_headers_complete(self):
+        disposition_type, params = parse_content_disposition(
+            self.headers.get(b"Content-Disposition")
+        )
+        if not disposition_type:
+            raise ValueError("Content-Disposition is missing.")
+
+        self.params = params
+        if b"Content-Type" in self.headers:
+            self.part = SpooledTemporaryFile(max_size=self.spool_size)
+            self.part.filename = extract_filename(params)
+            self.part.size = 0
+            self.part.content_type = self.headers[b"Content-Type"]
+            self.part.params = params
+        else:
+            self.part = bytearray()
+
+    def on_data(self, data: bytes):
+        if isinstance(self.part, bytearray):
+            self.part += data
+        else:
+            self.part.write(data)
+            self.part.size += len(data)
+
+    def on_part_complete(self):
+        name = self.params.get(b"name", b"").decode()
+        part, self.part = self.part, None
+        if isinstance(part, bytearray):
+            # Decoded at once, as a character can span two chunks.
+            if part:
+                self.form.append((name, part.decode()))
+            return
+
+        part.seek(0)
+        if not part.filename:
+            if not part.size:
+                # This is an empty file with no name
+                # We do *not* save it.
+                part.close()
+                return
+            part.filename = str(id(part))
+        self.form.append((name, part))
+
+
+def multipart_parser_factory(spool_size: int = SPOOL_SIZE) -> Parser:
+    """Create a multipart parser spooling the files over `spool_size`.
+    """
+    def multipart_parser(
+        body: t.IO, mimetype: MIMEType, boundary: t.Optional[Boundary] = None
+    ) -> Data:
+        if boundary is None:
+            raise ValueError("Missing boundary in Content-Type.")
+        content_parser = SpooledMultipart(
+            f";boundary={boundary}", spool_size=spool_size)
+        while chunk := body.read(8192):
+            try:
+                content_parser.feed_data(chunk)
+            except ValueError:
+                raise ValueError("Unparsable multipart body.")
+        return Data(form=content_parser.form)
+
+    return multipart_parser
+
+
+multipart_parser = parser.register("multipart/form-data")(
+    multipart_parser_factory()
+)
 
 
 @parser.register("application/x-www-form-urlencoded")
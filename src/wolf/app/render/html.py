@@ -3,7 +3,11 @@ import structlog
 from pathlib import PurePosixPath
 from typing import Sequence
 from functools import partial
+from collections.abc import Iterable, Iterator
 from wolf.rendering.ui import UI
+from wolf.rendering.injection import (
+    ResourceFragments, encoded, inject, inject_stream, render_fragments
+)
 from wolf.app.response import Response, FileWrapperResponse
 from html_resources.resources import Resource
 from html_resources.needed import NeededResources
@@ -14,10 +18,25 @@ logger = structlog.get_logger("wolf.app.render")
 
 class BoundResources(NeededResources):
 
-    def __init__(self, path: str | PurePosixPath, *args, **kwargs):
+    def __init__(self, path: str | PurePosixPath, *args,
+                 fragments: ResourceFragments | None = None, **kwargs):
         self.path = PurePosixPath(path)
+        self.fragments = fragments
         super().__init__(*args, **kwargs)
 
+    def render_fragments(self, base_uri: str = "") -> tuple[bytes, bytes]:
+        """Top and bottom fragments of the needed resources.
+        With `fragments`, they are computed once per resource set
+        and base URI.
+        """
+        url = base_uri / self.path
+        if self.fragments is None:
+            return render_fragments(self.unfold(), url)
+        # The key is ordered: the resources are rendered in the order
+        # of the set, which `precede` can change for the same resources.
+        key = (tuple(self.data), base_uri, self.path)
+        return self.fragments.fetch(key, self.unfold, url)
+
     def apply(self, body: str | bytes, base_uri: str = "") -> bytes:
         if len(self.data) == 0:
             return body
@@ -25,18 +44,31 @@ class BoundResources(NeededResources):
         if isinstance(body, str):
             body = body.encode()
 
-        top = b""
-        bottom = b""
-        for resource in self.unfold():
-            if resource.bottom:
-                bottom += resource.render(base_uri / self.path)
-            else:
-                top += resource.render(base_uri / self.path)
-        if top:
-            body = body.replace(b"</head>", top + b"</head>", 1)
-        if bottom:
-            body = body.replace(b"</body>", bottom + b"</body>", 1)
-        return body
+        top, bottom = self.render_fragments(base_uri)
+        return inject(body, top, bottom)
+
+    def stream(
+            self, chunks: Iterable[str | bytes], base_uri: str = ""
+    ) -> Iterator[bytes]:
+        """Inject the resources in a streamed document.
+        The top resources needed when `</head>` is reached are injected
+        there. The ones needed afterwards, while the rest of the page
+        is rendered, are injected with the bottom ones before `</body>`.
+        """
+        emitted = set()
+
+        def render(head: bool) -> bytes:
+            if not self.data:
+                return b""
+            fragments = []
+            for resource in self.unfold():
+                if resource in emitted or (head and resource.bottom):
+                    continue
+                emitted.add(resource)
+                fragments.append(resource.render(base_uri / self.path))
+            return b"".join(fragments)
+
+        return inject_stream(chunks, render)
 
 
 def html(func=None, *, resources: Sequence[Resource] | None = None):
@@ -49,7 +81,7 @@ def html(func=None, *, resources: Sequence[Resource] | None = None):
         if isinstance(content, (Response, FileWrapperResponse)):
             return content
 
-        if not isinstance(content, str):
+        if not isinstance(content, (str, Iterator)):
             raise TypeError(f"Unable to render type: {type(content)}.")
 
         request = args[0]
@@ -62,11 +94,20 @@ def html(func=None, *, resources: Sequence[Resource] | None = None):
                 needed_resources.precede(ui.resources)
             if resources:
                 needed_resources.update(resources)
+            if isinstance(content, Iterator):
+                # Resources needed while streaming use the same set.
+                request.context.register_local_value(
+                    BoundResources, needed_resources)
+                return request.response_cls.html(
+                    body=needed_resources.stream(
+                        content, request.application_uri))
             content = needed_resources.apply(
                 content,
                 request.application_uri
             )
 
+        if isinstance(content, Iterator):
+            content = encoded(content)
         return request.response_cls.html(body=content)
 
     if func is None:
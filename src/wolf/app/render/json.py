@@ -1,4 +1,5 @@
 import wrapt
+from collections.abc import Iterator
 from wolf.app.response import Response
 
 
@@ -10,6 +11,10 @@ def json(wrapped, instance, args, kwargs) -> Response:
     if isinstance(content, Response):
         return content
 
+    if isinstance(content, Iterator):
+        # Generators are streamed, once the request context is closed.
+        return request.response_cls.stream_json(request.deferred(content))
+
     if not isinstance(content, (dict, list)):
         raise TypeError(f"Unable to render type: {type(content)}.")
 
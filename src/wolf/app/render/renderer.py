@@ -1,5 +1,6 @@
 import wrapt
 import functools
+from collections.abc import Callable, Iterator
 from wolf.rendering.ui import UI
 from wolf.app.request import Request
 from wolf.app.response import Response
@@ -7,15 +8,40 @@ from wolf.app.services.translation import Locale, Translator
 from chameleon.zpt.template import PageTemplate
 
 
+# Rendered in place of the content, to split the layout around it.
+CONTENT_MARKER = "<!--wolf:content-->"
+
+
+def stream_content(render: Callable[[], str]) -> Iterator[str]:
+    yield render()
+
+
+def stream_layout(
+        layout, request, view, context, name: str, render: Callable[[], str]
+) -> Iterator[str]:
+    """The layout is sent before the content is rendered.
+    It falls back to a single chunk if the layout alters its content.
+    """
+    page = layout(request, view, context, name=name, content=CONTENT_MARKER)
+    head, marker, tail = page.partition(CONTENT_MARKER)
+    if not marker:
+        yield layout(request, view, context, name=name, content=render())
+        return
+    yield head
+    yield render()
+    yield tail
+
+
 def renderer(
     func=None,
     *,
     template: PageTemplate | str | None = None,
     layout_name: str | None = "",
+    stream: bool = False,
 ):
     @wrapt.decorator
     def rendering_wrapper(
-            wrapped, instance, args, kwargs) -> str | Response:
+            wrapped, instance, args, kwargs) -> str | Iterator[str] | Response:
         content = wrapped(*args, **kwargs)
 
         if isinstance(content, Response):
@@ -48,14 +74,15 @@ def renderer(
                 Translator, default=None
             )
             locale: str | None = request.get(Locale, default=None)
-            rendered = tpl.render(
+            render = functools.partial(
+                tpl.render,
                 **namespace,
                 translate=translator and translator.translate or None,
                 target_language=locale,
             )
 
         elif isinstance(content, str):
-            rendered = content
+            render = functools.partial(str, content)
         else:
             raise TypeError(f"Unable to render type: {type(content)}.")
 
@@ -67,12 +94,21 @@ def renderer(
             context = namespace["context"]
             layout = ui.layouts.fetch(
                 request, view, context, name=layout_name)
+            if stream:
+                return request.deferred(stream_layout(
+                    layout, request, view, context, layout_name, render))
             return layout(
-                request, view, context, name=layout_name, content=rendered)
+                request, view, context, name=layout_name, content=render())
 
-        return rendered
+        if stream:
+            return request.deferred(stream_content(render))
+        return render()
 
     if func is None:
         return functools.partial(
-            renderer, template=template, layout_name=layout_name)
+            renderer,
+            template=template,
+            layout_name=layout_name,
+            stream=stream,
+        )
     return rendering_wrapper(func)
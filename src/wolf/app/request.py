@@ -1,6 +1,8 @@
 import svcs
 import typing as t
 import urllib.parse
+from operator import attrgetter
+from functools import lru_cache
 from contextlib import contextmanager
 from datetime import datetime
 from svcs.exceptions import ServiceNotFoundError
@@ -11,6 +13,8 @@ from wolf.utils import immutable_cached_property
 from wolf.abc.request import RequestProtocol
 from wolf.app.parsers import parser
 from wolf.app.response import Response, FileWrapperResponse
+from wolf.asgi.bridge import read_body, environ_from_scope
+from wolf.asgi.types import Scope, Receive
 from wolf.wsgi.types import WSGIEnviron
 
 
@@ -22,36 +26,140 @@ ALL_LANGUAGES = headers.Languages([])
 ALL_ETAGS = headers.ETags([])
 
 UNSET = object()
+MISSING = object()
 
 
-def header_property(
-        name: str,
-        *,
-        caster=None,
-        default=UNSET,
-        on_missing: int = 400
-):
-    """Create a read-only cached header property.
+def shared_parser(parser: t.Callable[[str], T], maxsize: int = 512):
+    """Memoize a header parser on the raw header string.
+    The parsed values are shared across requests.
     """
-    def getter(request: RequestProtocol):
-        try:
-            value = request.environ[name]
-            if caster is not None:
-                value = caster(value)
-        except KeyError as exc:
-            if default is UNSET:
-                raise HTTPError(on_missing) from exc
-            value = default
+    return lru_cache(maxsize=maxsize)(parser)
+
+
+parse_accept = shared_parser(headers.Accept.from_string)
+parse_accept_language = shared_parser(headers.Languages.from_string)
+parse_authorization = shared_parser(headers.Authorization.from_string)
+parse_content_type = shared_parser(headers.ContentType.from_string)
+_parse_cookies = shared_parser(headers.Cookies.from_string)
+
+
+def parse_cookies(value: str) -> headers.Cookies:
+    # Cookies are mutable: each request gets its own mapping.
+    # The parsed values are strings, safe to share.
+    return headers.Cookies(_parse_cookies(value))
+
+
+@shared_parser
+def parse_accept_encoding(value: str) -> tuple[tuple[str, float], ...]:
+    """Content codings of an Accept-Encoding header, with their
+    quality, by descending quality.
+    """
+    codings = []
+    for item in value.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith(("q=", "Q=")):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        codings.append((coding, quality))
+    codings.sort(key=lambda pair: pair[1], reverse=True)
+    return tuple(codings)
+
+
+def negotiate_encoding(
+        accepted: t.Sequence[tuple[str, float]],
+        available: t.Iterable[str]
+) -> str | None:
+    """Pick the preferred coding among the available ones.
+    The available codings are given by order of preference.
+    None means the identity coding.
+    """
+    if not accepted:
+        return None
+    qualities = dict(accepted)
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    # The identity is always acceptable, unless explicitly refused,
+    # but a coding of the same quality is preferred.
+    if best_quality < qualities.get("identity", wildcard or 0.001):
+        return None
+    return best
+
+
+HeaderSpec = tuple[str, t.Callable[[str], t.Any] | None, t.Any, int]
+
+
+class header_property:
+    """Read-only cached header property.
+    The header specification is appended to the `header_table` of the
+    owner class and the value is cached at the matching index of the
+    request header values.
+    """
+    __slots__ = ('spec', 'index')
+
+    spec: HeaderSpec
+    index: int | None
+
+    def __init__(
+            self,
+            name: str,
+            *,
+            caster=None,
+            default=UNSET,
+            on_missing: int = 400
+    ):
+        self.spec = (name, caster, default, on_missing)
+        self.index = None
+
+    def __set_name__(self, owner, attrname: str):
+        table = owner.__dict__.get('header_table')
+        if table is None:
+            table = getattr(owner, 'header_table', ())
+        self.index = len(table)
+        owner.header_table = (*table, self.spec)
+
+    def __get__(self, request, owner=None):
+        if request is None:
+            return self
+        value = request.header_values[self.index]
+        if value is MISSING:
+            name, caster, default, on_missing = (
+                request.header_table[self.index])
+            try:
+                value = request.environ[name]
+                if caster is not None:
+                    value = caster(value)
+            except KeyError as exc:
+                if default is UNSET:
+                    raise HTTPError(on_missing) from exc
+                value = default
+            request.header_values[self.index] = value
         return value
 
-    return immutable_cached_property(getter)
+    def __set__(self, request, value):
+        raise AttributeError("can't set attribute")
+
+    def __delete__(self, request):
+        request.header_values[self.index] = MISSING
 
 
 class Request(RequestProtocol[WSGIEnviron]):
 
-    __slots__ = ('environ', 'context', 'response_cls')
+    __slots__ = ('environ', 'context', 'response_cls', 'header_values')
 
-    context: svcs.Container | None
+    header_table: t.ClassVar[tuple[HeaderSpec, ...]] = ()
+    header_values: list[t.Any]
+    context: 'RequestContext | None'
     response_cls: type[Response] | type[FileWrapperResponse]
 
     def __init__(
@@ -62,19 +170,39 @@ class Request(RequestProtocol[WSGIEnviron]):
         self.context = None
         self.environ = environ
         self.response_cls = response_cls
+        self.header_values = [MISSING] * len(self.header_table)
 
     @contextmanager
     def __call__(self, registry: svcs.Registry) -> 'Request':
-        with svcs.Container(registry) as context:
-            context.register_local_factory(
-                headers.Cookies, lambda: self.cookies)
-            context.register_local_factory(
-                headers.Query, lambda: self.query)
-            context.register_local_factory(Data, lambda: self.data)
-            context.register_local_value(Request, self)
-            self.context = context
+        context = self.context = RequestContext(self, registry)
+        try:
             yield self
-        self.context = None
+        finally:
+            context.close()
+            self.context = None
+
+    def deferred(self, chunks: t.Iterator[T]) -> t.Iterator[T]:
+        """Iterate over `chunks` within the request context, even once
+        the response is returned and the context closed, as when a body
+        is rendered while being sent. Local values are kept; services
+        are created anew and closed once the chunks are exhausted.
+        """
+        context = self.context
+        if context is None:
+            raise NotImplementedError('Context is unavailable.')
+
+        def reattached():
+            if self.context is context:
+                yield from chunks
+                return
+            self.context = context
+            try:
+                yield from chunks
+            finally:
+                context.close()
+                self.context = None
+
+        return reattached()
 
     def get(self, t: type[T], *, default=NONE_PROVIDED):
         if self.context is None:
@@ -100,7 +228,7 @@ class Request(RequestProtocol[WSGIEnviron]):
 
     cookies: headers.Cookies | None = header_property(
         "HTTP_COOKIE",
-        caster=headers.Cookies.from_string,
+        caster=parse_cookies,
         default=None
     )
 
@@ -116,7 +244,7 @@ class Request(RequestProtocol[WSGIEnviron]):
 
     content_type: headers.ContentType | None = header_property(
         "CONTENT_TYPE",
-        caster=headers.ContentType.from_string,
+        caster=parse_content_type,
         default=None
     )
 
@@ -142,22 +270,28 @@ class Request(RequestProtocol[WSGIEnviron]):
 
     accept: headers.Accept = header_property(
         "HTTP_ACCEPT",
-        caster=headers.Accept.from_string,
+        caster=parse_accept,
         default=ACCEPT_ALL
     )
 
     authorization: headers.Authorization = header_property(
         "HTTP_AUTHORIZATION",
-        caster=headers.Authorization.from_string,
+        caster=parse_authorization,
         default=None
     )
 
     accept_language: headers.Languages = header_property(
         "HTTP_ACCEPT_LANGUAGE",
-        caster=headers.Languages.from_string,
+        caster=parse_accept_language,
         default=ALL_LANGUAGES
     )
 
+    accept_encoding: tuple[tuple[str, float], ...] = header_property(
+        "HTTP_ACCEPT_ENCODING",
+        caster=parse_accept_encoding,
+        default=()
+    )
+
     range: headers.Ranges | None = header_property(
         "HTTP_RANGE",
         caster=headers.Ranges.from_string
@@ -165,11 +299,13 @@ class Request(RequestProtocol[WSGIEnviron]):
 
     if_match: headers.ETags = header_property(
         "HTTP_IF_MATCH",
+        caster=headers.ETags.from_string,
         default=ALL_ETAGS
     )
 
     if_none_match: headers.ETags = header_property(
         "HTTP_IF_NONE_MATCH",
+        caster=headers.ETags.from_string,
         default=ALL_ETAGS
     )
 
@@ -216,6 +352,143 @@ class Request(RequestProtocol[WSGIEnviron]):
         if self.content_type:
             return parser.parse(
                 self.environ["wsgi.input"],
-                self.content_type
+                self.content_type,
+                content_length=self.content_length
             )
         return Data()
+
+    def iter_json(self, chunk_size: int = 8192) -> t.Iterator[t.Any]:
+        """Iterate over the items of a JSON array body, as it is read.
+        The body is consumed: it cannot be used along with `data`.
+        """
+        if not self.content_type:
+            raise HTTPError(415)
+        return parser.iter_json(
+            self.environ["wsgi.input"],
+            self.content_type,
+            content_length=self.content_length,
+            chunk_size=chunk_size
+        )
+
+
+def request_attribute(name: str):
+    """Factory of a request-bound service, for the backing container.
+    """
+    getter = attrgetter(name)
+
+    def factory(svcs_container: svcs.Container):
+        return getter(svcs_container.get(Request))
+    return factory
+
+
+class RequestContext:
+    """Request-scoped service container.
+    Request-bound services and local values are served directly.
+    The backing `svcs.Container` is only created when a service of
+    the registry is first requested.
+    """
+
+    __slots__ = ('request', 'registry', '_values', '_container')
+
+    attributes: t.ClassVar[dict[type, str]] = {
+        headers.Cookies: 'cookies',
+        headers.Query: 'query',
+        Data: 'data',
+    }
+    providers: t.ClassVar[dict[type, t.Callable[[Request], t.Any]]] = {
+        cls: attrgetter(name) for cls, name in attributes.items()
+    }
+    factories: t.ClassVar[dict[type, t.Callable]] = {
+        cls: request_attribute(name) for cls, name in attributes.items()
+    }
+
+    request: Request
+    registry: svcs.Registry
+    _values: dict[type, t.Any] | None
+    _container: svcs.Container | None
+
+    def __init__(self, request: Request, registry: svcs.Registry):
+        self.request = request
+        self.registry = registry
+        self._values = None
+        self._container = None
+
+    @property
+    def container(self) -> svcs.Container:
+        if self._container is None:
+            container = svcs.Container(self.registry)
+            container.register_local_value(Request, self.request)
+            for cls, factory in self.factories.items():
+                container.register_local_factory(cls, factory)
+            if self._values:
+                for cls, value in self._values.items():
+                    container.register_local_value(cls, value)
+            self._container = container
+        return self._container
+
+    def register_local_value(self, svc_type: type, value: t.Any):
+        if self._values is None:
+            self._values = {svc_type: value}
+        else:
+            self._values[svc_type] = value
+        if self._container is not None:
+            self._container.register_local_value(svc_type, value)
+
+    def register_local_factory(self, svc_type: type, factory: t.Callable):
+        if self._values is not None:
+            self._values.pop(svc_type, None)
+        self.container.register_local_factory(svc_type, factory)
+
+    def get(self, svc_type: type[T]) -> T:
+        if self._values is not None and svc_type in self._values:
+            return self._values[svc_type]
+        if svc_type is Request or svc_type is type(self.request):
+            return self.request
+        if (provider := self.providers.get(svc_type)) is not None:
+            return provider(self.request)
+        if self._container is None and svc_type not in self.registry:
+            raise ServiceNotFoundError(svc_type)
+        return self.container.get(svc_type)
+
+    def close(self):
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
+
+class ASGIRequest(Request):
+    """Request built from an ASGI HTTP scope.
+    The scope is exposed as a WSGI environ, with a fully received body,
+    in order to share the header accessors and the body parsing.
+    """
+
+    __slots__ = ('scope',)
+
+    scope: Scope
+
+    def __init__(
+            self,
+            scope: Scope,
+            environ: WSGIEnviron,
+            response_cls: type[Response] | type[FileWrapperResponse] = Response
+    ):
+        self.scope = scope
+        super().__init__(environ, response_cls=response_cls)
+
+    @classmethod
+    async def from_scope(
+            cls,
+            scope: Scope,
+            receive: Receive,
+            response_cls: type[Response] | type[FileWrapperResponse] = Response
+    ) -> 'ASGIRequest':
+        environ = environ_from_scope(scope, None)
+        request = cls(scope, environ, response_cls=response_cls)
+        # Bodies over the parser limit are neither read nor spooled.
+        content_type = request.content_type
+        limit = parser.checked_limit(
+            content_type.mimetype if content_type else None,
+            request.content_length
+        )
+        environ["wsgi.input"] = await read_body(receive, limit=limit)
+        return request
@@ -1,15 +1,19 @@
 import structlog
+import typing as t
+from functools import lru_cache
 from dataclasses import dataclass, field
 from autorouting import MatchedRoute
 from autorouting.url import RouteURL
 from kettu.exceptions import HTTPError
 from wolf.app import Application
+from wolf.abc.request import RequestProtocol
 from wolf.abc.resolvers import URIResolver
 from wolf.abc.resolvers.traject import ContextRegistry, ViewRegistry
-from wolf.abc.resolvers import Located, Params, Extra
+from wolf.abc.resolvers import Location, Params, Extra
 
 
 logger = structlog.get_logger("wolf.app.resolvers")
+route_url = lru_cache(maxsize=1024)(RouteURL.from_path)
 
 
 class PathFragment(str):
@@ -31,9 +35,10 @@ class TrajectResolver(URIResolver):
 
     def resolve(self, request):
         app = request.get(Application)
-        leaf, view_path = self.contexts.resolve(
+        location, view_path = self.contexts.resolve(
             app, request.path, 'GET', request, partial=True
         )
+        leaf = location.object
 
         if not view_path.startswith('/'):
             view_path = f'/{view_path}'
@@ -49,6 +54,7 @@ class TrajectResolver(URIResolver):
         params = request.get(Params)
         params |= view.params
         request.context.register_local_value(MatchedRoute, view)
+        request.context.register_local_value(Location, location)
         return view.component(request, context=leaf)
 
     def path_for(
@@ -56,29 +62,64 @@ class TrajectResolver(URIResolver):
             source: object,
             name: str,
             target: object | None = None,
+            *,
+            request: RequestProtocol | None = None,
             **namespace
     ) -> str:
-        if type(source) is Located:
-            root_path = PathFragment(source.__path__)
-        else:
-            root_path = PathFragment('/')
+        return self.paths_for(
+            source, ((name, target, namespace),), request=request)[0]
 
-        if target is not None and source.__class__ is not target.__class__:
-            traversal_path = self.contexts.reverse(
-                target.__class__,
-                source.__class__
+    def paths_for(
+            self,
+            source: object,
+            links: t.Iterable[tuple[str, object | None, dict[str, t.Any]]],
+            *,
+            request: RequestProtocol | None = None
+    ) -> list[str]:
+        """Resolve many `(name, target, namespace)` links from the
+        same source, sharing the root path and the traversal lookups.
+        The source can be given as a `Location` to prefix its path.
+        A plain source is looked up as the current `Location` of the
+        request, when given. A plain source built by a context factory
+        has no known path: a `LookupError` is raised.
+        """
+        if request is not None and type(source) is not Location:
+            location = request.get(Location, default=None)
+            if location is not None and location.object is source:
+                source = location
+
+        if type(source) is not Location and self.contexts.traversed(
+                source.__class__):
+            raise LookupError(
+                f"No location for {source!r}: pass its Location, "
+                "or the request it was resolved for."
             )
 
-            factory_path, unmatched = RouteURL.from_path(
-                traversal_path
-            ).resolve(namespace, qstring=False)
+        if type(source) is Location:
+            root_path = PathFragment(source.path)
+            source = source.object
         else:
-            factory_path = ''
-            unmatched = {}
-            target = source
+            root_path = PathFragment('/')
 
-        view_path = self.views.route_for(target, name, **unmatched)
-        return '/' + (root_path / factory_path / view_path)
+        resolved = []
+        for name, target, namespace in links:
+            if target is not None and (
+                    source.__class__ is not target.__class__):
+                traversal_path = self.contexts.reverse(
+                    target.__class__,
+                    source.__class__
+                )
+                factory_path, unmatched = route_url(
+                    traversal_path
+                ).resolve(namespace, qstring=False)
+            else:
+                factory_path = ''
+                unmatched = {}
+                target = source
+
+            view_path = self.views.route_for(target, name, **unmatched)
+            resolved.append('/' + (root_path / factory_path / view_path))
+        return resolved
 
     def __or__(self, other: "TrajectResolver") -> "TrajectResolver":
         return TrajectResolver(
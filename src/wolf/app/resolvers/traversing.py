@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from kettu.exceptions import HTTPError
-from wolf.abc.resolvers import URIResolver, Params, Extra
+from wolf.abc.resolvers import URIResolver, Location, Params, Extra
 from wolf.abc.resolvers.routing import MatchedRoute
 from wolf.abc.resolvers.traject import ViewRegistry
 from wolf.abc.resolvers.traversing import Publisher, PublicationRoot
@@ -14,7 +14,8 @@ class TraversingResolver(URIResolver):
 
     def resolve(self, request):
         root = request.get(PublicationRoot)
-        leaf, view_path = self.publisher.publish(request, root)
+        location, view_path = self.publisher.publish(request, root)
+        leaf = location.object
 
         if not view_path.startswith('/'):
             view_path = f'/{view_path}'
@@ -30,6 +31,7 @@ class TraversingResolver(URIResolver):
         params = request.get(Params)
         params.update(view.params)
         request.context.register_local_value(MatchedRoute, view)
+        request.context.register_local_value(Location, location)
         return view.component(request, context=leaf)
 
     def path_for(self, *args, **kwargs):
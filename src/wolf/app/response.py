@@ -1,10 +1,33 @@
+import os
+import re
+import mmap
+import asyncio
+import secrets
 from io import BytesIO
 from pathlib import Path
+from http import HTTPStatus
+from datetime import datetime, timezone
 from typing import Iterable
+from collections.abc import Iterator, AsyncIterator, Sequence
+from kettu.constants import EMPTY_STATUSES
+from kettu.exceptions import HTTPError
+from kettu.headers import ETag, ETags
+from kettu.headers.ranges import Ranges, consolidate_ranges
+from kettu.response import ResponseHeaders
+from kettu.types import HTTPCode
+from wolf.abc.request import RequestProtocol
 from wolf.abc.response import ResponseProtocol, FileResponseProtocol
+from wolf.abc.response import HeadersT, STATUS_LINES
+from wolf.asgi.bridge import DONE, encode_headers
+from wolf.asgi.types import Scope, Receive, Send
 from wolf.wsgi.types import WSGIEnviron, WSGICallable, StartResponse, Finisher
 
 
+MMAP_THRESHOLD = 256 * 1024
+MMAP_BLOCK_SIZE = 64 * 1024
+ZERO_SUFFIX = re.compile(r"\s*-0+\s*")
+
+
 class Response(WSGICallable, ResponseProtocol[Finisher]):
 
     def close(self):
@@ -19,26 +42,332 @@ class Response(WSGICallable, ResponseProtocol[Finisher]):
     def __call__(
         self, environ: WSGIEnviron, start_response: StartResponse
     ) -> Iterable[bytes]:
-        status = f"{self.status.value} {self.status.phrase}"
-        start_response(status, list(self.headers.items()))
+        start_response(STATUS_LINES[self.status], self.header_list())
         return self
 
+    async def asgi(self, scope: Scope, receive: Receive, send: Send):
+        """ASGI counterpart of `__call__`. Asynchronous iterators are
+        accepted as body, synchronous ones are iterated in a worker
+        thread. The finishers are run once the body is sent.
+        """
+        await send({
+            "type": "http.response.start",
+            "status": self.status.value,
+            "headers": encode_headers(self.header_list()),
+        })
+        try:
+            if isinstance(self.body, AsyncIterator):
+                if self.status not in EMPTY_STATUSES:
+                    async for chunk in self.body:
+                        await send({
+                            "type": "http.response.body",
+                            "body": chunk,
+                            "more_body": True
+                        })
+                await send({"type": "http.response.body", "body": b""})
+            elif isinstance(self.body, Iterator):
+                # Synchronous bodies may block: chunks are pulled
+                # in a worker thread.
+                chunks = iter(self)
+                try:
+                    while (chunk := await asyncio.to_thread(
+                            next, chunks, DONE)) is not DONE:
+                        await send({
+                            "type": "http.response.body",
+                            "body": chunk,
+                            "more_body": True
+                        })
+                finally:
+                    chunks.close()
+                await send({"type": "http.response.body", "body": b""})
+            else:
+                await send({
+                    "type": "http.response.body",
+                    "body": b"".join(self)
+                })
+        finally:
+            self.close()
+
+
+def file_etag(stat: os.stat_result) -> ETag:
+    """Validator of a file on disk, from its modification time and size.
+    """
+    return ETag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+
+
+def etag_matches(etags: ETags, etag: ETag, weak: bool = False) -> bool:
+    for candidate in etags:
+        if candidate.value == "*":
+            return True
+        if weak and candidate.value == etag.value:
+            return True
+        if candidate.compare(etag):
+            return True
+    return False
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def precondition_status(
+        request: RequestProtocol, etag: ETag, modified: datetime
+) -> HTTPStatus | None:
+    """Evaluate the conditional headers of the request against the
+    validators of the resource, following RFC 9110, section 13.2.2.
+    Unparsable conditions are ignored.
+    """
+    environ = request.environ
+    safe = request.method in ("GET", "HEAD")
+    try:
+        if "HTTP_IF_MATCH" in environ:
+            if not etag_matches(request.if_match, etag):
+                return HTTPStatus.PRECONDITION_FAILED
+        elif (since := request.if_unmodified_since) is not None:
+            if modified > as_utc(since):
+                return HTTPStatus.PRECONDITION_FAILED
+
+        if "HTTP_IF_NONE_MATCH" in environ:
+            if etag_matches(request.if_none_match, etag, weak=True):
+                if safe:
+                    return HTTPStatus.NOT_MODIFIED
+                return HTTPStatus.PRECONDITION_FAILED
+        elif safe and (since := request.if_modified_since) is not None:
+            if modified <= as_utc(since):
+                return HTTPStatus.NOT_MODIFIED
+    except (ValueError, HTTPError):
+        pass
+    return None
+
+
+def parse_ranges(value: str) -> Ranges:
+    """Parse a Range header. Zero-length suffix ranges (`-0`) are
+    valid but rejected by the kettu parser: they are left out, as
+    they can't be satisfied.
+    """
+    unit, _, specs = value.partition("=")
+    kept = [
+        spec for spec in specs.split(",")
+        if not ZERO_SUFFIX.fullmatch(spec)
+    ]
+    if not kept:
+        return Ranges(unit=unit, values=())
+    return Ranges.from_string(f"{unit}={','.join(kept)}")
+
+
+def requested_ranges(
+        request: RequestProtocol, size: int,
+        etag: ETag, modified: datetime
+) -> list[tuple[int, int]] | None:
+    """Satisfiable byte ranges of a GET request, in ascending order,
+    overlapping ranges merged. None means the whole representation.
+    An empty list means that no range can be satisfied.
+    """
+    environ = request.environ
+    if request.method != "GET" or "HTTP_RANGE" not in environ:
+        return None
+    try:
+        if "HTTP_IF_RANGE" in environ:
+            condition = request.if_range
+            if isinstance(condition, ETag):
+                if not condition.compare(etag):
+                    return None
+            elif condition is None or as_utc(condition) != modified:
+                return None
+        ranges = parse_ranges(environ["HTTP_RANGE"])
+    except (ValueError, HTTPError):
+        # Invalid ranges are ignored.
+        return None
+    if ranges is None or ranges.unit != "bytes":
+        return None
+    values = [
+        (first, last) for first, last in ranges.resolve(size).values
+        if first <= last
+    ]
+    if len(values) > 1:
+        values = list(consolidate_ranges(values))
+    return values
+
 
 class FileWrapperResponse(WSGICallable, FileResponseProtocol):
+    """Response streaming a file. The optional `segments` describe
+    the body: literal bytes or `(first, last)` inclusive byte ranges
+    of the file. Without segments, the whole file is sent.
+    """
+    segments: Sequence[bytes | tuple[int, int]] | None
 
-    def __call__(self, environ: WSGIEnviron, start_response: StartResponse):
-        status = f"{self.status.value} {self.status.phrase}"
-        start_response(status, list(self.headers.items()))
+    def __init__(
+            self,
+            file_: Path | BytesIO,
+            status: HTTPCode = 200,
+            block_size: int = 4096,
+            headers: HeadersT | None = None,
+            segments: Sequence[bytes | tuple[int, int]] | None = None,
+    ):
+        super().__init__(
+            file_, status=status, block_size=block_size, headers=headers)
+        self.segments = segments
 
+    @classmethod
+    def serve(
+            cls,
+            request: RequestProtocol,
+            path: Path,
+            headers: HeadersT | None = None,
+            block_size: int = 4096,
+    ) -> "Response | FileWrapperResponse":
+        """Serve a file on disk for the request, with validators,
+        conditional requests and byte ranges handling.
+        """
+        stat = path.stat()
+        size = stat.st_size
+        etag = file_etag(stat)
+        modified = datetime.fromtimestamp(int(stat.st_mtime), timezone.utc)
+
+        headers = ResponseHeaders(headers)
+        headers.etag = etag
+        headers.last_modified = modified
+        headers.accept_ranges = "bytes"
+
+        status = precondition_status(request, etag, modified)
+        if status is not None:
+            return Response(status, body=b"", headers=headers)
+
+        ranges = requested_ranges(request, size, etag, modified)
+        if ranges is None:
+            headers["Content-Length"] = str(size)
+            if request.method == "HEAD":
+                return Response(200, body=b"", headers=headers)
+            return cls(path, block_size=block_size, headers=headers)
+
+        if not ranges:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(
+                HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+                body=b"", headers=headers
+            )
+
+        if len(ranges) == 1:
+            first, last = ranges[0]
+            headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+            headers["Content-Length"] = str(last - first + 1)
+            return cls(path, status=206, block_size=block_size,
+                       headers=headers, segments=ranges)
+
+        boundary = secrets.token_hex(16)
+        content_type = headers.get("Content-Type")
+        segments = []
+        length = 0
+        for first, last in ranges:
+            part = f"--{boundary}\r\n"
+            if content_type:
+                part += f"Content-Type: {content_type}\r\n"
+            part += f"Content-Range: bytes {first}-{last}/{size}\r\n\r\n"
+            part = (b"\r\n" if segments else b"") + part.encode()
+            segments.extend((part, (first, last)))
+            length += len(part) + last - first + 1
+        closing = f"\r\n--{boundary}--\r\n".encode()
+        segments.append(closing)
+        headers["Content-Type"] = f"multipart/byteranges; boundary={boundary}"
+        headers["Content-Length"] = str(length + len(closing))
+        return cls(path, status=206, block_size=block_size,
+                   headers=headers, segments=segments)
+
+    def open(self):
         if isinstance(self.file_, Path):
-            filelike = self.file_.open("rb")
+            return self.file_.open("rb")
         elif isinstance(self.file_, BytesIO):
-            filelike = self.file_
-        else:
-            raise TypeError(
-                "Response file should be a Path or a BytesIO object.")
+            return self.file_
+        raise TypeError(
+            "Response file should be a Path or a BytesIO object.")
+
+    def chunks(self) -> Iterator[bytes]:
+        """Read the body by blocks. Large files on disk are memory
+        mapped, sparing a read system call per block: the blocks are
+        still copied from the mapping, as bodies are made of bytes.
+        The file is only opened once the iteration starts, so closing
+        the iterator beforehand leaves nothing open.
+        """
+        filelike = self.open()
+        mapped = None
+        try:
+            if isinstance(self.file_, Path):
+                size = os.fstat(filelike.fileno()).st_size
+                if size >= MMAP_THRESHOLD:
+                    mapped = mmap.mmap(
+                        filelike.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if self.segments is None:
+                if mapped is not None:
+                    yield from self.slices(mapped, 0, len(mapped) - 1)
+                else:
+                    while chunk := filelike.read(self.block_size):
+                        yield chunk
+                return
+
+            for segment in self.segments:
+                if isinstance(segment, bytes):
+                    yield segment
+                elif mapped is not None:
+                    yield from self.slices(mapped, *segment)
+                else:
+                    first, last = segment
+                    filelike.seek(first)
+                    remaining = last - first + 1
+                    while remaining > 0 and (chunk := filelike.read(
+                            min(self.block_size, remaining))):
+                        remaining -= len(chunk)
+                        yield chunk
+        finally:
+            if mapped is not None:
+                mapped.close()
+            filelike.close()
 
-        if 'wsgi.file_wrapper' in environ:
-            return environ['wsgi.file_wrapper'](filelike, self.block_size)
+    def slices(self, mapped: mmap.mmap, first: int, last: int):
+        # Each slice is a copy: blocks are at least 64KiB to copy
+        # and send less often.
+        block_size = max(self.block_size, MMAP_BLOCK_SIZE)
+        for offset in range(first, last + 1, block_size):
+            yield mapped[offset:min(offset + block_size, last + 1)]
+
+    def __call__(self, environ: WSGIEnviron, start_response: StartResponse):
+        start_response(
+            STATUS_LINES[self.status], list(self.headers.items()))
+
+        if self.segments is None and 'wsgi.file_wrapper' in environ:
+            # The server may use a zero-copy `sendfile`.
+            return environ['wsgi.file_wrapper'](self.open(), self.block_size)
+
+        return self.chunks()
+
+    async def asgi(self, scope: Scope, receive: Receive, send: Send):
+        """ASGI counterpart of `__call__`. Files on disk are handed
+        to the server if it supports the `http.response.pathsend`
+        extension. Otherwise, blocks are read in a worker thread.
+        """
+        await send({
+            "type": "http.response.start",
+            "status": self.status.value,
+            "headers": encode_headers(self.headers.items()),
+        })
+        if self.segments is None and isinstance(self.file_, Path) and (
+                "http.response.pathsend" in scope.get("extensions", {})):
+            await send({
+                "type": "http.response.pathsend",
+                "path": str(self.file_.resolve())
+            })
+            return
 
-        return iter(lambda: filelike.read(self.block_size), '')
+        chunks = self.chunks()
+        try:
+            while chunk := await asyncio.to_thread(next, chunks, b""):
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": True
+                })
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            chunks.close()
@@ -0,0 +1,171 @@
+import os
+import re
+import gzip
+import zlib
+import threading
+from pathlib import Path, PurePosixPath
+from collections import OrderedDict
+from datetime import datetime, timezone
+from kettu.headers import ETag, serialize_http_datetime
+from wolf.abc.request import RequestProtocol
+from wolf.app.request import negotiate_encoding
+from wolf.app.response import Response, file_etag, precondition_status
+
+
+FINGERPRINT = re.compile(r"[.-][0-9a-fA-F]{8,}\.[^/]+$")
+COMPRESSIBLE = re.compile(
+    r"^(text/.*|application/(javascript|json|xml|.*\+json|.*\+xml)"
+    r"|image/svg\+xml)$"
+)
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def is_fingerprinted(path: PurePosixPath) -> bool:
+    """Fingerprinted names, such as `app.3f2a9c1d.js`, change with
+    their content: they can be cached forever.
+    """
+    return FINGERPRINT.search(path.name) is not None
+
+
+def compress(coding: str, data: bytes) -> bytes:
+    if coding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if coding == "deflate":
+        return zlib.compress(data, 9)
+    raise ValueError(f"Unknown content coding: {coding!r}.")
+
+
+class Asset:
+    """Cached asset content, with its precompressed variants.
+    """
+    __slots__ = (
+        "mtime_ns", "size", "content_type", "etag", "last_modified",
+        "http_date", "variants", "codings", "weight"
+    )
+
+    def __init__(self, stat: os.stat_result, content_type: str,
+                 body: bytes, encodings: tuple[str, ...]):
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.content_type = content_type
+        self.last_modified = datetime.fromtimestamp(
+            int(stat.st_mtime), timezone.utc)
+        self.http_date = serialize_http_datetime(self.last_modified)
+        # Same validator as the file responses, for the byte ranges
+        # the cache leaves to them.
+        self.etag = file_etag(stat)
+        self.variants: dict[str | None, tuple[bytes, ETag]] = {
+            None: (body, self.etag)
+        }
+        if COMPRESSIBLE.match(content_type.split(";")[0].strip()):
+            for coding in encodings:
+                compressed = compress(coding, body)
+                if len(compressed) < len(body):
+                    self.variants[coding] = (
+                        compressed, ETag(f"{self.etag.value}-{coding}"))
+        self.codings = tuple(coding for coding in self.variants if coding)
+        self.weight = sum(len(data) for data, _ in self.variants.values())
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        return (
+            self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+        )
+
+
+class AssetCache:
+    """Bounded cache of small static files, evicting the least
+    recently used assets once `max_size` bytes are held.
+    Assets are revalidated against the modification time of the file.
+    """
+
+    def __init__(
+            self,
+            max_size: int = 32 * 1024 * 1024,
+            max_file_size: int = 1024 * 1024,
+            encodings: tuple[str, ...] = ("gzip", "deflate"),
+    ):
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+        self.encodings = encodings
+        self.size = 0
+        self._assets: OrderedDict[Path, Asset] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._assets)
+
+    def __contains__(self, path: Path):
+        return path in self._assets
+
+    def get(self, path: Path, content_type: str) -> Asset | None:
+        stat = path.stat()
+        with self._lock:
+            asset = self._assets.get(path)
+            if asset is not None:
+                if asset.is_current(stat):
+                    self._assets.move_to_end(path)
+                    return asset
+                self.discard(path)
+
+        if stat.st_size > self.max_file_size:
+            return None
+
+        asset = Asset(stat, content_type, path.read_bytes(), self.encodings)
+        if asset.weight > self.max_size:
+            return None
+
+        with self._lock:
+            self.discard(path)
+            self._assets[path] = asset
+            self.size += asset.weight
+            while self.size > self.max_size:
+                _, evicted = self._assets.popitem(last=False)
+                self.size -= evicted.weight
+        return asset
+
+    def discard(self, path: Path):
+        asset = self._assets.pop(path, None)
+        if asset is not None:
+            self.size -= asset.weight
+
+    def serve(
+            self,
+            request: RequestProtocol,
+            path: Path,
+            content_type: str,
+            url: PurePosixPath | None = None
+    ) -> Response | None:
+        """Respond from the cache. None is returned for the requests
+        the cache cannot answer: byte ranges and uncached files.
+        """
+        if "HTTP_RANGE" in request.environ:
+            return None
+
+        asset = self.get(path, content_type)
+        if asset is None:
+            return None
+
+        coding = negotiate_encoding(request.accept_encoding, asset.codings)
+        body, etag = asset.variants[coding]
+        headers = {
+            "Content-Type": asset.content_type,
+            "ETag": etag.as_header(),
+            "Last-Modified": asset.http_date,
+        }
+        if len(asset.variants) > 1:
+            headers["Vary"] = "Accept-Encoding"
+        if coding is not None:
+            headers["Content-Encoding"] = coding
+        if url is not None and is_fingerprinted(url):
+            headers["Cache-Control"] = IMMUTABLE
+
+        response = Response(200, body=b"", headers=headers)
+        status = precondition_status(request, etag, asset.last_modified)
+        if status is not None:
+            response.status = status
+            return response
+
+        response.headers["Content-Length"] = str(len(body))
+        if request.method != "HEAD":
+            response.body = body
+        return response
@@ -18,10 +18,11 @@ class SessionMessages:
         self.key = key
 
     def __iter__(self) -> t.Iterable[Message]:
-        if self.key in self.session:
-            while self.session[self.key]:
-                yield Message(**self.session[self.key].pop(0))
-                self.session.save()
+        if self.key in self.session and (messages := self.session[self.key]):
+            # Consumed messages are written once, with the session.
+            self.session.save()
+            while messages:
+                yield Message(**messages.pop(0))
 
     def add(self, body: str, type: str = "info"):
         if self.key in self.session:
@@ -2,15 +2,26 @@ from pathlib import PurePosixPath
 from html_resources.store import Repository
 from wolf.app.nodes import Node
 from wolf.app.render.html import BoundResources
+from wolf.rendering.injection import ResourceFragments
+from wolf.app.request import Request
+from wolf.app.services.assets import AssetCache
 from wolf.app.response import Response, FileWrapperResponse
 from wolf.app.pluggability import Installable
 
 
 class ResourceManager(Installable, Node):
 
-    def __init__(self, repository: Repository, path: str | PurePosixPath):
+    def __init__(
+            self,
+            repository: Repository,
+            path: str | PurePosixPath,
+            cache: AssetCache | None = None,
+            fragments: ResourceFragments | None = None,
+    ):
         self.repository = repository
         self.path = PurePosixPath(path)
+        self.cache = cache
+        self.fragments = fragments or ResourceFragments()
 
     def install(self, application):
         application.sinks[self.path] = self
@@ -19,20 +30,23 @@ class ResourceManager(Installable, Node):
         )
 
     def needed_resources(self):
-        return BoundResources(self.path)
+        return BoundResources(self.path, fragments=self.fragments)
 
     def resolve(self, environ):
-        info = self.repository.match(
-            PurePosixPath(environ["PATH_INFO"].lstrip('/'))
-        )
+        url = PurePosixPath(environ["PATH_INFO"].lstrip('/'))
+        info = self.repository.match(url)
         if not info:
             return Response(status=404)
 
-        headers = {
-            "Content-Length": str(info.size),
-            "Content-Type": info.content_type,
-        }
-        if environ["REQUEST_METHOD"] == "HEAD":
-            return Response(200, headers=headers)
-
-        return FileWrapperResponse(info.filepath, headers=headers)
+        request = Request(environ)
+        if self.cache is not None:
+            response = self.cache.serve(
+                request, info.filepath, info.content_type, url)
+            if response is not None:
+                return response
+
+        return FileWrapperResponse.serve(
+            request,
+            info.filepath,
+            headers={"Content-Type": info.content_type},
+        )
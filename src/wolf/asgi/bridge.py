@@ -0,0 +1,169 @@
+import sys
+import asyncio
+import inspect
+import typing as t
+from functools import wraps
+from http import HTTPStatus
+from contextvars import ContextVar
+from tempfile import SpooledTemporaryFile
+from kettu.exceptions import HTTPError
+from wolf.asgi.types import Scope, Receive, Send
+from wolf.wsgi.types import WSGICallable, WSGIEnviron
+
+
+SPOOL_MAX_SIZE = 1024 * 1024
+
+# Event loop of the ASGI request handled by the current worker thread.
+running_loop: ContextVar[asyncio.AbstractEventLoop] = ContextVar(
+    "running_loop")
+DONE = object()
+
+
+async def wait(awaitable: t.Awaitable):
+    return await awaitable
+
+
+def awaited(handler: t.Callable) -> t.Callable:
+    """Synchronous handler resolving the awaitables returned by
+    `handler` on the event loop, for the callers running in a worker
+    thread, such as the synchronous middlewares.
+    """
+    @wraps(handler)
+    def awaiting_handler(*args, **kwargs):
+        result = handler(*args, **kwargs)
+        if inspect.isawaitable(result):
+            future = asyncio.run_coroutine_threadsafe(
+                wait(result), running_loop.get())
+            return future.result()
+        return result
+    return awaiting_handler
+
+
+async def read_body(
+        receive: Receive, max_size: int = SPOOL_MAX_SIZE,
+        limit: int | None = None) -> t.BinaryIO:
+    """Consume the request body messages into a spooled file.
+    The body is kept in memory up to `max_size` bytes, then written
+    to disk in a worker thread. A 413 error is raised as soon as more
+    than `limit` bytes are received.
+    """
+    body = SpooledTemporaryFile(max_size=max_size)
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        if chunk := message.get("body"):
+            size += len(chunk)
+            if limit is not None and size > limit:
+                body.close()
+                raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            if size > max_size:
+                await asyncio.to_thread(body.write, chunk)
+            else:
+                body.write(chunk)
+        if not message.get("more_body", False):
+            break
+    body.seek(0)
+    return body
+
+
+def environ_from_scope(
+        scope: Scope, body: t.BinaryIO | None) -> WSGIEnviron:
+    """Build a WSGI environ from an ASGI HTTP scope.
+    The body may be given as `None`, to be set once received.
+    """
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+        "asgi.scope": scope,
+    }
+    if server := scope.get("server"):
+        environ["SERVER_NAME"] = server[0]
+        environ["SERVER_PORT"] = str(server[1])
+    else:
+        environ["SERVER_NAME"] = "localhost"
+    if client := scope.get("client"):
+        environ["REMOTE_ADDR"] = client[0]
+
+    for name, value in scope.get("headers", ()):
+        name = name.decode("latin-1")
+        if name == "content-length":
+            key = "CONTENT_LENGTH"
+        elif name == "content-type":
+            key = "CONTENT_TYPE"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if key in environ:
+            separator = "; " if key == "HTTP_COOKIE" else ","
+            value = environ[key] + separator + value
+        environ[key] = value
+    return environ
+
+
+def encode_headers(
+        headers: t.Iterable[tuple[str, str]]) -> list[tuple[bytes, bytes]]:
+    return [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in headers
+    ]
+
+
+async def call_wsgi(app: WSGICallable, environ: WSGIEnviron, send: Send):
+    """Run a plain WSGI callable in a worker thread.
+    The response body is streamed, one chunk at a time.
+    """
+    started = []
+
+    def start_response(status, headers, exc_info=None):
+        started[:] = [status, headers]
+
+    iterable = await asyncio.to_thread(app, environ, start_response)
+    try:
+        chunks = iter(iterable)
+        # The response may only be started with its first chunk.
+        chunk = await asyncio.to_thread(next, chunks, DONE)
+        status, headers = started
+        await send({
+            "type": "http.response.start",
+            "status": int(status.split(" ", 1)[0]),
+            "headers": encode_headers(headers),
+        })
+        while chunk is not DONE:
+            if chunk:
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": True
+                })
+            chunk = await asyncio.to_thread(next, chunks, DONE)
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        if hasattr(iterable, "close"):
+            await asyncio.to_thread(iterable.close)
+
+
+async def lifespan(receive: Receive, send: Send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
@@ -0,0 +1,9 @@
+from typing import Any
+from collections.abc import MutableMapping, Callable, Awaitable
+
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGICallable = Callable[[Scope, Receive, Send], Awaitable[None]]
@@ -1,9 +1,12 @@
 from typing import Callable, Sequence
+from contextvars import ContextVar
 from functools import update_wrapper
 
 
 Wrapper = Callable[[Callable], Callable]
 
+current_endpoint: ContextVar[Callable] = ContextVar("current_endpoint")
+
 
 def chain_wrap(chain: Sequence[Wrapper], endpoint: Callable) -> Callable:
     wrapped = endpoint
@@ -12,3 +15,93 @@ def chain_wrap(chain: Sequence[Wrapper], endpoint: Callable) -> Callable:
         update_wrapper(wrapping, wrapped)
         wrapped = wrapping
     return wrapped
+
+
+def shareable(wrapper: Wrapper) -> Wrapper:
+    """Declare a middleware independent of the handler it wraps, at
+    wrapping time: compiled pipelines can wrap it once for all their
+    endpoints.
+    """
+    wrapper.__shareable__ = True
+    return wrapper
+
+
+def terminal(*args, **kwargs):
+    """Innermost handler of the shared layers of a compiled pipeline.
+    Calls the endpoint bound for the current dispatch.
+    """
+    return current_endpoint.get()(*args, **kwargs)
+
+
+class CompiledPipeline:
+    """A middleware chain whose outermost `shareable` layers are wrapped
+    once around a late-bound endpoint, rather than once per endpoint.
+    The inner layers, from the first one not declared shareable, are
+    wrapped around each endpoint: they get its metadata and can
+    introspect it when wrapping.
+    """
+    __slots__ = ("layers", "shared", "inner", "chain")
+
+    layers: tuple[Wrapper, ...]
+    shared: tuple[Wrapper, ...]
+    inner: tuple[Wrapper, ...]
+    chain: Callable | None
+
+    def __init__(self, layers: Sequence[Wrapper]):
+        self.layers = tuple(layers)
+        count = 0
+        for layer in self.layers:
+            if not getattr(layer, "__shareable__", False):
+                break
+            count += 1
+        self.shared = self.layers[:count]
+        self.inner = self.layers[count:]
+        self.chain = chain_wrap(self.shared, terminal) if count else None
+
+    def __len__(self):
+        return len(self.layers)
+
+    def __iter__(self):
+        return iter(self.layers)
+
+    def __repr__(self):
+        return f"<CompiledPipeline {list(self.layers)!r}>"
+
+    def bind(self, endpoint: Callable) -> Callable:
+        if not self.layers:
+            return endpoint
+        if self.inner:
+            endpoint = chain_wrap(self.inner, endpoint)
+        chain = self.chain
+        if chain is None:
+            dispatch = endpoint
+        else:
+            def dispatch(*args, **kwargs):
+                token = current_endpoint.set(endpoint)
+                try:
+                    return chain(*args, **kwargs)
+                finally:
+                    current_endpoint.reset(token)
+
+            update_wrapper(dispatch, endpoint)
+        dispatch.__pipeline__ = self
+        return dispatch
+
+
+def compile_pipeline(
+        chain: Sequence[Wrapper],
+        cache: dict[tuple[int, ...], CompiledPipeline] | None = None
+) -> CompiledPipeline:
+    """Returns the compiled pipeline of a middleware chain.
+    Chains of the same middleware instances share their compilation
+    within the `cache` of their owner, such as a router.
+    """
+    if cache is None:
+        return CompiledPipeline(chain)
+    # Middlewares are not necessarily hashable: we rely on identity.
+    # The compiled pipeline keeps them alive, so ids are not reused
+    # while it is cached.
+    key = tuple(map(id, chain))
+    if (compiled := cache.get(key)) is None:
+        compiled = cache[key] = CompiledPipeline(chain)
+    return compiled
@@ -0,0 +1,200 @@
+import typing as t
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from collections.abc import Hashable, Mapping
+from wrapt import ObjectProxy
+from signature_registries import Registry
+from signature_registries.resolver import SignatureResolver
+from signature_registries.signed import DEFAULT, Proxy
+from wolf.abc.request import RequestProtocol
+from wolf.app.middlewares.cache import MemoryCacheStore
+from wolf.app.services.translation import Locale
+
+
+T = t.TypeVar("T")
+KeyFunction = t.Callable[[RequestProtocol, t.Any, t.Any], Hashable]
+
+
+class CachePolicy(ABC):
+    """How long the rendering of a slot or a subslot can be reused,
+    and for which requests. Declared with the `cached` decorator.
+    """
+    ttl: float | None = None
+
+    # Local policies store their fragments in the request.
+    local: bool = False
+
+    @abstractmethod
+    def key(self, request: RequestProtocol, view, context) -> Hashable: ...
+
+
+class PerRequest(CachePolicy):
+    """Rendered once per request, whatever the number of occurrences.
+    """
+    local = True
+
+    def key(self, request: RequestProtocol, view, context) -> Hashable:
+        return ()
+
+
+class PerContext(CachePolicy):
+    """Shared by the requests of the same context class and locale.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        self.ttl = ttl
+
+    def key(self, request: RequestProtocol, view, context) -> Hashable:
+        return (type(context), request.get(Locale, default=None))
+
+
+class Timed(CachePolicy):
+    """Shared for `ttl` seconds by the requests of the same key.
+    """
+
+    def __init__(self, ttl: float, key: KeyFunction | None = None):
+        self.ttl = ttl
+        self.key_function = key
+
+    def key(self, request: RequestProtocol, view, context) -> Hashable:
+        if self.key_function is None:
+            return ()
+        return self.key_function(request, view, context)
+
+
+def cached(policy: CachePolicy):
+    def declare_policy(component):
+        component.__cache_policy__ = policy
+        return component
+    return declare_policy
+
+
+def cache_policy(component) -> CachePolicy | None:
+    return getattr(component, "__cache_policy__", None)
+
+
+class Fragments(dict):
+    """Fragments rendered during the request, for the local policies.
+    """
+
+
+class FragmentCache(MemoryCacheStore):
+    """Bounded store of rendered fragments, evicting the least
+    recently used ones.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        super().__init__(max_entries=max_entries)
+
+    def key(self, component, name: str, policy: CachePolicy,
+            request: RequestProtocol, view, context) -> Hashable:
+        return (component, name, policy.key(request, view, context))
+
+    def fetch(self, policy: CachePolicy, request: RequestProtocol,
+              key: Hashable, render: t.Callable[[], T]) -> T:
+        """Cached result of `render`. None is never cached.
+        """
+        if policy.local:
+            fragments = request.get(Fragments, default=None)
+            if fragments is None:
+                fragments = Fragments()
+                request.context.register_local_value(Fragments, fragments)
+            if (value := fragments.get(key)) is None:
+                value = fragments[key] = render()
+            return value
+
+        if (value := self.get(key)) is None:
+            value = render()
+            if value is not None:
+                self.set(key, value, policy.ttl)
+        return value
+
+
+class CachedComponent(ObjectProxy):
+    """Subslot whose rendering goes through the fragment cache.
+    """
+
+    def __init__(self, wrapped, cache: FragmentCache, policy: CachePolicy,
+                 request: RequestProtocol, key: Hashable):
+        super().__init__(wrapped)
+        self._self_cache = cache
+        self._self_policy = policy
+        self._self_request = request
+        self._self_key = key
+
+    def __call__(self, *args, **kwargs):
+        return self._self_cache.fetch(
+            self._self_policy, self._self_request, self._self_key,
+            lambda: self.__wrapped__(*args, **kwargs)
+        )
+
+
+class LookupCache(Registry):
+    """Registry memoizing `fetch` and `match_grouped` by the classes
+    of the arguments: registered signatures are matched against types.
+    Registrations and in-place merges empty the memo.
+    """
+
+    def __init__(self, data=None):
+        self._fetched: dict[tuple, Proxy | None] = {}
+        self._grouped: dict[tuple, Mapping[str, Proxy]] = {}
+        self.hits = 0
+        self.misses = 0
+        super().__init__(data)
+
+    def clear_cache(self):
+        self._fetched.clear()
+        self._grouped.clear()
+
+    def __setitem__(self, signature, proxy):
+        super().__setitem__(signature, proxy)
+        self.clear_cache()
+
+    def __delitem__(self, signature):
+        super().__delitem__(signature)
+        self.clear_cache()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self.clear_cache()
+        return result
+
+    def __or__(self, other):
+        result = super().__or__(other)
+        # The base class only resolves the signatures of the left operand.
+        result.resolver = SignatureResolver()
+        for signature in result.keys():
+            result.resolver.register(signature)
+        return result
+
+    def fetch(self, *args, name: str = DEFAULT) -> Proxy:
+        key = (*(arg.__class__ for arg in args), name)
+        try:
+            proxy = self._fetched[key]
+        except KeyError:
+            self.misses += 1
+            try:
+                proxy = super().fetch(*args, name=name)
+            except LookupError:
+                proxy = None
+            self._fetched[key] = proxy
+        else:
+            self.hits += 1
+        if proxy is None:
+            raise LookupError(args, name)
+        return proxy
+
+    def match_grouped(self, *args, **kwargs) -> Mapping[str, Proxy]:
+        if kwargs:
+            # Custom sorters are not memoized.
+            return super().match_grouped(*args, **kwargs)
+        key = tuple(arg.__class__ for arg in args)
+        try:
+            grouped = self._grouped[key]
+        except KeyError:
+            self.misses += 1
+            grouped = self._grouped[key] = MappingProxyType(
+                super().match_grouped(*args))
+        else:
+            self.hits += 1
+        return grouped
@@ -0,0 +1,102 @@
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from wolf.app.middlewares.cache import MemoryCacheStore
+
+
+HEAD_END = b"</head>"
+BODY_END = b"</body>"
+
+
+def encoded(chunks: Iterable[str | bytes]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield chunk.encode() if isinstance(chunk, str) else chunk
+
+
+def inject(body: bytes, top: bytes, bottom: bytes) -> bytes:
+    """Insert `top` before `</head>` and `bottom` before `</body>`.
+    """
+    insertions = []
+    if top and (index := body.find(HEAD_END)) != -1:
+        insertions.append((index, top))
+    if bottom and (index := body.find(BODY_END)) != -1:
+        insertions.append((index, bottom))
+    if not insertions:
+        return body
+
+    # The document is only copied once, by the final join.
+    view = memoryview(body)
+    parts = []
+    start = 0
+    for index, fragment in sorted(insertions):
+        parts.append(view[start:index])
+        parts.append(fragment)
+        start = index
+    parts.append(view[start:])
+    return b"".join(parts)
+
+
+def inject_stream(
+        chunks: Iterable[str | bytes], render: Callable[[bool], bytes]
+) -> Iterator[bytes]:
+    """Streaming counterpart of `inject`. The fragments are rendered
+    when their marker is reached: `render(True)` before `</head>`,
+    then `render(False)` before `</body>`.
+    """
+    marker = HEAD_END
+    pending = b""
+    for chunk in encoded(chunks):
+        data = pending + chunk if pending else chunk
+        while marker is not None:
+            index = data.find(marker)
+            if index == -1:
+                break
+            if index:
+                yield data[:index]
+            if fragment := render(marker is HEAD_END):
+                yield fragment
+            data = data[index:]
+            marker = BODY_END if marker is HEAD_END else None
+
+        if marker is None or len(data) < len(marker):
+            pending, data = (b"", data) if marker is None else (data, b"")
+        else:
+            # A marker may be split across two chunks.
+            keep = len(marker) - 1
+            pending, data = data[-keep:], data[:-keep]
+        if data:
+            yield data
+
+    if pending:
+        yield pending
+
+
+def render_fragments(resources: Iterable, url) -> tuple[bytes, bytes]:
+    """Top and bottom fragments of the resources, in their order.
+    """
+    top = []
+    bottom = []
+    for resource in resources:
+        if resource.bottom:
+            bottom.append(resource.render(url))
+        else:
+            top.append(resource.render(url))
+    return b"".join(top), b"".join(bottom)
+
+
+class ResourceFragments:
+    """Rendered fragments of the resource sets, kept by their owner
+    (a resource manager) and shared by its requests.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.cache = MemoryCacheStore(max_entries=max_entries)
+
+    def fetch(self, key: Hashable, resources: Callable[[], Iterable],
+              url) -> tuple[bytes, bytes]:
+        """Fragments of the resources, only unfolded and rendered
+        on the first request of the key.
+        """
+        if (rendered := self.cache.get(key)) is not None:
+            return rendered
+        rendered = render_fragments(resources(), url)
+        self.cache.set(key, rendered, None)
+        return rendered
@@ -2,7 +2,9 @@ import inspect
 import typing as t
 from pathlib import Path
 from types import MappingProxyType
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Iterable, Mapping, MutableMapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from chameleon.loader import ModuleLoader
 from chameleon.zpt import template
 
 
@@ -17,12 +19,28 @@ def scan_templates(path: Path, allowed_suffixes=(".pt", ".cpt")):
 EXPRESSION_TYPES = {}
 
 
+def compile_template(
+        factory: type[template.PageTemplateFile],
+        path: Path,
+        cache_dir: str,
+        expression_types: Mapping
+) -> str:
+    """Compile a template into the disk cache.
+    Meant to run in a worker process: only the path is sent back.
+    """
+    tpl = factory(path, loader=ModuleLoader(cache_dir))
+    tpl.expression_types |= expression_types
+    tpl.cook_check()
+    return str(path)
+
+
 class Templates(Mapping[str, template.PageTemplate]):
     """Template registry as a mapping.
     """
 
     registry: MutableMapping[str, Path]
     cache: MutableMapping[str, template.PageTemplate]
+    loader: ModuleLoader | None
     extensions = {
         ".pt": template.PageTemplateFile,
         ".cpt": template.PageTemplateFile,
@@ -30,9 +48,21 @@ class Templates(Mapping[str, template.PageTemplate]):
     }
     expression_types = MappingProxyType(EXPRESSION_TYPES)
 
-    def __init__(self, path: t.Optional[Path | str] = None):
+    def __init__(
+            self,
+            path: t.Optional[Path | str] = None,
+            cache_dir: t.Optional[Path | str] = None,
+    ):
         self.registry = {}
         self.cache = {}
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            # Compiled modules are named after a digest of the template
+            # source: workers sharing the directory load them directly.
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            self.loader = ModuleLoader(str(cache_dir))
+        else:
+            self.loader = None
 
         if path:
             path = Path(path)
@@ -69,18 +99,64 @@ class Templates(Mapping[str, template.PageTemplate]):
 
         if path := self.registry.get(name):
             factory = self.extensions[path.suffix]
-            tpl = self.cache[name] = factory(path)
+            if self.loader is not None:
+                tpl = factory(path, loader=self.loader)
+            else:
+                tpl = factory(path)
             tpl.expression_types |= self.expression_types
+            self.cache[name] = tpl
             return tpl
 
         raise ValueError(f"Template not found: {name}.")
 
+    def warmup(
+            self,
+            names: Iterable[str] | None = None,
+            executor: Executor | None = None,
+    ) -> list[str]:
+        """Compile the templates ahead of the first requests.
+        All the registered templates are compiled, unless `names` is
+        given. A thread pool executor compiles them concurrently.
+        Other executors, such as a process pool, require a `cache_dir`:
+        the workers fill the disk cache, the templates are then loaded
+        from it.
+        """
+        names = list(self.registry if names is None else names)
+        if executor is not None and not isinstance(
+                executor, ThreadPoolExecutor):
+            if self.loader is None:
+                raise ValueError(
+                    "Compiling out of process requires a cache directory.")
+            futures = [
+                executor.submit(
+                    compile_template,
+                    self.extensions[self.registry[name].suffix],
+                    self.registry[name],
+                    str(self.cache_dir),
+                    dict(self.expression_types),
+                )
+                for name in names if name not in self.cache
+            ]
+            for future in futures:
+                future.result()
+
+        def cook(name: str) -> str:
+            self[name].cook_check()
+            return name
+
+        if isinstance(executor, ThreadPoolExecutor):
+            return list(executor.map(cook, names))
+        return [cook(name) for name in names]
+
     def __or__(self, reg: "Templates"):
         if not isinstance(reg, Templates):
             raise TypeError(
                 f"Cannot merge {self.__class__!r} with {reg.__class__!r}."
             )
         templates = self.__class__()
+        source = self if self.loader is not None else reg
+        templates.cache_dir = source.cache_dir
+        templates.loader = source.loader
         templates.registry = self.registry | reg.registry
 
         # ensure cache consistency.
@@ -9,9 +9,12 @@ from html_resources.resources import JSResource, CSSResource
 from wolf.abc.request import RequestProtocol
 from wolf.app.pluggability import Installable
 from wolf.rendering.templates import Templates, EXPRESSION_TYPES
+from wolf.rendering.cache import (
+    FragmentCache, CachedComponent, LookupCache, cache_policy
+)
 
 
-class SlotRegistry(TypedRegistry):
+class SlotRegistry(LookupCache, TypedRegistry):
     @beartype
     class Types(NamedTuple):
         request: type[RequestProtocol] = RequestProtocol
@@ -19,7 +22,7 @@ class SlotRegistry(TypedRegistry):
         context: type = Any
 
 
-class SubSlotRegistry(TypedRegistry):
+class SubSlotRegistry(LookupCache, TypedRegistry):
     @beartype
     class Types(NamedTuple):
         request: type[RequestProtocol] = RequestProtocol
@@ -28,7 +31,7 @@ class SubSlotRegistry(TypedRegistry):
         context: type = Any
 
 
-class LayoutRegistry(TypedRegistry):
+class LayoutRegistry(LookupCache, TypedRegistry):
     @beartype
     class Types(NamedTuple):
         request: type[RequestProtocol] = RequestProtocol
@@ -36,6 +39,27 @@ class LayoutRegistry(TypedRegistry):
         context: type = Any
 
 
+def render_slot(ui, manager, request, view, context):
+    if manager.__metadata__.isclass:
+        manager = manager()
+
+    subslots = []
+    for subslot in ui.subslots.match_grouped(
+            request, manager, view, context).values():
+        if subslot.__evaluate__(
+                request, manager=manager, view=view, context=context):
+            continue
+        if (policy := cache_policy(subslot)) is not None:
+            key = ui.fragments.key(
+                subslot.__wrapped__, subslot.__metadata__.name, policy,
+                request, view, context
+            )
+            subslot = CachedComponent(
+                subslot, ui.fragments, policy, request, key)
+        subslots.append(subslot)
+    return manager(request, view=view, context=context, items=subslots)
+
+
 def query_slot(econtext, name):
     """Compute the result of a slot expression"""
     request = econtext.get("request")  # mandatory.
@@ -48,18 +72,16 @@ def query_slot(econtext, name):
         if manager.__evaluate__(request, view=view, context=context):
             return None
 
-        if manager.__metadata__.isclass:
-            manager = manager()
+        if (policy := cache_policy(manager)) is None:
+            return render_slot(ui, manager, request, view, context)
 
-        subslots = [
-            subslot
-            for subslot in ui.subslots.match_grouped(
-                request, manager, view, context
-            ).values()
-            if not subslot.__evaluate__(
-                request, manager=manager, view=view, context=context)
-        ]
-        return manager(request, view=view, context=context, items=subslots)
+        # A cached slot is served without looking its subslots up.
+        key = ui.fragments.key(
+            manager.__wrapped__, name, policy, request, view, context)
+        return ui.fragments.fetch(
+            policy, request, key,
+            lambda: render_slot(ui, manager, request, view, context)
+        )
 
     except LookupError:
         # No slot found. We don't render anything.
@@ -95,6 +117,7 @@ class UI(Installable):
     templates: Templates = field(default_factory=Templates)
     macros: Templates = field(default_factory=Templates)
     resources: set[JSResource | CSSResource] = field(default_factory=set)
+    fragments: FragmentCache = field(default_factory=FragmentCache)
 
     def install(self, application):
         application.services.register_value(UI, self)
@@ -107,8 +130,10 @@ class UI(Installable):
                 f"Unsupported merge between {self.__class__!r} "
                 f"and {other.__class__!r}"
             )
+        # Merged registries are new ones, with empty lookup caches.
         return self.__class__(
             slots=self.slots | other.slots,
+            subslots=self.subslots | other.subslots,
             layouts=self.layouts | other.layouts,
             templates=self.templates | other.templates,
             macros=self.macros | other.macros,
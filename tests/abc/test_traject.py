@@ -0,0 +1,156 @@
+import pytest
+from wolf.abc.resolvers.traject import ContextRegistry
+
+
+class Root:
+    pass
+
+
+class Folder:
+    pass
+
+
+class Document:
+    pass
+
+
+def make_registry():
+    calls = []
+    registry = ContextRegistry()
+
+    def folder(request, parent, *, name: str) -> Folder:
+        calls.append(("folder", name))
+        return Folder()
+
+    def document(request, parent, *, id: str) -> Document:
+        calls.append(("document", id))
+        return Document()
+
+    registry.add(Root, "/folders/{name}", "GET", folder)
+    registry.add(Folder, "/docs/{id}", "GET", document)
+    return registry, calls
+
+
+def test_resolve_deep():
+    registry, calls = make_registry()
+    root = Root()
+    location, rest = registry.resolve(
+        root, "/folders/a/docs/1/edit", "GET", None, partial=True)
+    assert isinstance(location.object, Document)
+    assert isinstance(location.parent.object, Folder)
+    assert location.parent.parent.object is root
+    assert location.path == "/folders/a/docs/1"
+    assert rest == "/edit"
+    assert calls == [("folder", "a"), ("document", "1")]
+
+
+def test_resolve_plans_are_memoized():
+    registry, calls = make_registry()
+    root = Root()
+    for _ in range(3):
+        registry.resolve(root, "/folders/a/docs/1", "GET", None)
+    assert len(calls) == 6  # factories are called for each request.
+    assert len(registry._plans) == 2
+    depth, router = registry._plans[
+        (Root, "GET", ("/", "folders", None, None, None))]
+    assert depth == 3 and router is registry[Root]
+
+    # Plans are shared by the paths of the same shape.
+    location, _ = registry.resolve(root, "/folders/b/docs/2", "GET", None)
+    assert location.path == "/folders/b/docs/2"
+    assert calls[-2:] == [("folder", "b"), ("document", "2")]
+    assert len(registry._plans) == 2
+    assert registry.plan(Root, "/folders/c/docs/3", "GET")[:2] == (
+        "/folders/c", "/docs/3")
+
+
+def test_resolve_miss():
+    registry, calls = make_registry()
+    root = Root()
+    with pytest.raises(LookupError):
+        registry.resolve(root, "/unknown", "GET", None)
+    location, rest = registry.resolve(
+        root, "/unknown", "GET", None, partial=True)
+    assert location.object is root
+    assert location.path == "/"
+    assert rest == "/unknown"
+    assert registry._plans[(Root, "GET", ("/", None))] is None
+
+
+def test_resolve_plans_invalidation():
+    registry, calls = make_registry()
+    root = Root()
+    registry.resolve(root, "/unknown", "GET", None, partial=True)
+    assert registry._plans
+
+    def unknown(request, parent) -> Folder:
+        return Folder()
+
+    registry.add(Root, "/unknown", "GET", unknown)
+    assert not registry._plans
+    location, rest = registry.resolve(root, "/unknown", "GET", None)
+    assert isinstance(location.object, Folder)
+
+
+def test_resolve_plans_eviction():
+    registry, calls = make_registry()
+    registry.cache_size = 2
+    for path in ("/folders/a", "/x", "/folders/b", "/x/y"):
+        registry.plan(Root, path, "GET")
+    assert list(registry._plans) == [
+        (Root, "GET", ("/", "folders", None)),
+        (Root, "GET", ("/", None, None)),
+    ]
+
+
+def test_resolve_plans_typed_placeholders():
+    registry = ContextRegistry()
+
+    def document(request, parent, *, id: int) -> Document:
+        return Document()
+
+    registry.add(Root, "/docs/{id:digit}", "GET", document)
+    assert registry.plan(Root, "/docs/1", "GET")[:2] == ("/docs/1", "")
+    assert registry.plan(Root, "/docs/a", "GET") is None
+    assert list(registry._plans) == [
+        (Root, "GET", ("/", "docs", "1")),
+        (Root, "GET", ("/", "docs", "a")),
+    ]
+
+
+def test_union_keeps_the_registry_type():
+    registry, _ = make_registry()
+    other = ContextRegistry()
+    merged = registry | other
+    assert isinstance(merged, ContextRegistry)
+    location, _ = merged.resolve(Root(), "/folders/a", "GET", None)
+    assert isinstance(location.object, Folder)
+
+
+def test_reverse():
+    registry, _ = make_registry()
+    assert registry.reverse(Document, Root) == "//folders/{name}/docs/{id}"
+    assert registry.reverse(Folder, Root) == "//folders/{name}"
+    with pytest.raises(LookupError):
+        registry.reverse(Root, Document)
+
+
+def test_reverse_is_memoized_and_invalidated():
+    registry, _ = make_registry()
+    registry.reverse(Document, Root)
+    with pytest.raises(LookupError):
+        registry.reverse(Root, Document)
+    assert registry._paths == {
+        (Document, Root): "//folders/{name}/docs/{id}",
+        (Root, Document): None,
+    }
+
+    def shortcut(request, parent, *, id: str) -> Document:
+        return Document()
+
+    registry.add(Root, "/doc/{id}", "GET", shortcut)
+    assert not registry._paths
+    assert registry.reverse(Document, Root) == "//doc/{id}"
+
+    registry |= ContextRegistry()
+    assert not registry._paths
@@ -0,0 +1,106 @@
+import pytest
+from types import SimpleNamespace
+from wolf.abc.resolvers import Location
+from wolf.abc.resolvers.consumers import (
+    BaseConsumer, ConsumerRegistry, ItemConsumer, NOT_FOUND)
+from wolf.abc.resolvers.traversing import Publisher
+
+
+class Folder(dict):
+    pass
+
+
+class AttributeConsumer(BaseConsumer):
+
+    def resolve(self, obj, name, request):
+        return getattr(obj, name, NOT_FOUND)
+
+
+def make_registry():
+    registry = ConsumerRegistry()
+    registry.register((object,), order=999)(ItemConsumer)
+    registry.register((Folder,), order=1)(AttributeConsumer)
+    return registry
+
+
+def test_consumers_are_cached_per_type():
+    registry = make_registry()
+    consumers = registry.consumers_for(Folder())
+    assert [type(c) for c in consumers] == [AttributeConsumer, ItemConsumer]
+    assert registry.consumers_for(Folder()) is consumers
+    assert [type(c) for c in registry.consumers_for(object())] == [
+        ItemConsumer]
+
+
+def test_consumers_cache_invalidation():
+    registry = make_registry()
+    namespace = SimpleNamespace()
+    registry.consumers_for(namespace)
+    registry.register((SimpleNamespace,), order=1)(AttributeConsumer)
+    assert [type(c) for c in registry.consumers_for(namespace)] == [
+        AttributeConsumer, ItemConsumer]
+
+    merged = registry | ConsumerRegistry()
+    assert merged._consumers == {}
+
+
+def test_consumers_cache_invalidation_in_place():
+    registry = make_registry()
+    namespace = SimpleNamespace()
+    registry.consumers_for(namespace)
+
+    other = ConsumerRegistry()
+    other.register((SimpleNamespace,), order=1)(AttributeConsumer)
+    registry |= other
+    assert [type(c) for c in registry.consumers_for(namespace)] == [
+        AttributeConsumer, ItemConsumer]
+
+    for signature in other:
+        del registry[signature]
+    assert [type(c) for c in registry.consumers_for(namespace)] == [
+        ItemConsumer]
+
+    registry = make_registry()
+    registry.consumers_for(namespace)
+    registry.update(other)
+    assert len(registry.consumers_for(namespace)) == 2
+    registry.pop(next(iter(other)))
+    assert len(registry.consumers_for(namespace)) == 1
+    registry.clear()
+    assert registry.consumers_for(namespace) == ()
+
+
+def test_legacy_consumers():
+
+    class ContextConsumer(BaseConsumer):
+
+        def __init__(self, context):
+            super().__init__(context)
+
+        def resolve(self, obj, name, request):
+            assert obj is self.context
+            return obj.get(name, NOT_FOUND)
+
+    registry = ConsumerRegistry()
+    registry.register((Folder,), order=1)(ContextConsumer)
+    first, second = Folder(), Folder()
+    with pytest.deprecated_call():
+        consumers = registry.consumers_for(first)
+    assert consumers[0].context is first
+    with pytest.deprecated_call():
+        assert registry.consumers_for(second)[0].context is second
+
+
+def test_publish():
+    registry = make_registry()
+    document = Folder()
+    root = Folder(a=Folder(b=document))
+    request = SimpleNamespace(path="/a//b/view/extra")
+    location, rest = Publisher(registry).publish(request, root)
+    assert type(location) is Location
+    assert location.object is document
+    assert location.id == "b"
+    assert location.parent.object is root["a"]
+    assert location.parent.parent.object is root
+    assert location.path == "/a/b"
+    assert rest == "view/extra"
@@ -0,0 +1,216 @@
+import time
+import threading
+from wolf.app.middlewares import ResponseCache, Compression
+from wolf.app.middlewares.cache import MemoryCacheStore, CachedResponse
+from wolf.app.response import Response
+from kettu.headers import ETag
+
+
+class Counter:
+
+    def __init__(self, factory=lambda: Response(200, body=b"Hello")):
+        self.calls = 0
+        self.factory = factory
+
+    def __call__(self, request):
+        self.calls += 1
+        return self.factory()
+
+
+def test_cache_hit(make_request):
+    view = Counter()
+    handler = ResponseCache()(view)
+
+    response = handler(make_request())
+    assert response.body == b"Hello"
+    etag = response.headers["ETag"]
+
+    response = handler(make_request())
+    assert view.calls == 1
+    assert response.status == 200
+    assert response.body == b"Hello"
+    assert response.headers["ETag"] == etag
+    assert response.headers["Content-Length"] == "5"
+
+    handler(make_request("/?page=2"))
+    handler(make_request("/other"))
+    assert view.calls == 3
+
+    response = handler(make_request(method="HEAD"))
+    assert view.calls == 3
+    assert response.body == b""
+    assert response.headers["Content-Length"] == "5"
+
+    handler(make_request(method="POST"))
+    handler(make_request(method="POST"))
+    assert view.calls == 5
+
+
+def test_cache_vary(make_request):
+    view = Counter()
+    handler = ResponseCache(vary=("Accept-Language",))(view)
+
+    response = handler(make_request(accept_language="fr"))
+    assert response.headers["Vary"] == "Accept-Language"
+    handler(make_request(accept_language="fr"))
+    assert view.calls == 1
+    handler(make_request(accept_language="en"))
+    assert view.calls == 2
+
+
+def test_cache_response_vary(make_request):
+    page = b"<p>Hello, world!</p>" * 100
+    view = Counter(lambda: Response(200, body=page))
+    handler = ResponseCache()(Compression()(view))
+
+    response = handler(make_request(accept_encoding="gzip"))
+    assert response.headers["Content-Encoding"] == "gzip"
+    response = handler(make_request(accept_encoding="identity"))
+    assert "Content-Encoding" not in response.headers
+    assert response.body == page
+    assert view.calls == 2
+
+    view = Counter(lambda: Response(200, body=page))
+    handler = ResponseCache(vary=("Accept-Encoding",))(Compression()(view))
+    handler(make_request(accept_encoding="gzip"))
+    response = handler(make_request(accept_encoding="gzip"))
+    assert response.headers["Content-Encoding"] == "gzip"
+    response = handler(make_request(accept_encoding="identity"))
+    assert response.body == page
+    assert view.calls == 2
+
+
+def test_cache_key_host_and_mount(make_request):
+    view = Counter()
+    handler = ResponseCache()(view)
+    handler(make_request(host="a.example"))
+    handler(make_request(host="a.example"))
+    handler(make_request(host="b.example"))
+    assert view.calls == 2
+
+    request = make_request(host="a.example")
+    request.environ["SCRIPT_NAME"] = "/mounted"
+    handler(request)
+    assert view.calls == 3
+
+
+def test_cache_not_modified(make_request):
+    view = Counter(lambda: Response(
+        200, body=b"Hello", headers={
+            "ETag": '"v1"', "Cache-Control": "max-age=60"}))
+    handler = ResponseCache()(view)
+
+    response = handler(make_request(if_none_match='"v1"'))
+    assert response.status == 304
+    assert response.headers["ETag"] == '"v1"'
+    assert view.calls == 1
+
+    response = handler(make_request(if_none_match='W/"v1"'))
+    assert response.status == 304
+    assert response.headers["Cache-Control"] == "max-age=60"
+    assert not response.body
+
+    response = handler(make_request(if_none_match='"v0"'))
+    assert response.status == 200
+    assert response.body == b"Hello"
+    assert view.calls == 1
+
+
+def test_cache_uncacheable(make_request):
+    def with_cookie():
+        response = Response(200, body=b"Hello")
+        response.cookies.set("sid", "abc")
+        return response
+
+    for factory in (
+            lambda: Response(404, body=b"Missing"),
+            lambda: Response(
+                200, body=b"Hello", headers={"Cache-Control": "private"}),
+            lambda: Response(200, body=b"x" * 20),
+            with_cookie,
+    ):
+        view = Counter(factory)
+        handler = ResponseCache(max_body_size=10)(view)
+        handler(make_request())
+        handler(make_request())
+        assert view.calls == 2
+
+
+def test_cache_iterator_body(make_request):
+    view = Counter(lambda: Response(200, body=iter([b"Hel", b"lo"])))
+    handler = ResponseCache()(view)
+    assert handler(make_request()).body == b"Hello"
+    assert handler(make_request()).body == b"Hello"
+    assert view.calls == 1
+
+
+def test_memory_store():
+    entry = CachedResponse(200, (), b"", ETag("x"))
+    store = MemoryCacheStore(max_entries=2)
+    store.set("a", entry, None)
+    store.set("b", entry, None)
+    assert store.get("a") is entry
+    store.set("c", entry, None)
+    assert len(store) == 2
+    assert store.get("b") is None
+    assert store.get("a") is entry
+
+    store.set("d", entry, 0)
+    assert store.get("d") is None
+    store.delete("a")
+    assert store.get("a") is None
+    store.clear()
+    assert len(store) == 0
+
+
+def test_cache_single_flight(make_request):
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        time.sleep(0.1)
+        return Response(200, body=b"Hello")
+
+    view = Counter(slow)
+    handler = ResponseCache()(view)
+    results = []
+
+    def fetch():
+        results.append(handler(make_request()))
+
+    leader = threading.Thread(target=fetch)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=fetch) for _ in range(5)]
+    for thread in followers:
+        thread.start()
+    for thread in (leader, *followers):
+        thread.join()
+
+    assert view.calls == 1
+    assert len(results) == 6
+    assert all(response.body == b"Hello" for response in results)
+
+
+def test_cache_credentialed_requests(make_request):
+    def echo(request):
+        credentials = request.environ.get(
+            "HTTP_AUTHORIZATION", request.environ.get("HTTP_COOKIE", ""))
+        return Response(200, body=f"hello {credentials}".encode())
+
+    handler = ResponseCache()(echo)
+    response = handler(make_request(
+        "/account", authorization="Bearer alice-secret"))
+    assert response.body == b"hello Bearer alice-secret"
+    assert handler(make_request("/account")).body == b"hello "
+
+    response = handler(make_request("/profile", cookie="sid=alice"))
+    assert response.body == b"hello sid=alice"
+    assert handler(make_request("/profile")).body == b"hello "
+
+    handler = ResponseCache(vary=("Cookie",))(echo)
+    handler(make_request("/profile", cookie="sid=alice"))
+    assert handler(make_request("/profile", cookie="sid=bob")).body == (
+        b"hello sid=bob")
+    assert handler(make_request("/profile", cookie="sid=alice")).body == (
+        b"hello sid=alice")
@@ -0,0 +1,145 @@
+import gzip
+import zlib
+import pytest
+import asyncio
+from wolf.abc.response import FLUSH
+from wolf.app.middlewares import Compression
+from wolf.app.middlewares.compression import compress_stream
+from wolf.app.response import Response, FileWrapperResponse
+
+
+PAGE = b"<p>Hello, world!</p>" * 100
+
+
+@pytest.fixture
+def respond(make_request):
+    def responder(middleware, response, **headers):
+        return middleware(lambda request: response)(make_request(**headers))
+    return responder
+
+
+def test_compression_bytes(respond):
+    middleware = Compression()
+    response = respond(
+        middleware, Response(200, body=PAGE, headers={"ETag": '"abc"'}),
+        accept_encoding="gzip, deflate")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == '"abc-gzip"'
+    assert response.headers["Content-Length"] == str(len(response.body))
+    assert gzip.decompress(response.body) == PAGE
+
+    for etag, expected in (
+            ('W/"abc"', 'W/"abc-gzip"'), ("abc", '"abc-gzip"')):
+        response = respond(
+            middleware, Response(200, body=PAGE, headers={"ETag": etag}),
+            accept_encoding="gzip")
+        assert response.headers["ETag"] == expected
+
+    response = respond(
+        middleware, Response(200, body=PAGE.decode()),
+        accept_encoding="deflate")
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert zlib.decompress(response.body) == PAGE
+
+
+def test_compression_skipped(respond):
+    middleware = Compression(minimum_size=100)
+
+    response = respond(middleware, Response(200, body=PAGE))
+    assert response.body == PAGE
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+    response = respond(
+        middleware, Response(200, body=b"small"), accept_encoding="gzip")
+    assert response.body == b"small"
+    assert "Content-Encoding" not in response.headers
+
+    response = respond(
+        middleware, Response(
+            200, body=PAGE, headers={"Content-Type": "image/png"}),
+        accept_encoding="gzip")
+    assert response.body == PAGE
+    assert "Vary" not in response.headers
+
+    response = respond(middleware, Response(304), accept_encoding="gzip")
+    assert response.body is None
+    assert "Vary" not in response.headers
+
+    response = respond(
+        middleware, Response(
+            200, body=PAGE, headers={"Content-Encoding": "br"}),
+        accept_encoding="gzip")
+    assert response.body == PAGE
+
+    file_response = FileWrapperResponse(None)
+    assert respond(
+        middleware, file_response, accept_encoding="gzip") is file_response
+
+
+def test_compression_iterator(respond):
+    middleware = Compression()
+    chunks = iter([PAGE[:500], PAGE[500:1000], PAGE[1000:]])
+    response = respond(
+        middleware,
+        Response(200, body=chunks, headers={"Content-Length": "2000"}),
+        accept_encoding="gzip")
+    assert "Content-Length" not in response.headers
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(b"".join(response)) == PAGE
+
+
+def test_compression_async_iterator(respond):
+
+    async def chunks():
+        yield PAGE[:1000]
+        yield PAGE[1000:]
+
+    async def collect(body):
+        return b"".join([chunk async for chunk in body])
+
+    response = respond(
+        Compression(), Response(200, body=chunks()), accept_encoding="gzip")
+    assert gzip.decompress(asyncio.run(collect(response.body))) == PAGE
+
+
+def test_compression_flush():
+    for marker in (FLUSH, b""):
+        sent = []
+
+        def chunks():
+            for chunk in (PAGE[:1000], marker, PAGE[1000:]):
+                sent.append(chunk)
+                yield chunk
+
+        decompressor = zlib.decompressobj(31)
+        received = b""
+        for chunk in compress_stream(chunks(), "gzip", 6):
+            if len(sent) == 3:
+                break
+            received += decompressor.decompress(chunk)
+        assert received == PAGE[:1000]
+
+
+def test_compression_async_flush(respond):
+
+    async def chunks():
+        yield PAGE[:1000]
+        yield FLUSH
+        yield PAGE[1000:]
+
+    async def collect(body):
+        return [chunk async for chunk in body]
+
+    response = respond(
+        Compression(), Response(200, body=chunks()), accept_encoding="gzip")
+    received = asyncio.run(collect(response.body))
+    index = received.index(FLUSH)
+    assert zlib.decompressobj(31).decompress(
+        b"".join(received[:index])) == PAGE[:1000]
+    assert gzip.decompress(b"".join(received)) == PAGE
+
+
+def test_compression_unknown_coding():
+    with pytest.raises(ValueError):
+        Compression(encodings=("br",))
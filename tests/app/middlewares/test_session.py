@@ -0,0 +1,159 @@
+import pytest
+import svcs
+from http_session import Session
+from wolf.app.middlewares import HTTPSession
+from wolf.app.middlewares.session import CachedStore
+from wolf.app.middlewares.cache import MemoryCacheStore
+from wolf.app.request import RequestContext
+from wolf.app.response import Response
+from wolf.app.services.flash import SessionMessages
+
+
+@pytest.fixture
+def make_request(make_request):
+    """Requests with a request context, for the session service.
+    """
+    def factory(cookie=None):
+        request = make_request(cookie=cookie)
+        request.context = RequestContext(request, svcs.Registry())
+        return request
+    return factory
+
+
+def visit(request):
+    session = request.get(Session)
+    session["visits"] = session.get("visits", 0) + 1
+    return Response(200, body=b"Visited")
+
+
+def flash(request):
+    messages = SessionMessages(request.get(Session), "messages")
+    messages.add("one")
+    messages.add("two")
+    assert len(list(messages)) == 2
+    return Response(200)
+
+
+def session_cookie(middleware, sid):
+    return f"sid={middleware.manager.sign_id(sid)}"
+
+
+def test_cached_store(http_session_store):
+    store = http_session_store()
+    wrapped = store.set
+    cached = CachedStore(store, MemoryCacheStore(2), ttl=60)
+
+    store.data["a"] = {"visits": 1}
+    data = cached.get("a")
+    data["visits"] = 2
+    del store.data["a"]
+    assert cached.get("a") == {"visits": 1}
+    assert cached.get("unknown") is None
+
+    writes = []
+    store.set = lambda sid, session: writes.append(sid) or wrapped(
+        sid, session)
+    cached.set("a", {"visits": 1})
+    assert writes == []
+    store.touch.assert_called_once_with("a")
+
+    cached.set("a", {"visits": 2})
+    assert writes == ["a"]
+    assert cached.get("a") == {"visits": 2}
+
+    cached.delete("a")
+    assert cached.get("a") is None
+
+
+def test_single_write(http_session_store, make_request):
+    store = http_session_store()
+    writes = []
+    store.set = lambda sid, session: writes.append(dict(session))
+    middleware = HTTPSession(store=store, secret="secret", secure=False)
+    response = middleware(flash)(make_request())
+    assert writes == [{"messages": []}]
+    assert "Set-Cookie" in response.headers
+
+
+def test_read_through_cache(http_session_store, make_request):
+    store = http_session_store()
+    middleware = HTTPSession(
+        store=store, secret="secret", secure=False, cache_size=10)
+    store.data["abc"] = {"visits": 0}
+    cookie = session_cookie(middleware, "abc")
+    handler = middleware(visit)
+
+    reads = []
+    get = store.get
+    store.get = lambda sid: reads.append(sid) or get(sid)
+    for _ in range(3):
+        handler(make_request(cookie))
+    assert reads == ["abc"]
+    assert store.data["abc"] == {"visits": 3}
+
+
+def test_fresh_cookie(http_session_store, make_request):
+    store = http_session_store()
+    store.data["abc"] = {}
+    middleware = HTTPSession(
+        store=store, secret="secret", secure=False, refresh_after=60)
+    cookie = session_cookie(middleware, "abc")
+
+    response = middleware(visit)(make_request(cookie))
+    assert store.data["abc"] == {"visits": 1}
+    assert "Set-Cookie" not in response.headers
+
+    response = middleware(visit)(make_request())
+    assert "Set-Cookie" in response.headers
+
+    middleware.refresh_after = 0
+    response = middleware(visit)(make_request(cookie))
+    assert "Set-Cookie" in response.headers
+
+
+def test_cookie_age(http_session_store):
+    middleware = HTTPSession(
+        store=http_session_store(), secret="secret", secure=False)
+    signed = middleware.manager.sign_id("abc")
+    sid, age = middleware.manager.verify(signed)
+    assert sid == "abc"
+    assert 0 <= age < 5
+
+
+def test_streamed_session(http_session_store, make_request):
+    store = http_session_store()
+    store.data["abc"] = {}
+    middleware = HTTPSession(store=store, secret="secret", secure=False)
+
+    def streamed(request):
+        def render():
+            yield b"Visited"
+            visit(request)
+        return Response(200, body=request.deferred(render()))
+
+    response = middleware(streamed)(make_request(
+        session_cookie(middleware, "abc")))
+    assert "Set-Cookie" in response.headers
+    assert store.data["abc"] == {}
+    assert b"".join(response) == b"Visited"
+    response.close()
+    assert store.data["abc"] == {"visits": 1}
+
+
+def test_file_response_session(
+        http_session_store, tmp_path, make_request):
+    from wolf.app.response import FileWrapperResponse
+
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+    store = http_session_store()
+    middleware = HTTPSession(store=store, secret="secret", secure=False)
+
+    def download(request):
+        visit(request)
+        return FileWrapperResponse(path)
+
+    response = middleware(download)(make_request())
+    assert isinstance(response, FileWrapperResponse)
+    assert "Set-Cookie" in response.headers
+    assert list(store.data.values()) == [{"visits": 1}]
@@ -0,0 +1,163 @@
+import os
+import gzip
+from pathlib import PurePosixPath
+from wolf.app.response import FileWrapperResponse
+from wolf.app.services.assets import AssetCache, is_fingerprinted
+
+
+CSS = b"body { color: red; }\n" * 100
+
+
+def test_is_fingerprinted():
+    assert is_fingerprinted(PurePosixPath("css/app.3f2a9c1d.css"))
+    assert is_fingerprinted(PurePosixPath("app-3f2a9c1d0e.min.js"))
+    assert not is_fingerprinted(PurePosixPath("css/app.css"))
+    assert not is_fingerprinted(PurePosixPath("3f2a9c1d/app.css"))
+
+
+def test_asset_cache_variants(tmp_path, make_request):
+    path = tmp_path / "app.css"
+    path.write_bytes(CSS)
+    cache = AssetCache()
+
+    response = cache.serve(make_request(), path, "text/css")
+    assert response.status == 200
+    assert response.body == CSS
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert "Content-Encoding" not in response.headers
+    assert "Cache-Control" not in response.headers
+    etag = response.headers["ETag"]
+
+    response = cache.serve(
+        make_request(accept_encoding="deflate;q=0.5, gzip"), path, "text/css")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.body) == CSS
+    assert response.headers["Content-Length"] == str(len(response.body))
+    assert response.headers["ETag"] != etag
+
+    response = cache.serve(
+        make_request(accept_encoding="gzip;q=0, deflate"), path, "text/css")
+    assert response.headers["Content-Encoding"] == "deflate"
+
+    response = cache.serve(
+        make_request(accept_encoding="br"), path, "text/css")
+    assert "Content-Encoding" not in response.headers
+
+    response = cache.serve(
+        make_request(), path, "text/css", PurePosixPath("app.3f2a9c1d.css"))
+    assert response.headers["Cache-Control"] == (
+        "public, max-age=31536000, immutable")
+
+
+def test_asset_cache_uncompressible(tmp_path, make_request):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"\x89PNG" * 100)
+    response = AssetCache().serve(
+        make_request(accept_encoding="gzip"), path, "image/png")
+    assert response.body == b"\x89PNG" * 100
+    assert "Vary" not in response.headers
+    assert "Content-Encoding" not in response.headers
+
+
+def test_asset_cache_conditional(tmp_path, make_request):
+    path = tmp_path / "app.css"
+    path.write_bytes(CSS)
+    cache = AssetCache()
+
+    response = cache.serve(
+        make_request(accept_encoding="gzip"), path, "text/css")
+    etag = response.headers["ETag"]
+    response = cache.serve(
+        make_request(accept_encoding="gzip", if_none_match=etag),
+        path, "text/css")
+    assert response.status == 304
+    assert response.body == b""
+
+    response = cache.serve(make_request(method="HEAD"), path, "text/css")
+    assert response.status == 200
+    assert response.body == b""
+    assert response.headers["Content-Length"] == str(len(CSS))
+
+    # Ranges are left to the file response.
+    assert cache.serve(make_request(range="bytes=0-1"), path, "text/css") \
+        is None
+
+
+def test_asset_cache_revalidation(tmp_path):
+    path = tmp_path / "app.js"
+    path.write_bytes(b"var a = 1;")
+    cache = AssetCache()
+    first = cache.get(path, "application/javascript")
+    assert cache.get(path, "application/javascript") is first
+
+    path.write_bytes(b"var a = 2;")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    second = cache.get(path, "application/javascript")
+    assert second is not first
+    assert second.variants[None][0] == b"var a = 2;"
+    assert cache.size == second.weight
+
+
+def test_asset_cache_eviction(tmp_path):
+    cache = AssetCache(max_size=250, max_file_size=200)
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.bin"
+        path.write_bytes(b"x" * 100)
+        paths.append(path)
+
+    cache.get(paths[0], "application/octet-stream")
+    cache.get(paths[1], "application/octet-stream")
+    cache.get(paths[0], "application/octet-stream")  # Most recently used.
+    cache.get(paths[2], "application/octet-stream")
+    assert paths[0] in cache
+    assert paths[1] not in cache
+    assert paths[2] in cache
+    assert cache.size == 200
+
+    big = tmp_path / "big.bin"
+    big.write_bytes(b"x" * 300)
+    assert cache.get(big, "application/octet-stream") is None
+    assert len(cache) == 2
+
+
+def test_negotiate_encoding():
+    from wolf.app.request import negotiate_encoding, parse_accept_encoding
+
+    available = ("gzip", "deflate")
+    assert negotiate_encoding((), available) is None
+    assert negotiate_encoding(
+        parse_accept_encoding("gzip, deflate"), available) == "gzip"
+    assert negotiate_encoding(
+        parse_accept_encoding("deflate, gzip;q=0.8"), available) == "deflate"
+    assert negotiate_encoding(
+        parse_accept_encoding("*"), available) == "gzip"
+    assert negotiate_encoding(
+        parse_accept_encoding("identity, gzip;q=0.5"), available) is None
+    assert negotiate_encoding(
+        parse_accept_encoding("gzip;q=0, *;q=0.1"), available) == "deflate"
+
+
+def test_asset_cache_if_range(tmp_path, make_request):
+    path = tmp_path / "app.css"
+    path.write_bytes(CSS)
+    cache = AssetCache()
+
+    def serve(request):
+        response = cache.serve(request, path, "text/css")
+        if response is None:
+            response = FileWrapperResponse.serve(
+                request, path, headers={"Content-Type": "text/css"})
+        return response
+
+    etag = serve(make_request()).headers["ETag"]
+    response = serve(make_request(range="bytes=0-3", if_range=etag))
+    assert response.status == 206
+    assert response.headers["ETag"] == etag
+    assert response.headers["Content-Range"] == f"bytes 0-3/{len(CSS)}"
+    assert b"".join(response({}, lambda *args: None)) == CSS[:4]
+
+    gzipped = serve(make_request(accept_encoding="gzip")).headers["ETag"]
+    response = serve(make_request(range="bytes=0-3", if_range=gzipped))
+    assert response.status == 200
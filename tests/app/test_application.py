@@ -0,0 +1,81 @@
+import webtest
+from unittest.mock import Mock
+from kettu.exceptions import HTTPError
+from wolf.app import Application
+from wolf.app.response import Response
+
+
+class Resolver:
+
+    def resolve(self, request):
+        if request.path == '/fail':
+            raise HTTPError(403)
+        return Response(200, body=f"resolved {request.path}")
+
+
+def sink(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [f"sink {environ['PATH_INFO']}".encode()]
+
+
+def test_application_sinks():
+    app = Application(resolver=Resolver())
+    app.sinks['/static'] = sink
+    test = webtest.TestApp(app)
+
+    assert test.get('/static/some/file').body == b'sink /some/file'
+    assert test.get('/view').body == b'resolved /view'
+    assert test.get('/fail', status=403).status_int == 403
+
+
+def test_application_freeze():
+    app = Application(resolver=Resolver())
+    assert app.frozen is False
+    app.freeze()
+    assert app.frozen is True
+
+    dispatch = app.dispatch
+    assert dispatch.sinks is None
+    assert dispatch.on_request is None
+    assert dispatch.on_response is None
+    assert app.dispatch is dispatch
+
+    test = webtest.TestApp(app)
+    assert test.get('/static/file').body == b'resolved /static/file'
+
+    app.sinks['/static'] = sink
+    assert app.dispatch is not dispatch
+    assert app.dispatch.sinks is app.sinks
+    assert test.get('/static/file').body == b'sink /file'
+
+    del app.sinks['/static']
+    assert app.dispatch.sinks is None
+    assert test.get('/static/file').body == b'resolved /static/file'
+
+
+def test_application_frozen_signals():
+    app = Application(resolver=Resolver())
+    app.freeze()
+    test = webtest.TestApp(app)
+
+    on_request = Mock()
+    on_response = Mock()
+    app.events.lifecycle.on_request.connect(on_request, weak=False)
+    assert app.dispatch.on_request is app.events.lifecycle.on_request
+    assert app.dispatch.on_response is None
+
+    app.events.lifecycle.on_response.connect(on_response, weak=False)
+    assert app.dispatch.on_response is app.events.lifecycle.on_response
+
+    test.get('/view')
+    on_request.assert_called_once()
+    on_response.assert_called_once()
+
+    app.events.lifecycle.on_request.disconnect(on_request)
+    app.events.lifecycle.on_response.disconnect(on_response)
+    assert app.dispatch.on_request is None
+    assert app.dispatch.on_response is None
+
+    test.get('/view')
+    on_request.assert_called_once()
+    on_response.assert_called_once()
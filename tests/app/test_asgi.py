@@ -0,0 +1,312 @@
+import time
+import asyncio
+from io import BytesIO
+from kettu.exceptions import HTTPError
+from wolf.app import Application
+from wolf.app.request import ASGIRequest
+from wolf.app.response import Response, FileWrapperResponse
+
+
+async def drive(app, method="GET", path="/", body=b"",
+                headers=(), extensions=None):
+    """In-process ASGI driver: returns (status, headers, body, messages).
+    """
+    chunks = [body[i:i + 4] for i in range(0, len(body), 4)] or [b""]
+    incoming = [
+        {"type": "http.request", "body": chunk,
+         "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    sent = []
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.encode(), v.encode()) for k, v in headers],
+        "server": ("localhost", 80),
+        "client": ("127.0.0.1", 1234),
+        "extensions": extensions or {},
+    }
+    await app.asgi(scope, receive, send)
+    start = sent[0]
+    assert start["type"] == "http.response.start"
+    content = b"".join(m.get("body", b"") for m in sent[1:])
+    return start["status"], dict(start["headers"]), content, sent
+
+
+class Resolver:
+
+    async def resolve(self, request):
+        if request.path == '/fail':
+            raise HTTPError(403)
+        if request.path == '/crash':
+            raise RuntimeError('crashed')
+        if request.path == '/json':
+            return Response(200, body=repr(request.data.json))
+        if request.path == '/sleep':
+            await asyncio.sleep(0.1)
+        return Response(200, body=f"async {request.path}")
+
+
+class SyncResolver:
+
+    def resolve(self, request):
+        return Response(200, body=f"sync {request.path}")
+
+
+def sink(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [f"sink {environ['SCRIPT_NAME']} {environ['PATH_INFO']}".encode()]
+
+
+def test_asgi_request():
+    async def run():
+        sent = [{"type": "http.request", "body": b'{"a": 1}'}]
+
+        async def receive():
+            return sent.pop(0)
+
+        scope = {
+            "type": "http", "method": "POST", "path": "/app/some/path",
+            "root_path": "/app", "query_string": b"key=1",
+            "headers": [(b"content-type", b"application/json"),
+                        (b"cookie", b"a=1"), (b"cookie", b"b=2"),
+                        (b"host", b"example.com:8080")],
+        }
+        return await ASGIRequest.from_scope(scope, receive)
+
+    request = asyncio.run(run())
+    assert request.method == "POST"
+    assert request.path == "/some/path"
+    assert request.root_path == "/app"
+    assert request.querystring == "key=1"
+    assert request.host == ("example.com", 8080)
+    assert request.environ["HTTP_COOKIE"] == "a=1; b=2"
+    assert request.data.json == {"a": 1}
+
+
+def test_asgi_coroutine_endpoint():
+    app = Application(resolver=Resolver())
+    status, headers, body, _ = asyncio.run(drive(app, path='/view'))
+    assert status == 200
+    assert body == b"async /view"
+
+    status, _, body, _ = asyncio.run(drive(
+        app, method="POST", path='/json', body=b'{"key": "value"}',
+        headers=[("content-type", "application/json")]
+    ))
+    assert body == b"{'key': 'value'}"
+
+
+def test_asgi_sync_endpoint():
+    app = Application(resolver=SyncResolver())
+    status, _, body, _ = asyncio.run(drive(app, path='/view'))
+    assert status == 200
+    assert body == b"sync /view"
+
+
+def test_asgi_errors():
+    app = Application(resolver=Resolver())
+    status, _, body, _ = asyncio.run(drive(app, path='/fail'))
+    assert status == 403
+
+    status, _, body, _ = asyncio.run(drive(app, path='/crash'))
+    assert status == 500
+    assert body == b"crashed"
+
+
+def test_asgi_concurrency():
+    app = Application(resolver=Resolver())
+
+    async def run():
+        return await asyncio.gather(
+            *(drive(app, path='/sleep') for _ in range(1000)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    assert time.perf_counter() - start < 5
+    assert {result[0] for result in results} == {200}
+
+
+def test_asgi_sinks():
+    app = Application(resolver=Resolver())
+    app.sinks['/wsgi'] = sink
+    app.sinks['/sub'] = Application(resolver=Resolver())
+
+    status, headers, body, _ = asyncio.run(drive(app, path='/wsgi/file'))
+    assert status == 200
+    assert headers[b"content-type"] == b"text/plain"
+    assert body == b"sink /wsgi /file"
+
+    status, headers, body, _ = asyncio.run(drive(app, path='/sub/view'))
+    assert body == b"async /view"
+
+
+def test_asgi_async_iterator_body():
+    async def chunks():
+        for i in range(3):
+            yield str(i).encode()
+
+    response = Response(200, body=chunks())
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(response.asgi({}, None, send))
+    assert [m.get("body") for m in sent[1:]] == [b"0", b"1", b"2", b""]
+    assert sent[-1].get("more_body", False) is False
+
+
+def test_asgi_file_response(tmp_path):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    response = FileWrapperResponse(BytesIO(b"0123456789"), block_size=4)
+    asyncio.run(response.asgi({}, None, send))
+    assert [m.get("body") for m in sent[1:]] == [
+        b"0123", b"4567", b"89", b""]
+
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+    sent.clear()
+    response = FileWrapperResponse(path)
+    asyncio.run(response.asgi(
+        {"extensions": {"http.response.pathsend": {}}}, None, send))
+    assert sent[1] == {
+        "type": "http.response.pathsend", "path": str(path.resolve())}
+
+
+def test_asgi_middlewares(http_session_store):
+    from http_session import Session
+    from wolf.app.middlewares import HTTPSession, Compression
+
+    class SessionResolver:
+
+        async def resolve(self, request):
+            await asyncio.sleep(0)
+            session = request.get(Session)
+            session["visits"] = session.get("visits", 0) + 1
+            return Response.html(body="<p>Hello, world!</p>" * 100)
+
+    store = http_session_store()
+    app = Application(
+        resolver=SessionResolver(),
+        middlewares=(
+            HTTPSession(store=store, secret="secret", secure=False),
+            Compression(),
+        )
+    )
+    status, headers, body, _ = asyncio.run(drive(
+        app, headers=[("accept-encoding", "gzip"), ("host", "localhost")]))
+    assert status == 200
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"set-cookie"].startswith(b"sid=")
+    assert list(store.data.values()) == [{"visits": 1}]
+
+
+def test_asgi_blocking_views():
+    class BlockingResolver:
+
+        def resolve(self, request):
+            time.sleep(0.2)
+            return Response(200, body=b"slept")
+
+    app = Application(
+        resolver=BlockingResolver(), middlewares=(lambda handler: handler,))
+
+    async def run():
+        return await asyncio.gather(*(drive(app) for _ in range(4)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    assert time.perf_counter() - start < 0.6
+    assert {result[2] for result in results} == {b"slept"}
+
+
+def test_asgi_streamed_sink():
+    def chunked(environ, start_response):
+        start_response('200 OK', [])
+        yield b"first"
+        yield b""
+        yield b"second"
+
+    app = Application(resolver=Resolver())
+    app.sinks['/wsgi'] = chunked
+    status, _, body, sent = asyncio.run(drive(app, path='/wsgi/'))
+    assert body == b"firstsecond"
+    assert [m.get("body") for m in sent[1:]] == [b"first", b"second", b""]
+
+
+def test_asgi_blocking_body():
+    def chunks():
+        for i in range(2):
+            time.sleep(0.1)
+            yield str(i).encode()
+
+    async def run():
+        async def send(message):
+            sent.append(message)
+
+        sent = []
+        await Response(200, body=chunks()).asgi({}, None, send)
+        return [m.get("body") for m in sent[1:]]
+
+    async def concurrent():
+        return await asyncio.gather(*(run() for _ in range(4)))
+
+    start = time.perf_counter()
+    results = asyncio.run(concurrent())
+    assert time.perf_counter() - start < 0.6
+    assert results == [[b"0", b"1", b""]] * 4
+
+
+def test_asgi_body_limit(monkeypatch):
+    from wolf.app.parsers import parser
+
+    monkeypatch.setattr(parser, "max_body_size", 8)
+    app = Application(resolver=Resolver())
+    received = []
+
+    async def receive():
+        received.append(True)
+        return {"type": "http.request", "body": b"x" * 16}
+
+    async def send(message):
+        sent.append(message)
+
+    sent = []
+    scope = {
+        "type": "http", "method": "POST", "path": "/json",
+        "headers": [(b"content-type", b"application/json"),
+                    (b"content-length", b"16")],
+    }
+    asyncio.run(app.asgi(scope, receive, send))
+    assert sent[0]["status"] == 413
+    assert not received
+
+    status, _, _, _ = asyncio.run(drive(
+        app, method="POST", path="/json", body=b'{"key": "value"}',
+        headers=[("content-type", "application/json")]
+    ))
+    assert status == 413
+
+    status, _, body, _ = asyncio.run(drive(
+        app, method="POST", path="/json", body=b'{"a": 1}',
+        headers=[("content-type", "application/json")]
+    ))
+    assert body == b"{'a': 1}"
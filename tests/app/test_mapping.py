@@ -159,3 +159,38 @@ def test_nested_mapping():
     response = node(environ, start_response)
     assert list(response) == [b'Hello World!\n']
     assert environ == {'PATH_INFO': '/', 'SCRIPT_NAME': '/some/thing'}
+
+
+def test_mapping_deepest_prefix():
+    node = Mapping({
+        "/": basic_app,
+        "/some": other_app,
+        "/some/deep/thing": third_app
+    })
+    environ = {'SCRIPT_NAME': '', 'PATH_INFO': '/some/deep/thing/else/'}
+    assert node.resolve(environ) is third_app
+    assert environ == {'PATH_INFO': '/else', 'SCRIPT_NAME': '/some/deep/thing'}
+
+    environ = {'SCRIPT_NAME': '/root', 'PATH_INFO': '/some//deep/other'}
+    assert node.resolve(environ) is other_app
+    assert environ == {'PATH_INFO': '/deep/other', 'SCRIPT_NAME': '/root/some'}
+
+
+def test_mapping_index_follows_mutations():
+    node = Mapping({"/some": basic_app, "/some/thing": other_app})
+
+    del node['/some/thing']
+    environ = {'SCRIPT_NAME': '', 'PATH_INFO': '/some/thing'}
+    assert node.resolve(environ) is basic_app
+    assert environ == {'PATH_INFO': '/thing', 'SCRIPT_NAME': '/some'}
+
+    node['/some/'] = third_app
+    environ = {'SCRIPT_NAME': '', 'PATH_INFO': '/some/thing'}
+    assert node.resolve(environ) is third_app
+
+    node.clear()
+    environ = {'SCRIPT_NAME': '', 'PATH_INFO': '/some/thing'}
+    with pytest.raises(HTTPError) as exc:
+        node.resolve(environ)
+    assert exc.value.status == 404
+    assert environ == {'SCRIPT_NAME': '', 'PATH_INFO': '/some/thing'}
@@ -74,3 +74,119 @@ def test_parser_with_mimetype():
 
     data = parser.parse(BytesIO(b'body'), contenttype)
     assert isinstance(data, Data)
+
+
+def test_parser_body_size_limits():
+    from wolf.app.parsers import json_parser
+
+    parser = BodyParser(max_body_size=10)
+    parser.register('application/json')(json_parser)
+
+    with pytest.raises(HTTPError) as exc:
+        parser.parse(BytesIO(b'[1, 2]'), 'application/json',
+                     content_length=11)
+    assert exc.value.status == 413
+
+    # Without an announced length, the limit is enforced while reading.
+    with pytest.raises(HTTPError) as exc:
+        parser.parse(BytesIO(b'[1, 2, 3, 4, 5]'), 'application/json')
+    assert exc.value.status == 413
+
+    data = parser.parse(BytesIO(b'[1, 2]'), 'application/json')
+    assert data.json == [1, 2]
+
+    # Reads stop at the announced length.
+    data = parser.parse(BytesIO(b'[1, 2]garbage'), 'application/json',
+                        content_length=6)
+    assert data.json == [1, 2]
+
+    parser.register('application/json', max_body_size=None)(json_parser)
+    data = parser.parse(BytesIO(b'[1, 2, 3, 4, 5]'), 'application/json')
+    assert data.json == [1, 2, 3, 4, 5]
+
+
+def test_limited_body_lines():
+    from wolf.app.parsers import LimitedBody
+
+    body = LimitedBody(BytesIO(b'a\nbb\ncccc\ngarbage'), None, length=10)
+    assert body.readline() == b'a\n'
+    assert body.readline(1) == b'b'
+    assert list(body) == [b'b\n', b'cccc\n']
+    assert body.readline() == b''
+
+    body = LimitedBody(BytesIO(b'a\nbbbbbb\n'), 4)
+    assert body.readline() == b'a\n'
+    with pytest.raises(HTTPError) as exc:
+        list(body)
+    assert exc.value.status == 413
+
+
+def test_multipart_spooling():
+    from wolf.app.parsers import multipart_parser_factory
+
+    body = (
+        b'--foo\r\n'
+        b'Content-Disposition: form-data; name="text"\r\n\r\n'
+        b'value\r\n'
+        b'--foo\r\n'
+        b'Content-Disposition: form-data; name="accented"\r\n\r\n'
+        + 'caf\u00e9'.encode() + b'\r\n'
+        b'--foo\r\n'
+        b'Content-Disposition: form-data; name="small"; filename="a.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\n'
+        b'tiny\r\n'
+        b'--foo\r\n'
+        b'Content-Disposition: form-data; name="big"; filename="b.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\n'
+        + b'x' * 100 + b'\r\n'
+        b'--foo--\r\n'
+    )
+    parser = BodyParser()
+    parser.register('multipart/form-data')(multipart_parser_factory(16))
+    data = parser.parse(BytesIO(body), 'multipart/form-data; boundary=foo')
+
+    form = dict(data.form)
+    assert form['text'] == 'value'
+    assert form['accented'] == 'caf\u00e9'
+    assert form['small'].filename == 'a.txt'
+    assert form['small'].size == 4
+    assert form['small']._rolled is False
+    assert form['small'].read() == b'tiny'
+    assert form['big'].size == 100
+    assert form['big']._rolled is True
+    assert form['big'].read() == b'x' * 100
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 8192])
+def test_iter_json(chunk_size):
+    from wolf.app.parsers import parser
+
+    body = (
+        b' [1, "a,]\\"\\\\", {"key": [1, {"b": "}"}]}, [], null, 2.5] '
+    )
+    items = parser.iter_json(
+        BytesIO(body), 'application/json', chunk_size=chunk_size)
+    assert list(items) == [
+        1, 'a,]"\\', {"key": [1, {"b": "}"}]}, [], None, 2.5
+    ]
+    assert list(parser.iter_json(
+        BytesIO(b'[]'), 'application/json', chunk_size=chunk_size)) == []
+
+
+@pytest.mark.parametrize('body', [
+    b'{"a": 1}', b'[1, 2', b'[1, 2,]', b'[1, 2] 3', b'[1 2]', b''
+])
+def test_iter_json_errors(body):
+    from wolf.app.parsers import parser
+
+    with pytest.raises(HTTPError) as exc:
+        list(parser.iter_json(BytesIO(body), 'application/json'))
+    assert exc.value.status == 400
+
+
+def test_iter_json_content_type():
+    from wolf.app.parsers import parser
+
+    with pytest.raises(HTTPError) as exc:
+        parser.iter_json(BytesIO(b'[]'), 'text/plain')
+    assert exc.value.status == 415
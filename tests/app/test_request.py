@@ -3,7 +3,7 @@ from svcs import Registry
 from webtest.app import TestRequest as EnvironBuilder
 from kettu.datastructures import Data
 from kettu.headers import Cookies, Query, Authorization, DigestAuthParams
-from wolf.app.request import Request, ServiceNotFoundError
+from wolf.app.request import Request, RequestContext, ServiceNotFoundError
 from wolf.app.response import Response
 
 
@@ -97,3 +97,115 @@ def test_blank_context():
         assert request.get(MockService, default=None) is None
 
     assert request.context is None
+
+
+def test_context_lazy_container():
+    environ = EnvironBuilder.blank('/', method='GET').environ
+    request = Request(environ)
+    registry = Registry()
+    registry.register_factory(
+        MockService,
+        lambda svcs_container: (
+            svcs_container.get(Request), svcs_container.get(Query))
+    )
+
+    with request(registry):
+        context = request.context
+        assert isinstance(context, RequestContext)
+        request.get(Query)
+        request.get(Data)
+        request.context.register_local_value(int, 42)
+        assert request.get(int) == 42
+        assert request.get(str, default=None) is None
+        assert context._container is None
+
+        assert request.get(MockService) == (request, request.query)
+        assert context._container is not None
+        assert request.get(int) == 42
+
+    assert context._container is None
+
+
+def test_context_local_values_in_factories():
+    environ = EnvironBuilder.blank('/', method='GET').environ
+    request = Request(environ)
+    registry = Registry()
+    registry.register_factory(
+        MockService, lambda svcs_container: svcs_container.get(int))
+
+    with request(registry):
+        request.context.register_local_value(int, 1)
+        assert request.get(MockService) == 1
+
+    request = Request(environ)
+    with request(registry):
+        request.get(MockService, default=None)
+        request.context.register_local_value(int, 2)
+        assert request.get(int) == 2
+
+    request = Request(environ)
+    with request(registry):
+        request.context.register_local_factory(str, lambda: "local")
+        assert request.get(str) == "local"
+
+
+def test_request_header_table():
+    assert len(Request.header_table) == len(
+        Request(EnvironBuilder.blank('/').environ).header_values)
+    assert Request.header_table[Request.path.index][0] == 'PATH_INFO'
+
+    environ = EnvironBuilder.blank('/', method='POST').environ
+    request = Request(environ)
+    assert request.method == 'POST'
+    assert request.header_values[Request.method.index] == 'POST'
+    assert 'method' not in getattr(request, '__dict__', {})
+
+
+def test_request_shared_header_parsing():
+    environ = EnvironBuilder.blank(
+        '/',
+        headers={'Accept': 'text/html', 'Cookie': 'key=value'}
+    ).environ
+    first = Request(environ)
+    second = Request(dict(environ))
+
+    assert first.accept is second.accept
+    assert first.cookies == second.cookies == {'key': 'value'}
+    assert first.cookies is not second.cookies
+    assert isinstance(first.cookies, Cookies)
+
+    first.cookies.set('other', 'value')
+    assert 'other=value' in first.cookies.as_header()
+    assert 'other' not in second.cookies
+    assert Request(dict(environ)).cookies == {'key': 'value'}
+
+
+def test_deferred_iteration():
+    environ = EnvironBuilder.blank('/', method='GET').environ
+    request = Request(environ)
+    registry = Registry()
+    registry.register_factory(MockService, lambda: MockService())
+
+    def chunks():
+        yield request.get(int)
+        yield request.get(MockService)
+
+    with request(registry):
+        request.context.register_local_value(int, 42)
+        context = request.context
+        deferred = request.deferred(chunks())
+
+    assert request.context is None
+    value, service = deferred
+    assert value == 42
+    assert isinstance(service, MockService)
+    assert request.context is None
+    assert context._container is None
+
+    with pytest.raises(NotImplementedError):
+        request.deferred(iter(()))
+
+    with request(registry):
+        request.context.register_local_value(int, 1)
+        assert list(request.deferred(chunks()))[0] == 1
+        assert request.context is not None
@@ -0,0 +1,107 @@
+import pytest
+from svcs import Registry
+from webtest.app import TestRequest as EnvironBuilder
+from wolf.abc.resolvers import Location
+from wolf.app.request import Request
+from wolf.app.resolvers import TrajectResolver
+from wolf.app.response import Response
+
+
+class Root:
+    pass
+
+
+class Folder:
+    pass
+
+
+class Document:
+    pass
+
+
+def view(request, *, context):
+    return Response(200)
+
+
+def make_resolver():
+    resolver = TrajectResolver()
+
+    def folder(request, parent, *, slug: str) -> Folder:
+        return Folder()
+
+    def document(request, parent, *, id: str) -> Document:
+        return Document()
+
+    resolver.contexts.add(Root, "/folders/{slug}", "GET", folder)
+    resolver.contexts.add(Folder, "/docs/{id}", "GET", document)
+    resolver.views.register(Root, "/", name="index")(view)
+    resolver.views.register(Document, "/edit", name="edit")(view)
+    return resolver
+
+
+def test_traject_path_for():
+    resolver = make_resolver()
+    root = Root()
+    assert resolver.path_for(root, "index") == "/"
+    assert resolver.path_for(
+        root, "edit", Document(), slug="a", id="1"
+    ) == "/folders/a/docs/1/edit"
+
+
+def test_traject_paths_for():
+    resolver = make_resolver()
+    root = Root()
+    assert resolver.paths_for(root, [
+        ("index", None, {}),
+        ("edit", Document(), {"slug": "a", "id": "1"}),
+        ("edit", Document(), {"slug": "b", "id": "2"}),
+    ]) == ["/", "/folders/a/docs/1/edit", "/folders/b/docs/2/edit"]
+
+
+def test_traject_path_for_location():
+    resolver = make_resolver()
+    location, _ = resolver.contexts.resolve(
+        Root(), "/folders/a/docs/1", "GET", None)
+    assert resolver.path_for(location, "edit") == "/folders/a/docs/1/edit"
+
+
+def test_traject_path_for_request_location():
+    resolver = make_resolver()
+    location, _ = resolver.contexts.resolve(
+        Root(), "/folders/a/docs/1", "GET", None)
+    request = Request(EnvironBuilder.blank("/").environ)
+    with request(Registry()):
+        with pytest.raises(LookupError):
+            resolver.path_for(location.object, "edit", request=request)
+        request.context.register_local_value(Location, location)
+        assert resolver.path_for(
+            location.object, "edit", request=request
+        ) == "/folders/a/docs/1/edit"
+        with pytest.raises(LookupError):
+            resolver.path_for(Document(), "edit", request=request)
+
+
+def test_traject_path_for_unlocated():
+    resolver = make_resolver()
+    location, _ = resolver.contexts.resolve(
+        Root(), "/folders/a/docs/1", "GET", None)
+
+    # Contexts built by a factory are only found below the root.
+    with pytest.raises(LookupError):
+        resolver.path_for(location.object, "edit")
+    assert resolver.path_for(Root(), "index") == "/"
+
+
+def test_located_shim():
+    from wolf.abc.resolvers import Located
+
+    root = Root()
+    with pytest.deprecated_call():
+        folder = Located(Folder(), parent=root, path="folders")
+    with pytest.deprecated_call():
+        document = Located(Document(), parent=folder, path="1", id="1")
+
+    assert isinstance(document, Document)
+    assert document.__parent__ is folder
+    assert document.__path__ == "folders/1"
+    assert document.__id__ == "1"
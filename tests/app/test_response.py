@@ -156,3 +156,342 @@ def test_exception_finisher():
     response.close()
     assert calls == [1, 3]
     assert len(response._finishers) == 0
+
+
+def serve(path, method="GET", **headers):
+    from wolf.app.request import Request
+    from wolf.app.response import FileWrapperResponse
+
+    environ = {"REQUEST_METHOD": method, "PATH_INFO": "/"}
+    environ.update({f"HTTP_{k.upper()}": v for k, v in headers.items()})
+    response = FileWrapperResponse.serve(
+        Request(environ), path, headers={"Content-Type": "text/plain"})
+    start_response = Mock()
+    body = b"".join(response(environ, start_response))
+    return response, body
+
+
+@pytest.fixture
+def static_file(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"0123456789")
+    return path
+
+
+def test_file_response_fallback_terminates():
+    from io import BytesIO
+    from wolf.app.response import FileWrapperResponse
+
+    response = FileWrapperResponse(BytesIO(b"0123456789"), block_size=4)
+    assert list(response({}, Mock())) == [b"0123", b"4567", b"89"]
+
+
+def test_file_response_file_wrapper(static_file):
+    from wolf.app.response import FileWrapperResponse
+
+    wrapper = Mock()
+    response = FileWrapperResponse(static_file)
+    response({"wsgi.file_wrapper": wrapper}, Mock())
+    assert wrapper.call_count == 1
+
+    # Ranges are not delegated to the file wrapper.
+    wrapper.reset_mock()
+    response = FileWrapperResponse(static_file, segments=[(2, 4)])
+    assert list(response({"wsgi.file_wrapper": wrapper}, Mock())) == [b"234"]
+    assert not wrapper.called
+
+
+def test_file_response_validators(static_file):
+    response, body = serve(static_file)
+    assert response.status == 200
+    assert body == b"0123456789"
+    assert response.headers["Content-Length"] == "10"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    etag = response.headers["ETag"]
+    modified = response.headers["Last-Modified"]
+
+    response, body = serve(static_file, if_none_match=etag)
+    assert response.status == 304
+    assert body == b""
+    assert response.headers["ETag"] == etag
+
+    response, _ = serve(static_file, if_none_match=f'W/{etag}, "other"')
+    assert response.status == 304
+
+    response, _ = serve(static_file, if_none_match='"other"')
+    assert response.status == 200
+
+    response, _ = serve(static_file, if_modified_since=modified)
+    assert response.status == 304
+
+    response, _ = serve(
+        static_file, if_modified_since="Thu, 01 Jan 1970 00:00:00 GMT")
+    assert response.status == 200
+
+    response, _ = serve(static_file, if_modified_since="garbage")
+    assert response.status == 200
+
+
+def test_file_response_preconditions(static_file):
+    response, _ = serve(static_file, if_match='"other"')
+    assert response.status == 412
+
+    response, _ = serve(static_file, if_match="*")
+    assert response.status == 200
+
+    response, _ = serve(
+        static_file, if_unmodified_since="Thu, 01 Jan 1970 00:00:00 GMT")
+    assert response.status == 412
+
+    response, _ = serve(static_file, method="DELETE", if_none_match="*")
+    assert response.status == 412
+
+
+def test_file_response_head(static_file):
+    response, body = serve(static_file, method="HEAD")
+    assert response.status == 200
+    assert body == b""
+    assert response.headers["Content-Length"] == "10"
+
+
+def test_file_response_single_range(static_file):
+    response, body = serve(static_file, range="bytes=2-4")
+    assert response.status == 206
+    assert body == b"234"
+    assert response.headers["Content-Range"] == "bytes 2-4/10"
+    assert response.headers["Content-Length"] == "3"
+
+    response, body = serve(static_file, range="bytes=-3")
+    assert body == b"789"
+    assert response.headers["Content-Range"] == "bytes 7-9/10"
+
+    response, body = serve(static_file, range="bytes=0-3,2-5")
+    assert response.status == 206
+    assert body == b"012345"
+
+
+def test_file_response_multiple_ranges(static_file):
+    response, body = serve(static_file, range="bytes=0-1,5-")
+    assert response.status == 206
+    content_type = response.headers["Content-Type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("=")[1]
+    assert body == (
+        f"--{boundary}\r\n"
+        "Content-Type: text/plain\r\n"
+        "Content-Range: bytes 0-1/10\r\n\r\n"
+        "01\r\n"
+        f"--{boundary}\r\n"
+        "Content-Type: text/plain\r\n"
+        "Content-Range: bytes 5-9/10\r\n\r\n"
+        "56789\r\n"
+        f"--{boundary}--\r\n"
+    ).encode()
+    assert response.headers["Content-Length"] == str(len(body))
+
+
+def test_file_response_ignored_ranges(static_file):
+    response, body = serve(static_file, range="bytes=20-")
+    assert response.status == 416
+    assert response.headers["Content-Range"] == "bytes */10"
+
+    response, body = serve(static_file, range="bytes=-0")
+    assert response.status == 416
+
+    response, body = serve(static_file, range="bytes=-0,2-3")
+    assert response.status == 206
+    assert body == b"23"
+
+    response, body = serve(static_file, range="lines=1-2")
+    assert response.status == 200
+    assert body == b"0123456789"
+
+    response, body = serve(static_file, range="bytes=garbage")
+    assert response.status == 200
+
+    response, body = serve(static_file, range="bytes=1-2", if_range='"old"')
+    assert response.status == 200
+
+    etag = serve(static_file)[0].headers["ETag"]
+    response, body = serve(static_file, range="bytes=1-2", if_range=etag)
+    assert response.status == 206
+    assert body == b"12"
+
+
+def test_file_response_closed_before_iteration(static_file):
+    from wolf.app.response import FileWrapperResponse
+
+    opened = []
+
+    class Response(FileWrapperResponse):
+
+        def open(self):
+            opened.append(super().open())
+            return opened[-1]
+
+    body = Response(static_file)({}, Mock())
+    body.close()
+    assert opened == []
+
+    body = Response(static_file, block_size=4)({}, Mock())
+    assert next(body) == b"0123"
+    body.close()
+    assert opened[0].closed
+
+
+def test_file_response_memory_mapped(tmp_path):
+    from wolf.app.response import MMAP_THRESHOLD
+
+    path = tmp_path / "large.bin"
+    content = bytes(range(256)) * (MMAP_THRESHOLD // 128)
+    path.write_bytes(content)
+    response, body = serve(path)
+    assert body == content
+
+    response, body = serve(path, range="bytes=1000-70000,-10")
+    boundary = response.headers["Content-Type"].split("=")[1]
+    assert content[1000:70001] in body
+    assert body.endswith(content[-10:] + f"\r\n--{boundary}--\r\n".encode())
+    assert response.headers["Content-Length"] == str(len(body))
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 100])
+def test_stream_json(batch_size):
+    import orjson
+
+    items = ({"id": i} for i in range(5))
+    response = Response.stream_json(items, batch_size=batch_size)
+    assert response.headers["Content-Type"] == "application/json"
+    body = b"".join(response)
+    assert orjson.loads(body) == [{"id": i} for i in range(5)]
+    assert len(list(Response.stream_json(
+        range(5), batch_size=batch_size))) == -(-5 // batch_size) + 1
+
+    assert b"".join(Response.stream_json(iter(()))) == b"[]"
+
+
+def test_stream_ndjson():
+    response = Response.stream_json(
+        ({"id": i} for i in range(3)), ndjson=True, batch_size=2)
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert list(response) == [b'{"id":0}\n{"id":1}\n', b'{"id":2}\n']
+    assert b"".join(Response.stream_json((), ndjson=True)) == b""
+
+
+def test_stream_json_request_services():
+    pytest.importorskip("html_resources")
+    from svcs import Registry
+    from webtest.app import TestRequest as EnvironBuilder
+    from wolf.app.request import Request
+    from wolf.app.render import json
+
+    class Cursor:
+        closed = False
+
+        def rows(self):
+            assert not self.closed
+            yield from ({"id": i} for i in range(3))
+
+    cursors = []
+
+    def cursor_factory():
+        cursor = Cursor()
+        cursors.append(cursor)
+        yield cursor
+        cursor.closed = True
+
+    registry = Registry()
+    registry.register_factory(Cursor, cursor_factory)
+
+    @json
+    def view(request):
+        yield from request.get(Cursor).rows()
+
+    request = Request(EnvironBuilder.blank('/').environ)
+    with request(registry):
+        response = view(request)
+
+    assert b"".join(response) == b'[{"id":0},{"id":1},{"id":2}]'
+    assert [cursor.closed for cursor in cursors] == [True]
+    assert request.context is None
+
+
+def test_coalesce():
+    from wolf.abc.response import coalesce, FLUSH
+
+    chunks = [b"a" * 3, b"b" * 3, b"c" * 2, b"d" * 20, b"e", FLUSH, b"f"]
+    assert list(coalesce(iter(chunks), 8)) == [
+        b"aaabbbcc", b"d" * 20, b"e", b"f"]
+    assert list(coalesce(iter([b"ab", b"cd"]), 3)) == [b"ab", b"cd"]
+    assert list(coalesce(iter([]), 8)) == []
+    assert list(coalesce(iter([FLUSH, FLUSH]), 8)) == []
+
+
+def test_buffered_response():
+    from wolf.abc.response import FLUSH
+
+    chunks = (b"x" * 10 for _ in range(100))
+    response = Response(200, body=chunks).buffered(256)
+    written = list(response)
+    assert [len(chunk) for chunk in written] == [250, 250, 250, 250]
+
+    # Unbuffered, the flush hints are empty chunks.
+    response = Response(200, body=iter([b"a", FLUSH, b"b"]))
+    assert b"".join(response) == b"ab"
+
+
+def test_compute_length():
+    response = Response(200, body=iter([b"abc", b"def"]))
+    assert response.compute_length() == 6
+    assert response.body == b"abcdef"
+    assert response.headers["Content-Length"] == "6"
+
+    response = Response(200, body="héllo")
+    assert response.compute_length() == 6
+
+    response = Response(200, body=iter([b"abc", b"def", b"ghi"]))
+    assert response.compute_length(max_size=4) is None
+    assert "Content-Length" not in response.headers
+    assert b"".join(response) == b"abcdefghi"
+
+
+def test_status_line_table():
+    from wolf.abc.response import STATUS_LINES
+
+    assert STATUS_LINES[HTTPStatus.NOT_FOUND] == "404 Not Found"
+    assert STATUS_LINES[200] == "200 OK"
+    assert Response(201).status_line == "201 Created"
+
+
+def test_lazy_headers():
+    response = Response(200, body=b"ok")
+    assert response._headers is None
+    assert response.header_list() == []
+    start_response = Mock()
+    assert list(response({}, start_response)) == [b"ok"]
+    start_response.assert_called_with("200 OK", [])
+    assert response._headers is None
+
+    response.headers["X-Test"] = "1"
+    assert response.header_list() == [("X-Test", "1")]
+
+
+def test_response_template():
+    template = Response.template(
+        404, body=b"Not here", headers={"Content-Type": "text/plain"})
+    first, second = template(), template()
+    assert first is not second
+    assert first.status == HTTPStatus.NOT_FOUND
+    assert first.body == b"Not here"
+    assert first.headers["Content-Type"] == "text/plain"
+
+    first.headers["Content-Type"] = "text/html"
+    first.cookies.set("name", "value")
+    assert second.headers["Content-Type"] == "text/plain"
+    assert "Set-Cookie" not in second.headers
+    assert template().header_list() == [("Content-Type", "text/plain")]
+
+    assert Response.template(204)()._headers is None
+
+    with pytest.raises(TypeError):
+        Response.template(200, body=iter([b"chunk"]))
@@ -3,6 +3,8 @@ import pytest
 from copy import deepcopy
 from unittest.mock import Mock, patch
 from http_session.meta import Store
+from webtest.app import TestRequest as EnvironBuilder
+from wolf.app.request import Request
 
 
 class SessionMemoryStore(Store):
@@ -49,3 +51,17 @@ def http_session_store():
 
     with patch('uuid.uuid4', mock_uuid(uuid_generator())):
         yield SessionMemoryStore
+
+
+@pytest.fixture
+def make_request():
+    """Build requests from a blank environ. Keyword arguments are
+    headers: `accept_encoding="gzip"` sends `Accept-Encoding: gzip`.
+    """
+    def factory(path="/", method="GET", **headers):
+        environ = EnvironBuilder.blank(path, method=method, headers={
+            name.replace("_", "-").title(): value
+            for name, value in headers.items() if value is not None
+        }).environ
+        return Request(environ)
+    return factory
@@ -0,0 +1,214 @@
+import pytest
+import svcs
+from typing import Any
+from wolf.app.request import Request, RequestContext
+from wolf.app.services.translation import Locale
+from wolf.rendering.cache import (
+    CachePolicy, FragmentCache, CachedComponent, PerRequest, PerContext,
+    Timed, cached, cache_policy
+)
+
+
+def make_request(locale=None):
+    request = Request({"REQUEST_METHOD": "GET", "PATH_INFO": "/"})
+    request.context = RequestContext(request, svcs.Registry())
+    if locale is not None:
+        request.context.register_local_value(Locale, locale)
+    return request
+
+
+class Document:
+    pass
+
+
+class Folder:
+    pass
+
+
+def counting():
+    calls = []
+
+    def render():
+        calls.append(1)
+        return f"rendered {len(calls)}"
+    return calls, render
+
+
+def test_policy_declaration():
+    @cached(PerRequest())
+    def navigation(request, **kwargs):
+        return "nav"
+
+    assert isinstance(cache_policy(navigation), PerRequest)
+    assert cache_policy(lambda: None) is None
+
+
+def test_abstract_policy():
+    with pytest.raises(TypeError):
+        CachePolicy()
+
+
+def test_per_request():
+    cache = FragmentCache()
+    policy = PerRequest()
+    calls, render = counting()
+
+    request = make_request()
+    key = cache.key("nav", "", policy, request, None, Document())
+    assert cache.fetch(policy, request, key, render) == "rendered 1"
+    assert cache.fetch(policy, request, key, render) == "rendered 1"
+    assert len(cache) == 0
+
+    other = make_request()
+    assert cache.fetch(policy, other, key, render) == "rendered 2"
+
+
+def test_per_context():
+    cache = FragmentCache()
+    policy = PerContext()
+    calls, render = counting()
+
+    def fetch(request, context):
+        key = cache.key("nav", "", policy, request, None, context)
+        return cache.fetch(policy, request, key, render)
+
+    assert fetch(make_request("fr"), Document()) == "rendered 1"
+    assert fetch(make_request("fr"), Document()) == "rendered 1"
+    assert fetch(make_request("en"), Document()) == "rendered 2"
+    assert fetch(make_request("fr"), Folder()) == "rendered 3"
+    assert len(cache) == 3
+
+
+def test_timed():
+    cache = FragmentCache()
+    calls, render = counting()
+
+    policy = Timed(0, key=lambda request, view, context: context.__class__)
+    request = make_request()
+    key = cache.key("nav", "", policy, request, None, Document())
+    assert key == ("nav", "", Document)
+    cache.fetch(policy, request, key, render)
+    cache.fetch(policy, request, key, render)
+    assert len(calls) == 2
+
+    policy = Timed(60)
+    key = cache.key("nav", "", policy, request, None, Document())
+    cache.fetch(policy, request, key, render)
+    cache.fetch(policy, request, key, render)
+    assert len(calls) == 3
+
+
+def test_fragment_cache_bounded():
+    cache = FragmentCache(max_entries=2)
+    cache.set("a", "A", None)
+    cache.set("b", "B", None)
+    assert cache.get("a") == "A"
+    cache.set("c", "C", None)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_cached_component():
+    cache = FragmentCache()
+    calls = []
+
+    def subslot(request, **kwargs):
+        calls.append(kwargs)
+        return "item"
+
+    subslot.title = "Item"
+    request = make_request()
+    component = CachedComponent(
+        subslot, cache, PerContext(), request, ("item", ""))
+    assert component(request, view=None) == "item"
+    assert component(request, view=None) == "item"
+    assert len(calls) == 1
+    assert component.title == "Item"
+
+
+@pytest.fixture
+def ui_request():
+    pytest.importorskip("html_resources")
+    from wolf.rendering.ui import UI
+
+    ui = UI()
+    registry = svcs.Registry()
+    registry.register_value(UI, ui)
+
+    def make():
+        request = Request({"REQUEST_METHOD": "GET", "PATH_INFO": "/"})
+        request.context = RequestContext(request, registry)
+        return request
+    return ui, make
+
+
+def test_cached_slot(ui_request):
+    from wolf.rendering.ui import query_slot
+
+    ui, make = ui_request
+    calls = []
+
+    @ui.slots.register((Request, Any, Document), name="nav")
+    @cached(PerContext())
+    class Navigation:
+        def __call__(self, request, *, view, context, items):
+            calls.append("nav")
+            return "|".join(
+                item(request, view=view, context=context) for item in items)
+
+    @ui.subslots.register((Request, Navigation, Any, Document), name="item")
+    def item(request, *, view, context):
+        calls.append("item")
+        return "item"
+
+    assert query_slot(
+        {"request": make(), "context": Document()}, "nav") == "item"
+    assert query_slot(
+        {"request": make(), "context": Document()}, "nav") == "item"
+    assert calls == ["nav", "item"]
+    assert len(ui.fragments) == 1
+    assert query_slot({"request": make(), "context": Folder()}, "nav") is None
+    assert query_slot(
+        {"request": make(), "context": Document()}, "footer") is None
+
+
+def test_cached_subslot(ui_request):
+    from wolf.rendering.ui import query_slot
+
+    ui, make = ui_request
+    calls = []
+
+    @ui.slots.register((Request, Any, Any), name="nav")
+    class Navigation:
+        def __call__(self, request, *, view, context, items):
+            calls.append("nav")
+            return "|".join(
+                item(request, view=view, context=context) for item in items)
+
+    @ui.subslots.register((Request, Navigation, Any, Any), name="static")
+    @cached(PerRequest())
+    def static(request, *, view, context):
+        calls.append("static")
+        return "static"
+
+    @ui.subslots.register((Request, Navigation, Any, Any), name="dynamic")
+    def dynamic(request, *, view, context):
+        calls.append("dynamic")
+        return "dynamic"
+
+    request = make()
+    assert query_slot(
+        {"request": request, "context": Document()}, "nav"
+    ) == "static|dynamic"
+    assert query_slot(
+        {"request": request, "context": Document()}, "nav"
+    ) == "static|dynamic"
+    assert calls.count("nav") == 2
+    assert calls.count("dynamic") == 2
+    assert calls.count("static") == 1
+
+    query_slot({"request": make(), "context": Document()}, "nav")
+    assert calls.count("static") == 2
+    assert len(ui.fragments) == 0
@@ -0,0 +1,124 @@
+import pytest
+from pathlib import PurePosixPath
+from wolf.rendering.injection import (
+    ResourceFragments, inject, inject_stream, render_fragments
+)
+
+
+PAGE = b"<html><head><title>T</title></head><body><p>Hi</p></body></html>"
+TOP = b'<link href="/style.css">'
+BOTTOM = b'<script src="/app.js"></script>'
+
+
+def render(head):
+    return TOP if head else BOTTOM
+
+
+def split(document, *cuts):
+    cuts = (0, *cuts, len(document))
+    return [document[start:end] for start, end in zip(cuts, cuts[1:])]
+
+
+class Resource:
+
+    def __init__(self, name, bottom=False):
+        self.name = name
+        self.bottom = bottom
+        self.renders = 0
+
+    def render(self, url):
+        self.renders += 1
+        return f'<script src="{url}/{self.name}"></script>'.encode()
+
+
+def replaced(body, top, bottom):
+    # Former injection, one copy of the document per replacement.
+    if top:
+        body = body.replace(b"</head>", top + b"</head>", 1)
+    if bottom:
+        body = body.replace(b"</body>", bottom + b"</body>", 1)
+    return body
+
+
+def test_inject():
+    assert inject(PAGE, TOP, BOTTOM) == PAGE.replace(
+        b"</head>", TOP + b"</head>").replace(b"</body>", BOTTOM + b"</body>")
+    assert inject(PAGE, b"", b"") == PAGE
+    assert inject(b"<p>Hi</p>", TOP, BOTTOM) == b"<p>Hi</p>"
+
+
+@pytest.mark.parametrize("cut", range(1, len(PAGE)))
+def test_stream_equals_inject(cut):
+    expected = inject(PAGE, TOP, BOTTOM)
+    assert b"".join(inject_stream(split(PAGE, cut), render)) == expected
+    assert b"".join(
+        inject_stream(split(PAGE, cut, min(cut + 3, len(PAGE))), render)
+    ) == expected
+
+
+def test_stream_markers_across_chunks():
+    head = PAGE.index(b"</head>")
+    body = PAGE.index(b"</body>")
+    chunks = split(PAGE, head + 2, head + 4, body + 1, body + 6)
+    assert b"".join(inject_stream(chunks, render)) == inject(
+        PAGE, TOP, BOTTOM)
+
+    bytewise = [PAGE[index:index + 1] for index in range(len(PAGE))]
+    assert b"".join(inject_stream(bytewise, render)) == inject(
+        PAGE, TOP, BOTTOM)
+
+
+def test_stream_text_chunks():
+    chunks = [chunk.decode() for chunk in split(PAGE, 20, 40)]
+    assert b"".join(inject_stream(chunks, render)) == inject(
+        PAGE, TOP, BOTTOM)
+
+
+def test_stream_without_markers():
+    assert b"".join(inject_stream([b"<p>", b"Hi</p>"], render)) == (
+        b"<p>Hi</p>")
+    assert list(inject_stream([], render)) == []
+
+
+@pytest.mark.parametrize("page", [
+    PAGE,
+    b"<html><head></head><body></body></html>",
+    b"<head></head></head><body></body></body>",
+    b"<p>No markers</p>",
+    b"<body>No head</body>",
+])
+def test_inject_equals_replace(page):
+    resources = [Resource("top.js"), Resource("bottom.js", bottom=True)]
+    top, bottom = render_fragments(resources, PurePosixPath("/static"))
+    assert inject(page, top, bottom) == replaced(page, top, bottom)
+    assert inject(page, top, b"") == replaced(page, top, b"")
+    assert inject(page, b"", bottom) == replaced(page, b"", bottom)
+
+
+def test_resource_fragments():
+    fragments = ResourceFragments(max_entries=2)
+    resources = [Resource("a.js"), Resource("b.js", bottom=True)]
+    unfolded = []
+
+    def unfold():
+        unfolded.append(True)
+        return resources
+
+    key = (tuple(resources), "", PurePosixPath("static"))
+    url = "" / PurePosixPath("static")
+    top, bottom = fragments.fetch(key, unfold, url)
+    assert top == b'<script src="static/a.js"></script>'
+    assert bottom == b'<script src="static/b.js"></script>'
+
+    assert fragments.fetch(key, unfold, url) == (top, bottom)
+    assert len(unfolded) == 1
+    assert [resource.renders for resource in resources] == [1, 1]
+
+    # Each base URI has its own fragments.
+    other = (tuple(resources), "/app", PurePosixPath("static"))
+    mounted = fragments.fetch(
+        other, unfold, "/app" / PurePosixPath("static"))
+    assert mounted[0] == b'<script src="/app/static/a.js"></script>'
+    assert len(unfolded) == 2
+    assert fragments.fetch(key, unfold, url) == (top, bottom)
+    assert len(unfolded) == 2
@@ -0,0 +1,71 @@
+import pytest
+from typing import Any, NamedTuple
+from signature_registries import TypedRegistry
+from wolf.rendering.cache import LookupCache
+
+
+class Registry(LookupCache, TypedRegistry):
+    class Types(NamedTuple):
+        view: type = Any
+        context: type = Any
+
+
+class Document:
+    pass
+
+
+class Folder:
+    pass
+
+
+def test_fetch_memoized():
+    registry = Registry()
+    registry.register((Any, Document), name="nav")(lambda: "document")
+    registry.register((Any, Any), name="nav")(lambda: "default")
+
+    assert registry.fetch(None, Document(), name="nav")() == "document"
+    assert (registry.hits, registry.misses) == (0, 1)
+    assert registry.fetch(None, Document(), name="nav")() == "document"
+    assert registry.fetch(None, Folder(), name="nav")() == "default"
+    assert (registry.hits, registry.misses) == (1, 2)
+
+    with pytest.raises(LookupError):
+        registry.fetch(None, Document(), name="footer")
+    with pytest.raises(LookupError):
+        registry.fetch(None, Document(), name="footer")
+    assert (registry.hits, registry.misses) == (2, 3)
+
+    # Registering empties the memo.
+    registry.register((Any, Folder), name="nav")(lambda: "folder")
+    assert registry.fetch(None, Folder(), name="nav")() == "folder"
+    registry.register((Any, Document), name="footer")(lambda: "footer")
+    assert registry.fetch(None, Document(), name="footer")() == "footer"
+
+
+def test_match_grouped_memoized():
+    registry = Registry()
+    registry.register((Any, Document), name="a")(lambda: "a")
+    registry.register((Any, Any), name="b")(lambda: "b")
+
+    grouped = registry.match_grouped(None, Document())
+    assert set(grouped) == {"a", "b"}
+    assert registry.match_grouped(None, Document()) is grouped
+    assert set(registry.match_grouped(None, Folder())) == {"b"}
+    assert (registry.hits, registry.misses) == (1, 2)
+
+
+def test_merge():
+    first = Registry()
+    first.register((Any, Document), name="nav")(lambda: "first")
+    second = Registry()
+    second.register((Any, Folder), name="nav")(lambda: "second")
+
+    with pytest.raises(LookupError):
+        first.fetch(None, Folder(), name="nav")
+
+    merged = first | second
+    assert isinstance(merged, Registry)
+    assert merged.fetch(None, Folder(), name="nav")() == "second"
+
+    first |= second
+    assert first.fetch(None, Folder(), name="nav")() == "second"
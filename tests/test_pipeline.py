@@ -1,4 +1,4 @@
-from wolf.pipeline import chain_wrap
+from wolf.pipeline import chain_wrap, shareable
 
 
 def handler(value: str):
@@ -19,7 +19,92 @@ def suffix(wrapped):
     return suffix_middleware
 
 
+@shareable
+def shared_capitalize(wrapped):
+    def capitalize_middleware(value: str):
+        result: str = wrapped(value)
+        return result.upper()
+    return capitalize_middleware
+
+
+@shareable
+def shared_suffix(wrapped):
+    def suffix_middleware(value: str):
+        result = wrapped(value)
+        return f"{result} my suffix"
+    return suffix_middleware
+
+
 def test_chained_pipeline():
     pipeline = chain_wrap((capitalize, suffix), handler)
     result = pipeline("42")
     assert result == 'I GOT 42 MY SUFFIX'
+
+
+def test_compiled_pipeline():
+    from wolf.pipeline import compile_pipeline, CompiledPipeline
+
+    chain = (shared_capitalize, shared_suffix)
+    cache = {}
+    compiled = compile_pipeline(chain, cache)
+    assert isinstance(compiled, CompiledPipeline)
+    assert compile_pipeline(list(chain), cache) is compiled
+    assert compile_pipeline(chain[::-1], cache) is not compiled
+    assert compile_pipeline(chain) is not compiled
+    assert compiled.shared == chain
+    assert list(compiled) == [shared_capitalize, shared_suffix]
+    assert len(compiled) == 2
+
+    pipeline = compiled.bind(handler)
+    assert pipeline("42") == 'I GOT 42 MY SUFFIX'
+    assert pipeline.__pipeline__ is compiled
+    assert pipeline.__wrapped__ is handler
+    assert pipeline.__name__ == 'handler'
+
+    def other(value: str):
+        return f"Other {value}"
+
+    assert compiled.bind(other)("42") == 'OTHER 42 MY SUFFIX'
+
+    # Undeclared middlewares are wrapped around each endpoint.
+    compiled = compile_pipeline((capitalize, suffix))
+    assert compiled.shared == ()
+    assert compiled.inner == (capitalize, suffix)
+    assert compiled.bind(handler)("42") == 'I GOT 42 MY SUFFIX'
+
+
+def test_compiled_pipeline_nesting():
+    from wolf.pipeline import compile_pipeline
+
+    inner = compile_pipeline((suffix,)).bind(handler)
+    outer = compile_pipeline((capitalize,)).bind(inner)
+    assert outer("42") == 'I GOT 42 MY SUFFIX'
+    assert inner("42") == 'I got 42 my suffix'
+
+
+def test_compiled_pipeline_introspection():
+    from wolf.pipeline import compile_pipeline
+
+    names = []
+
+    def named(wrapped):
+        # Introspects the handler at wrapping time.
+        names.append(wrapped.__name__)
+        return wrapped
+
+    compiled = compile_pipeline((shared_capitalize, named, suffix))
+    assert compiled.shared == (shared_capitalize,)
+    assert compiled.inner == (named, suffix)
+
+    pipeline = compiled.bind(handler)
+    assert pipeline("42") == 'I GOT 42 MY SUFFIX'
+    assert pipeline.__name__ == 'handler'
+    assert pipeline.__pipeline__ is compiled
+
+    def other(value: str):
+        return f"Other {value}"
+
+    compiled.bind(other)
+    assert names == ['handler', 'other']
+    assert compile_pipeline((named,)).bind(other)("42") == 'Other 42'
+    assert names[-1] == 'other'
@@ -0,0 +1,62 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from wolf.rendering.templates import Templates
+
+
+@pytest.fixture
+def folder(tmp_path):
+    path = tmp_path / "templates"
+    (path / "sub").mkdir(parents=True)
+    (path / "index.pt").write_text('<p tal:content="name">name</p>')
+    (path / "sub" / "item.pt").write_text('<li tal:content="name" />')
+    return path
+
+
+def test_warmup(folder):
+    templates = Templates(folder)
+    assert sorted(templates.warmup()) == ["index", "sub/item"]
+    assert set(templates.cache) == {"index", "sub/item"}
+    assert all(tpl._cooked for tpl in templates.cache.values())
+    assert templates["index"](name="wolf") == "<p>wolf</p>"
+
+
+def test_warmup_threads(folder):
+    templates = Templates(folder)
+    with ThreadPoolExecutor(2) as executor:
+        assert templates.warmup(["sub/item"], executor) == ["sub/item"]
+    assert list(templates.cache) == ["sub/item"]
+    assert templates.cache["sub/item"]._cooked
+
+
+def test_disk_cache(folder, tmp_path):
+    cache_dir = tmp_path / "cache"
+    templates = Templates(folder, cache_dir=cache_dir)
+    templates.warmup()
+    modules = {path.name for path in cache_dir.glob("*.py")}
+    assert len(modules) == 2
+
+    # Another worker finds the compiled modules.
+    other = Templates(folder, cache_dir=cache_dir)
+    other.warmup()
+    assert {path.name for path in cache_dir.glob("*.py")} == modules
+    assert other["index"](name="wolf") == "<p>wolf</p>"
+
+    # Modules are keyed by content.
+    (folder / "index.pt").write_text('<p tal:content="name">changed</p>')
+    Templates(folder, cache_dir=cache_dir).warmup()
+    assert len(list(cache_dir.glob("*.py"))) == 3
+
+    merged = Templates() | other
+    assert merged.loader is other.loader
+
+
+def test_warmup_processes(folder, tmp_path):
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(ValueError):
+            Templates(folder).warmup(executor=executor)
+
+        cache_dir = tmp_path / "cache"
+        templates = Templates(folder, cache_dir=cache_dir)
+        templates.warmup(executor=executor)
+    assert len(list(cache_dir.glob("*.py"))) == 2
+    assert templates["sub/item"](name="wolf") == "<li>wolf</li>"